@@ -14,6 +14,7 @@ class FunctionAndMethodVisitor(ast.NodeVisitor):
 
     def __init__(self):
         # type: () -> None
+        super(FunctionAndMethodVisitor, self).__init__()
         self.callables = set()  # type: Set[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
         self._methods = set()  # type: Set[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
         self._properties = set()  # type: Set[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
@@ -33,6 +34,10 @@ class FunctionAndMethodVisitor(ast.NodeVisitor):
         # type: () -> List[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
         return list(self._properties)
 
+    def is_property(self, node):
+        # type: (Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool
+        return node in self._properties
+
     def visit_ClassDef(self, node):
         # type: (ast.ClassDef) -> ast.AST
         for item in node.body:
@@ -0,0 +1,219 @@
+import ast
+from collections import (
+    deque,
+)
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from .abstract_callable_visitor import AbstractCallableVisitor
+from .argument_visitor import ArgumentVisitor
+from .assert_visitor import AssertVisitor
+from .function_and_method_visitor import FunctionAndMethodVisitor
+from .raise_visitor import (
+    Context,
+    RaiseVisitor,
+)
+from .return_visitor import ReturnVisitor
+from .variable_visitor import VariableVisitor
+from .yield_visitor import YieldVisitor
+
+
+_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+class FunctionAnalysis(object):
+    """What the analysis found in a single function.
+
+    These are the attributes an `AnalysisVisitor` would have after
+    visiting the function.
+
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.arguments = list()  # type: List[str]
+        self.types = list()  # type: List[Optional[str]]
+        self.returns = list()  # type: List[Optional[ast.Return]]
+        self.return_types = list()  # type: List[Optional[ast.AST]]
+        self.yields = list()  # type: List[Union[ast.Yield, ast.YieldFrom]]
+        self.contexts = deque([Context()])  # type: Deque[Context]
+        self.variables = list()  # type: List[ast.Name]
+        self.asserts = list()  # type: List[ast.Assert]
+        self.is_abstract = None  # type: Optional[bool]
+
+        # The exception raised while analyzing the function, if any.
+        # The other attributes are incomplete if there was one.
+        self.error = None  # type: Optional[Exception]
+
+    @property
+    def exceptions(self):
+        # type: () -> Set[str]
+        return self.contexts[0].exceptions
+
+
+class ModuleAnalysisVisitor(FunctionAndMethodVisitor,
+                            AbstractCallableVisitor,
+                            RaiseVisitor,
+                            YieldVisitor,
+                            ArgumentVisitor,
+                            VariableVisitor,
+                            ReturnVisitor,
+                            AssertVisitor):
+    """Finds and analyzes every function in a module in one pass.
+
+    Running an `AnalysisVisitor` over each function walks the
+    module once to find the functions, and then walks each function
+    again (skipping the functions nested in it.)  This visitor walks
+    the module once.  Whenever it enters a function, the attributes
+    the other visitors collect into are bound to a new
+    `FunctionAnalysis`, and they're bound back to the enclosing
+    function's when it leaves.  So each function's analysis is the
+    same as an `AnalysisVisitor`'s.
+
+    Only the functions accepted by `analyze` are analyzed; the
+    others are still found (and so are the functions in them.)
+
+    """
+
+    def __init__(self, analyze=None):
+        # type: (Optional[Callable[[Union[ast.FunctionDef, ast.AsyncFunctionDef]], bool]]) -> None  # noqa: E501
+        """Create a new visitor.
+
+        Args:
+            analyze: A predicate for the functions to analyze.  If
+                not given, every function is analyzed.
+
+        """
+        super(ModuleAnalysisVisitor, self).__init__()
+        self._should_analyze = analyze
+
+        # The analysis of each function, by its node.
+        self.analyses = dict()  # type: Dict[Union[ast.FunctionDef, ast.AsyncFunctionDef], FunctionAnalysis]  # noqa: E501
+
+        # The analysis of the function being visited, or None if
+        # we're not in a function.
+        self.analysis = None  # type: Optional[FunctionAnalysis]
+
+        # Outside of functions, the attributes are bound to an
+        # analysis which is never used.
+        self._outside = FunctionAnalysis()
+        self._bind(self._outside)
+
+        # The visit method for each type of node.
+        self._visitors = dict()  # type: Dict[type, Any]
+
+    def visit(self, node):
+        # type: (ast.AST) -> Any
+        # The same as `ast.NodeVisitor.visit`, but the method is only
+        # looked up once for each type of node.
+        visitor = self._visitors.get(node.__class__)
+        if visitor is None:
+            visitor = getattr(
+                self,
+                'visit_' + node.__class__.__name__,
+                self.generic_visit,
+            )
+            self._visitors[node.__class__] = visitor
+        return visitor(node)
+
+    def generic_visit(self, node):
+        # type: (ast.AST) -> Any
+        if self.analysis is not None:
+            return super(ModuleAnalysisVisitor, self).generic_visit(node)
+
+        # Outside of a function, we're only looking for functions
+        # and classes.  They can only be in other statements, so
+        # we don't descend into expressions.
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _DEFINITIONS):
+                self.visit(child)
+            elif not isinstance(child, ast.expr):
+                self.generic_visit(child)
+        return node
+
+    def _bind(self, analysis):
+        # type: (FunctionAnalysis) -> None
+        self.arguments = analysis.arguments
+        self.types = analysis.types
+        self.returns = analysis.returns
+        self.return_types = analysis.return_types
+        self.yields = analysis.yields
+        self.contexts = analysis.contexts
+        self.variables = analysis.variables
+        self.asserts = analysis.asserts
+
+    def _analyze(self, node):
+        # type: (Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None
+        if node in self.analyses:
+            # It was analyzed before its parent's analysis failed.
+            return
+        self.callables.add(node)
+        if self._should_analyze and not self._should_analyze(node):
+            parent = self.analysis
+            self.analysis = None
+            self._bind(self._outside)
+            try:
+                self.generic_visit(node)
+            finally:
+                self.analysis = parent
+                self._bind(parent or self._outside)
+            return
+        analysis = FunctionAnalysis()
+        self.analyses[node] = analysis
+        parent = self.analysis
+        self.analysis = analysis
+        self._bind(analysis)
+        try:
+            analysis.is_abstract = self.analyze_pure_abstract(node)
+            self.generic_visit(node)
+        except Exception as ex:
+            # Keep going, without the analysis, so that we still
+            # find the functions nested in this one.  (Outside of an
+            # analysis, only functions and classes are visited.)
+            analysis.error = ex
+            self.analysis = None
+            self._bind(self._outside)
+            self.generic_visit(node)
+        finally:
+            self.analysis = parent
+            self._bind(parent or self._outside)
+
+    def visit_FunctionDef(self, node):
+        # type: (ast.FunctionDef) -> ast.AST
+        self._analyze(node)
+        return node
+
+    def visit_AsyncFunctionDef(self, node):
+        # type: (ast.AsyncFunctionDef) -> ast.AST
+        self._analyze(node)
+        return node
+
+    def visit_Lambda(self, node):
+        # type: (ast.Lambda) -> ast.AST
+        # Lambdas aren't part of the enclosing function's analysis,
+        # and they can't contain functions.
+        return node
+
+
+def analyze_function(function):
+    # type: (Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> FunctionAnalysis
+    """Analyze a single function, without the functions in it.
+
+    Args:
+        function: The function to analyze.
+
+    Returns:
+        The function's analysis.
+
+    """
+    visitor = ModuleAnalysisVisitor(analyze=lambda node: node is function)
+    visitor.visit(function)
+    return visitor.analyses[function]
@@ -85,13 +85,33 @@ class LogLevel(Enum):
             ))
 
 
+class CykBackend(Enum):
+    """Describes which implementation of CYK to parse with."""
+    PYTHON = 1
+    NUMPY = 2
+
+    @classmethod
+    def from_string(cls, backend):
+        # type: (str) -> CykBackend
+        normalized_backend = backend.lower().strip()
+        if normalized_backend == 'python':
+            return cls.PYTHON
+        elif normalized_backend == 'numpy':
+            return cls.NUMPY
+        else:
+            raise ValueError('Unrecognized CYK backend, "{}"'.format(
+                backend
+            ))
+
+
 class Configuration(object):
 
     def __init__(self, ignore, message_template, style, strictness,
                  ignore_regex=None, ignore_raise=[], ignore_properties=False, enable=[],
                  indentation=4, assert_style=AssertStyle.LOG,
-                 log_level=LogLevel.CRITICAL):
-        # type: (List[str], Optional[str], DocstringStyle, Strictness, Optional[str], List[str], bool, List[str], int, AssertStyle, LogLevel) -> None  # noqa: E501
+                 log_level=LogLevel.CRITICAL,
+                 cyk_backend=CykBackend.PYTHON, adaptive_parsing=False):
+        # type: (List[str], Optional[str], DocstringStyle, Strictness, Optional[str], List[str], bool, List[str], int, AssertStyle, LogLevel, CykBackend, bool) -> None  # noqa: E501
         """Initialize the configuration object.
 
         Args:
@@ -109,6 +129,13 @@ class Configuration(object):
             indentation: The number of spaces to count as an indent.
             assert_style: The assert style to use (e.g. log on failed
                 assertions, or raise exception on failed assertions.)
+            log_level: The level at which to log.
+            cyk_backend: The implementation of CYK to parse with.
+                The NumPy backend is only used if NumPy is installed,
+                and only for long sections.
+            adaptive_parsing: Whether to remember which parser succeeded
+                for each shape of section, and try it first when the
+                same shape is seen again.
 
         """
         self._enable = enable
@@ -123,6 +150,8 @@ class Configuration(object):
         self.indentation = indentation
         self.assert_style = assert_style
         self.log_level = log_level
+        self.cyk_backend = cyk_backend
+        self.adaptive_parsing = adaptive_parsing
 
     @property
     def log_level(self):
@@ -220,6 +249,8 @@ def load_config_file(filename):  # type: (str) -> Configuration
     strictness = Strictness.FULL_DESCRIPTION
     indentation = 4
     log_level = LogLevel.CRITICAL
+    cyk_backend = CykBackend.PYTHON
+    adaptive_parsing = False
     if 'darglint' in config.sections():
         if 'ignore' in config['darglint']:
             errors = config['darglint']['ignore']
@@ -260,6 +291,16 @@ def load_config_file(filename):  # type: (str) -> Configuration
 
         if 'log_level' in config['darglint']:
             log_level = LogLevel.from_string(config['darglint']['log_level'])
+
+        if 'cyk_backend' in config['darglint']:
+            cyk_backend = CykBackend.from_string(
+                config['darglint']['cyk_backend']
+            )
+
+        if 'adaptive_parsing' in config['darglint']:
+            adaptive_parsing = config['darglint'].getboolean(
+                'adaptive_parsing'
+            )
     return Configuration(
         ignore=ignore,
         message_template=message_template,
@@ -270,6 +311,8 @@ def load_config_file(filename):  # type: (str) -> Configuration
         ignore_properties=ignore_properties,
         enable=enable,
         indentation=indentation,
+        cyk_backend=cyk_backend,
+        adaptive_parsing=adaptive_parsing,
     )
 
 
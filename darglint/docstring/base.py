@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import (
+from collections import (
+    Counter,
+)
+import functools
+from typing import (  # noqa: F401
+    Any,
     ClassVar,
     Callable,
     Dict,
@@ -14,6 +19,55 @@ from .sections import Sections
 from ..strictness import Strictness
 
 
+class Memo(object):
+    """The results of a docstring's memoized methods.
+
+    Computing any of these results walks some part of the tree.
+    So, for each method, `calls` is the number of walks there
+    would be without memoization, and `computed` is the number
+    there actually were.
+
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.results = dict()  # type: Dict[Tuple[Any, ...], Any]
+        self.calls = Counter()  # type: Counter
+        self.computed = Counter()  # type: Counter
+
+
+def memoized(method):
+    # type: (Callable) -> Callable
+    """Only compute the result of a docstring's method once.
+
+    A docstring doesn't change once it's created, so the views
+    derived from it (its noqas, items, types and line numbers) are
+    the same every time they're requested.  The results are shared
+    between callers, and so shouldn't be modified.
+
+    Args:
+        method: A method of a docstring, whose arguments are
+            hashable.
+
+    Returns:
+        The method, with its results stored on the docstring.
+
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        memo = self.memo
+        memo.calls[name] += 1
+        key = (name,) + args
+        if key not in memo.results:
+            memo.computed[name] += 1
+            memo.results[key] = method(self, *args)
+        return memo.results[key]
+
+    return wrapper
+
+
 class BaseDocstring(ABC):
     """The interface for a docstring object which can be used with checkers.
 
@@ -27,6 +81,21 @@ class BaseDocstring(ABC):
 
     supported_sections = tuple(Sections) # type: ClassVar[Tuple[Sections, ...]]
 
+    @property
+    def memo(self):
+        # type: () -> Memo
+        """Get the results of the memoized methods.
+
+        Returns:
+            The memoized results, and how often they were
+            requested.
+
+        """
+        memo = self.__dict__.get('_memo')
+        if memo is None:
+            memo = self.__dict__['_memo'] = Memo()
+        return memo
+
     @abstractmethod
     def get_section(self, section):
         # type: (Sections) -> Optional[str]
@@ -48,6 +117,29 @@ class BaseDocstring(ABC):
         """
         pass
 
+    @abstractmethod
+    def has_section(self, section):
+        # type: (Sections) -> bool
+        """Return whether the docstring has the given section.
+
+        This agrees with `get_section`, but answers from the nodes
+        found for the section, without reconstructing its text.
+
+        Args:
+            section: The section to look for.
+
+        Raises:
+            Exception: If the section type is unsupported.
+
+        Returns:
+            True if the section is present and has some text.
+
+        # noqa: I202
+        # noqa: I402
+
+        """
+        pass
+
     @abstractmethod
     def get_types(self, section):
         # type: (Sections) -> Optional[Union[str, List[Optional[str]]]]
@@ -141,20 +233,29 @@ class BaseDocstring(ABC):
             True if there is no more than the minimum amount of strictness.
 
         """
-        sections = {
-            section
-            for section in self.supported_sections
-            if self.get_section(section)
-        }
         if strictness == Strictness.SHORT_DESCRIPTION:
-            return sections == {Sections.SHORT_DESCRIPTION}
+            allowed = {Sections.SHORT_DESCRIPTION}
         elif strictness == Strictness.LONG_DESCRIPTION:
-            return sections in (
-                {Sections.SHORT_DESCRIPTION},
-                # Shouldn't be possible, but if it is in the future, then
-                # we should allow this.
-                {Sections.LONG_DESCRIPTION},
-                {Sections.SHORT_DESCRIPTION, Sections.LONG_DESCRIPTION},
-            )
+            # Only having a long description shouldn't be possible, but
+            # if it is in the future, then we should allow this.
+            allowed = {
+                Sections.SHORT_DESCRIPTION,
+                Sections.LONG_DESCRIPTION,
+            }
         else:
             return False
+
+        # Any section which isn't allowed settles it, so we look for
+        # those first.  (Sections are parsed as they're requested, and
+        # the long description could be in any of them, so it's last.)
+        disallowed = sorted(
+            [
+                section
+                for section in self.supported_sections
+                if section not in allowed
+            ],
+            key=lambda section: section == Sections.LONG_DESCRIPTION,
+        )
+        if any(self.has_section(section) for section in disallowed):
+            return False
+        return any(self.has_section(section) for section in allowed)
@@ -16,30 +16,42 @@ from typing import (  # noqa: F401
 from ..custom_assert import (
     Assert,
 )
-from .base import BaseDocstring
+from .base import (
+    BaseDocstring,
+    memoized,
+)
+from .lazy import (
+    LazyLookup,
+    discover,
+    index_values,
+)
 from .sections import Sections
 from .style import DocstringStyle
 from ..node import (
     CykNode,
 )
 from ..parse.google import (
-    parse,
+    combinator,
+    parse_section,
+    section_keyword,
+    top_parse,
 )
 from ..lex import (
-    condense,
-    lex,
+    tokenize,
 )
 from ..errors import (
     DarglintError,
 )
 from ..strictness import Strictness
+from ..token import (
+    TokenType,
+)
 from ..parse.identifiers import (
     ArgumentIdentifier,
     ArgumentItemIdentifier,
     ArgumentTypeIdentifier,
     ExceptionIdentifier,
     ExceptionItemIdentifier,
-    Identifier,
     NoqaIdentifier,
 )
 
@@ -97,6 +109,23 @@ class Docstring(BaseDocstring):
         Sections.NOQAS,
     )
 
+    # The keywords of the sections which can contain each symbol.
+    # (See `LazyLookup`.)
+    _symbol_keywords = {
+        'arguments-section': {TokenType.ARGUMENTS},
+        'ident': {TokenType.ARGUMENTS},
+        ArgumentIdentifier.key: {TokenType.ARGUMENTS},
+        ArgumentItemIdentifier.key: {TokenType.ARGUMENTS},
+        ArgumentTypeIdentifier.key: {TokenType.ARGUMENTS},
+        'raises-section': {TokenType.RAISES},
+        ExceptionIdentifier.key: {TokenType.RAISES},
+        ExceptionItemIdentifier.key: {TokenType.RAISES},
+        'returns-section': {TokenType.RETURNS},
+        'returns-type': {TokenType.RETURNS},
+        'yields-section': {TokenType.YIELDS},
+        'yields-type': {TokenType.YIELDS},
+    }
+
     def __init__(self, root, style=DocstringStyle.GOOGLE):
         # type: (Union[CykNode, str], DocstringStyle) -> None
         """Create a new docstring from the AST.
@@ -104,16 +133,39 @@ class Docstring(BaseDocstring):
         Args:
             root: The root of the AST, or the docstring
                 (as a string.)  If it is a string, the
-                string will be parsed.
+                string will be split into sections, and each
+                section parsed when it's first needed.
             style: The style of the docstring.  Discarded,
                 since this Docstring is always the Google style.
 
         """
         if isinstance(root, CykNode):
-            self.root = root
+            self._root = root  # type: Optional[CykNode]
+            self._lookup = self._discover()
         else:
-            self.root = parse(condense(lex(root)))
-        self._lookup = self._discover()
+            self._root = None
+            self._lookup = LazyLookup(
+                top_parse(tokenize(root)),
+                parse_section,
+                section_keyword,
+                self._symbol_keywords,
+            )
+
+    @property
+    def root(self):
+        # type: () -> Optional[CykNode]
+        """Get the root of the AST, parsing any remaining sections.
+
+        Returns:
+            The root of the AST, or None if a section couldn't
+            be parsed.
+
+        """
+        if self._root is None and isinstance(self._lookup, LazyLookup):
+            nodes = self._lookup.parse_all()
+            if all(node is not None for node in nodes):
+                self._root = combinator(*nodes)
+        return self._root
 
     def _discover(self):
         # type: () -> Dict[str, List[CykNode]]
@@ -123,19 +175,10 @@ class Docstring(BaseDocstring):
             A lookup table for compound Nodes by their NodeType.
 
         """
-        lookup = defaultdict(
-            lambda: list()
-        )  # type: Dict[str, List[CykNode]]
-        for node in self.root.in_order_traverse():
-            if node.annotations:
-                for annotation in node.annotations:
-                    if issubclass(annotation, Identifier):
-                        lookup[annotation.key].append(node)
-            lookup[node.symbol].append(node)
-        return lookup
+        return discover(self.root)
 
-    def get_section(self, section):
-        # type: (Sections) -> Optional[str]
+    def _get_section_nodes(self, section):
+        # type: (Sections) -> Optional[List[CykNode]]
         nodes = []  # type: Optional[List[CykNode]]
 
         if section == Sections.SHORT_DESCRIPTION:
@@ -157,6 +200,12 @@ class Docstring(BaseDocstring):
                 'Unsupported section type {}'.format(section.name)
             )
 
+        return nodes
+
+    @memoized
+    def get_section(self, section):
+        # type: (Sections) -> Optional[str]
+        nodes = self._get_section_nodes(section)
         if not nodes:
             return None
 
@@ -166,6 +215,12 @@ class Docstring(BaseDocstring):
 
         return return_value.strip() or None
 
+    @memoized
+    def has_section(self, section):
+        # type: (Sections) -> bool
+        nodes = self._get_section_nodes(section)
+        return any(node.has_text() for node in nodes or [])
+
     def _get_argument_types(self):
         # type: () ->  Optional[List[Optional[str]]]
         """Get a list of types corresponding to arguments.
@@ -195,6 +250,7 @@ class Docstring(BaseDocstring):
             return type_node.lchild.value.value
         return None
 
+    @memoized
     def get_types(self, section):
         # type: (Sections) -> Union[None, str, List[Optional[str]]]
         if section == Sections.ARGUMENTS_SECTION:
@@ -252,6 +308,7 @@ class Docstring(BaseDocstring):
             items.append(ExceptionIdentifier.extract(item))
         return sorted(items) or None
 
+    @memoized
     def get_items(self, section):
         # type: (Sections) -> Optional[List[str]]
         if section == Sections.ARGUMENTS_SECTION:
@@ -280,6 +337,7 @@ class Docstring(BaseDocstring):
             return type_node.lchild.value.value
         return None
 
+    @memoized
     def get_noqas(self):
         # type: () -> Dict[str, List[str]]
         """Get a map of the errors ignored to their targets.
@@ -349,6 +407,7 @@ class Docstring(BaseDocstring):
                 if issubclass(annotation, DarglintError):
                     yield annotation, node.line_numbers
 
+    @memoized
     def get_line_numbers(self, symbol):
         # type: (str) -> Optional[Tuple[int, int]]
         """Get the line numbers for the first instance of the given section.
@@ -383,14 +442,12 @@ class Docstring(BaseDocstring):
             parameters.
 
         """
-        nodes = self._lookup[symbol]
-        for node in nodes:
-            for child in node.walk():
-                if (child.value
-                        and child.value.value == value
-                        and child.line_numbers):
-                    return child.line_numbers
-        return None
+        return self._index_values(symbol).get(value)
+
+    @memoized
+    def _index_values(self, symbol):
+        # type: (str) -> Dict[str, Tuple[int, int]]
+        return index_values(self._lookup[symbol])
 
     @property
     def ignore_all(self):
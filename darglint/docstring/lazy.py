@@ -0,0 +1,207 @@
+"""A lookup of a docstring's nodes, which parses sections on demand.
+
+Most checks only need a section or two of the docstring: the
+arguments section, say, or the returns section.  If the docstring
+only has to meet a minimum strictness, or if most errors are
+disabled, many of its sections aren't needed at all.  So, rather
+than parsing the whole docstring up front, the docstring is split
+into sections (which is cheap), and a section is only parsed the
+first time a node which could be in it is requested.
+
+"""
+
+from collections import (
+    defaultdict,
+)
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..node import (
+    CykNode,
+)
+from ..parse.identifiers import (
+    Identifier,
+    NoqaIdentifier,
+)
+from ..token import (  # noqa: F401
+    Token,
+    TokenType,
+    type_codes,
+)
+
+
+_NOQA = TokenType.NOQA.value
+
+
+def discover(root):
+    # type: (CykNode) -> Dict[str, List[CykNode]]
+    """Walk the tree, finding all non-terminal nodes.
+
+    Args:
+        root: The root of the tree to walk.
+
+    Returns:
+        A lookup table for compound Nodes by their NodeType.
+
+    """
+    lookup = defaultdict(
+        lambda: list()
+    )  # type: Dict[str, List[CykNode]]
+    for node in root.in_order_traverse():
+        lookup[node.symbol].append(node)
+        for annotation in node.annotations:
+            if issubclass(annotation, Identifier):
+                lookup[annotation.key].append(node)
+    return lookup
+
+
+def index_values(nodes):
+    # type: (List[CykNode]) -> Dict[str, Tuple[int, int]]
+    """Index the line numbers of the tokens under the given nodes.
+
+    Args:
+        nodes: The nodes whose descendants should be indexed.
+
+    Returns:
+        A map from the value of each token to the line numbers
+        of the first leaf (in order) which has it.
+
+    """
+    index = dict()  # type: Dict[str, Tuple[int, int]]
+    for node in nodes:
+        for child in node.walk():
+            if child.value is None or child.value.value in index:
+                continue
+            line_numbers = child.line_numbers
+            if line_numbers:
+                index[child.value.value] = line_numbers
+    return index
+
+
+class LazyLookup(defaultdict):
+    """A lookup of nodes by symbol, which parses sections as needed.
+
+    This stands in for the lookup built by walking the whole
+    tree: before a symbol is looked up, every section which could
+    contain that symbol is parsed (if it hasn't been already.)  The
+    nodes for each symbol are in the same order as in the whole
+    tree.
+
+    Which sections can contain a symbol is determined by the
+    section's keyword (see `section_keyword` in the parsers.)
+    Symbols without any listed keywords could be in any section.
+    Besides those, the short description can only be in the first
+    section, and a noqa can only be in a section with a noqa token.
+
+    """
+
+    def __init__(self, sections, parse, keyword, symbol_keywords):
+        # type: (List[List[Token]], Callable[[List[Token], int], Optional[CykNode]], Callable[[List[Token]], Any], Dict[str, Set[TokenType]]) -> None  # noqa: E501
+        """Create a new lookup for the given sections.
+
+        Args:
+            sections: The docstring, split into sections.
+            parse: Parses a section, given the section and its index.
+            keyword: Gets the keyword which determines how a section
+                is parsed.
+            symbol_keywords: For symbols which can only occur in some
+                sections, the keywords of those sections.
+
+        """
+        super(LazyLookup, self).__init__(list)
+        self.sections = sections
+        self._parse = parse
+        self._keywords = [keyword(section) for section in sections]
+        self._symbol_keywords = symbol_keywords
+
+        # The parse of each section, and the nodes found in it, by
+        # symbol.  A section is in `_found` once it has been parsed.
+        self._nodes = [None] * len(sections)  # type: List[Optional[CykNode]]  # noqa: E501
+        self._found = dict()  # type: Dict[int, Dict[str, List[CykNode]]]
+
+        # The symbols whose sections have all been parsed.
+        self._loaded = set()  # type: Set[str]
+
+    def _indices(self, symbol):
+        # type: (str) -> Iterable[int]
+        if symbol == 'short-description':
+            return range(min(1, len(self.sections)))
+        if symbol in ('noqa', NoqaIdentifier.key):
+            return [
+                i for i, section in enumerate(self.sections)
+                if _NOQA in type_codes(section)
+            ]
+        keywords = self._symbol_keywords.get(symbol)
+        if keywords is None:
+            return range(len(self.sections))
+        return [
+            i for i, keyword in enumerate(self._keywords)
+            if keyword in keywords
+        ]
+
+    def _load(self, symbol):
+        # type: (str) -> None
+        if symbol in self._loaded:
+            return
+        self._loaded.add(symbol)
+        self._parse_sections([
+            i for i in self._indices(symbol) if i not in self._found
+        ])
+
+    def _parse_sections(self, indices):
+        # type: (List[int]) -> None
+        if not indices:
+            return
+        symbols = set()  # type: Set[str]
+        for i in indices:
+            node = self._parse(self.sections[i], i)
+            self._nodes[i] = node
+            self._found[i] = discover(node) if node else dict()
+            symbols.update(self._found[i])
+
+        # Rebuild the lists for the symbols in the new sections,
+        # so that their nodes stay in the order of the sections.
+        order = sorted(self._found)
+        for symbol in symbols:
+            dict.__setitem__(self, symbol, [
+                node
+                for i in order
+                for node in self._found[i].get(symbol, [])
+            ])
+
+    def parse_all(self):
+        # type: () -> List[Optional[CykNode]]
+        """Parse every section which hasn't been parsed.
+
+        Returns:
+            The parse of each section, which is None if the section
+            couldn't be parsed.
+
+        """
+        self._parse_sections([
+            i for i in range(len(self.sections)) if i not in self._found
+        ])
+        return self._nodes
+
+    def __getitem__(self, symbol):
+        # type: (str) -> List[CykNode]
+        self._load(symbol)
+        return super(LazyLookup, self).__getitem__(symbol)
+
+    def __contains__(self, symbol):
+        # type: (Any) -> bool
+        self._load(symbol)
+        return super(LazyLookup, self).__contains__(symbol)
+
+    def get(self, symbol, default=None):
+        # type: (str, Any) -> Any
+        self._load(symbol)
+        return super(LazyLookup, self).get(symbol, default)
@@ -16,9 +16,6 @@ from typing import (
     Type,
     Union,
 )
-from collections import (
-    defaultdict,
-)
 
 from ..parse.identifiers import (
     ArgumentItemIdentifier,
@@ -29,7 +26,15 @@ from ..parse.identifiers import (
     Identifier,
     NoqaIdentifier,
 )
-from .base import BaseDocstring
+from .base import (
+    BaseDocstring,
+    memoized,
+)
+from .lazy import (
+    LazyLookup,
+    discover,
+    index_values,
+)
 from .sections import Sections
 from .style import DocstringStyle
 from ..node import (
@@ -37,15 +42,20 @@ from ..node import (
 )
 from ..strictness import Strictness
 from ..parse.numpy import (
-    parse,
+    combinator,
+    parse_section,
+    section_keyword,
+    top_parse,
 )
 from ..lex import (
-    lex,
-    condense,
+    tokenize,
 )
 from ..errors import (
     DarglintError,
 )
+from ..token import (
+    TokenType,
+)
 from ..custom_assert import (
     Assert,
 )
@@ -62,6 +72,23 @@ class Docstring(BaseDocstring):
         Sections.NOQAS,
     )
 
+    # The keywords of the sections which can contain each symbol.
+    # (See `LazyLookup`.)
+    _symbol_keywords = {
+        'arguments-section': {TokenType.ARGUMENTS},
+        'other-arguments-section': {TokenType.OTHER},
+        ArgumentItemIdentifier.key: {TokenType.ARGUMENTS, TokenType.OTHER},
+        ArgumentTypeIdentifier.key: {TokenType.ARGUMENTS, TokenType.OTHER},
+        'raises-section': {TokenType.RAISES},
+        'warns-section': {TokenType.WARNS},
+        ExceptionItemIdentifier.key: {TokenType.RAISES, TokenType.WARNS},
+        'receives-section': {TokenType.RECEIVES},
+        'returns-section': {TokenType.RETURNS},
+        ReturnTypeIdentifier.key: {TokenType.RETURNS},
+        'yields-section': {TokenType.YIELDS},
+        YieldTypeIdentifier.key: {TokenType.YIELDS},
+    }
+
     def __init__(self, root, style=DocstringStyle.SPHINX):
         # type: (Union[CykNode, str], DocstringStyle) -> None  # noqa: E501
         """Create a new docstring from the AST.
@@ -69,16 +96,39 @@ class Docstring(BaseDocstring):
         Args:
             root: The root of the AST, or the docstring
                 (as a string.)  If it is a string, the
-                string will be parsed.
+                string will be split into sections, and each
+                section parsed when it's first needed.
             style: The docstring style.  Discarded, since this
                 docstring always represents the Numpy style.
 
         """
         if isinstance(root, CykNode):
-            self.root = root  # type: Optional[CykNode]
+            self._root = root  # type: Optional[CykNode]
+            self._lookup = self._discover()
         else:
-            self.root = parse(condense(lex(root)))
-        self._lookup = self._discover()
+            self._root = None
+            self._lookup = LazyLookup(
+                top_parse(tokenize(root)),
+                parse_section,
+                section_keyword,
+                self._symbol_keywords,
+            )
+
+    @property
+    def root(self):
+        # type: () -> Optional[CykNode]
+        """Get the root of the AST, parsing any remaining sections.
+
+        Returns:
+            The root of the AST, or None if a section couldn't
+            be parsed.
+
+        """
+        if self._root is None and isinstance(self._lookup, LazyLookup):
+            nodes = self._lookup.parse_all()
+            if all(node is not None for node in nodes):
+                self._root = combinator(*nodes)
+        return self._root
 
     def _discover(self, node = None):
         # type: (Optional[CykNode]) -> Dict[str, List[CykNode]]
@@ -91,20 +141,10 @@ class Docstring(BaseDocstring):
         root = node if node else self.root
         if not root:
             return dict()
-        lookup = defaultdict(
-            lambda: list()
-        )  # type: Dict[str, List[CykNode]]
-        for node in root.in_order_traverse():
-            lookup[node.symbol].append(node)
-            for annotation in node.annotations:
-                if issubclass(annotation, Identifier):
+        return discover(root)
 
-                    # TODO(000): Currently, annotations are being typed as Any.
-                    lookup[annotation.key].append(node)  # type: ignore
-        return lookup
-
-    def get_section(self, section):
-        # type: (Sections) -> Optional[str]
+    def _get_section_nodes(self, section):
+        # type: (Sections) -> Optional[List[CykNode]]
         nodes = []  # type: Optional[List[CykNode]]
 
         # TODO: Add Receives section
@@ -116,14 +156,14 @@ class Docstring(BaseDocstring):
             nodes = self._lookup.get('arguments-section', None)
             extra = self._lookup.get('other-arguments-section', None)
             if nodes:
-                nodes.extend(extra or [])
+                nodes = nodes + (extra or [])
             else:
                 nodes = extra
         elif section == Sections.RAISES_SECTION:
             nodes = self._lookup.get('raises-section', None)
             extra = self._lookup.get('warns-section', None)
             if nodes:
-                nodes.extend(extra or [])
+                nodes = nodes + (extra or [])
             else:
                 nodes = extra
         elif section == Sections.YIELDS_SECTION:
@@ -137,6 +177,12 @@ class Docstring(BaseDocstring):
                 'Unsupported section type, {}'.format(section)
             )
 
+        return nodes
+
+    @memoized
+    def get_section(self, section):
+        # type: (Sections) -> Optional[str]
+        nodes = self._get_section_nodes(section)
         if not nodes:
             return None
 
@@ -146,6 +192,12 @@ class Docstring(BaseDocstring):
 
         return return_value.strip() or None
 
+    @memoized
+    def has_section(self, section):
+        # type: (Sections) -> bool
+        nodes = self._get_section_nodes(section)
+        return any(node.has_text() for node in nodes or [])
+
     def _get_types_unsorted(self, section):
         # type: (Sections) -> Optional[Union[str, List[Optional[str]]]]
         if section == Sections.ARGUMENTS_SECTION:
@@ -163,6 +215,7 @@ class Docstring(BaseDocstring):
             )
         return None
 
+    @memoized
     def get_types(self, section):
         # type: (Sections) -> Optional[Union[str, List[Optional[str]]]]
         if section == Sections.RETURNS_SECTION:
@@ -243,6 +296,7 @@ class Docstring(BaseDocstring):
             )
         return None
 
+    @memoized
     def get_items(self, section):
         # type: (Sections) -> Optional[List[str]]
         items = self._get_items_unsorted(section)
@@ -263,6 +317,7 @@ class Docstring(BaseDocstring):
             ])
         return sorted_items
 
+    @memoized
     def get_noqas(self):
         # type: () -> Dict[str, List[str]]
         """Get a map of the errors ignored to their targets.
@@ -280,6 +335,7 @@ class Docstring(BaseDocstring):
             )
         return noqas
 
+    @memoized
     def get_line_numbers(self, node_type):
         # type: (str) -> Optional[Tuple[int, int]]
         """Get the line numbers for the first instance of the given section.
@@ -313,12 +369,12 @@ class Docstring(BaseDocstring):
             parameters.
 
         """
-        nodes = self._lookup[node_type]
-        for node in nodes:
-            for child in node.walk():
-                if child.value == value and child.line_numbers:
-                    return child.line_numbers
-        return None
+        return self._index_values(node_type).get(value)
+
+    @memoized
+    def _index_values(self, node_type):
+        # type: (str) -> Dict[str, Tuple[int, int]]
+        return index_values(self._lookup[node_type])
 
     @property
     def ignore_all(self):
@@ -10,7 +10,15 @@ from typing import (  # noqa
     Union,
 )
 
-from .base import BaseDocstring
+from .base import (
+    BaseDocstring,
+    memoized,
+)
+from .lazy import (
+    LazyLookup,
+    discover,
+    index_values,
+)
 from .sections import Sections
 from .style import DocstringStyle
 from ..custom_assert import Assert
@@ -18,25 +26,52 @@ from ..node import (
     CykNode,
 )
 from ..parse.identifiers import (
-    Identifier,
     NoqaIdentifier,
 )
 from ..parse.sphinx import (
-    parse,
+    combinator,
+    parse_section,
+    section_keyword,
+    top_parse,
 )
 from ..lex import (
-    lex,
-    condense,
+    tokenize,
 )
 from ..strictness import Strictness
 from ..errors import (
     DarglintError,
 )
+from ..token import (
+    TokenType,
+)
 
 
 class Docstring(BaseDocstring):
     """The docstring class interprets the AST of a docstring."""
 
+    # The keywords of the sections which can contain each symbol.
+    # (See `LazyLookup`.)
+    _symbol_keywords = {
+        'arguments-section': {TokenType.ARGUMENTS},
+        'argument-type-section': {
+            TokenType.ARGUMENTS,
+            TokenType.ARGUMENT_TYPE,
+        },
+        'raises-section': {TokenType.RAISES},
+        'returns-section': {TokenType.RETURNS},
+        'return-type-section': {TokenType.RETURN_TYPE},
+        'yields-section': {TokenType.YIELDS},
+        'yield-type-section': {
+            TokenType.YIELDS,
+            TokenType.YIELD_TYPE,
+        },
+        'variables-section': {TokenType.VARIABLES},
+        'variable-type-section': {
+            TokenType.VARIABLES,
+            TokenType.VARIABLE_TYPE,
+        },
+    }
+
     def __init__(self, root, style=DocstringStyle.SPHINX):
         # type: (Union[CykNode, str], DocstringStyle) -> None  # noqa: E501
         """Create a new docstring from the AST.
@@ -44,16 +79,39 @@ class Docstring(BaseDocstring):
         Args:
             root: The root of the AST, or the docstring
                 (as a string.)  If it is a string, the
-                string will be parsed.
+                string will be split into sections, and each
+                section parsed when it's first needed.
             style: The docstring style.  Discarded, since this
                 docstring always represents the Sphinx style.
 
         """
         if isinstance(root, CykNode):
-            self.root = root
+            self._root = root  # type: Optional[CykNode]
+            self._lookup = self._discover()
         else:
-            self.root = parse(condense(lex(root)))
-        self._lookup = self._discover()
+            self._root = None
+            self._lookup = LazyLookup(
+                top_parse(tokenize(root)),
+                parse_section,
+                section_keyword,
+                self._symbol_keywords,
+            )
+
+    @property
+    def root(self):
+        # type: () -> Optional[CykNode]
+        """Get the root of the AST, parsing any remaining sections.
+
+        Returns:
+            The root of the AST, or None if a section couldn't
+            be parsed.
+
+        """
+        if self._root is None and isinstance(self._lookup, LazyLookup):
+            nodes = self._lookup.parse_all()
+            if all(node is not None for node in nodes):
+                self._root = combinator(*nodes)
+        return self._root
 
     def _discover(self):
         # type: () -> Dict[str, List[CykNode]]
@@ -63,18 +121,10 @@ class Docstring(BaseDocstring):
             A lookup table for compound Nodes by their NodeType.
 
         """
-        lookup = defaultdict(
-            lambda: list()
-        )  # type: Dict[str, List[CykNode]]
-        for node in self.root.in_order_traverse():
-            lookup[node.symbol].append(node)
-            for annotation in node.annotations:
-                if issubclass(annotation, Identifier):
-                    lookup[annotation.key].append(node)
-        return lookup
+        return discover(self.root)
 
-    def get_section(self, section):
-        # type: (Sections) -> Optional[str]
+    def _get_section_nodes(self, section):
+        # type: (Sections) -> Optional[List[CykNode]]
         nodes = []  # type: Optional[List[CykNode]]
 
         if section == Sections.SHORT_DESCRIPTION:
@@ -98,6 +148,12 @@ class Docstring(BaseDocstring):
                 'Unsupported section type, {}'.format(section)
             )
 
+        return nodes
+
+    @memoized
+    def get_section(self, section):
+        # type: (Sections) -> Optional[str]
+        nodes = self._get_section_nodes(section)
         if not nodes:
             return None
 
@@ -107,6 +163,12 @@ class Docstring(BaseDocstring):
 
         return return_value.strip() or None
 
+    @memoized
+    def has_section(self, section):
+        # type: (Sections) -> bool
+        nodes = self._get_section_nodes(section)
+        return any(node.has_text() for node in nodes or [])
+
     def _get_argument_type_lookup(self):
         # type: () -> Dict[str, Optional[str]]
         ret = dict()  # type: Dict[str, Optional[str]]
@@ -210,6 +272,7 @@ class Docstring(BaseDocstring):
     def _sorted_keys(self, lookup):
         return sorted(lookup.keys())
 
+    @memoized
     def get_types(self, section):
         # type: (Sections) -> Optional[Union[str, List[Optional[str]]]]
         if section == Sections.ARGUMENTS_SECTION:
@@ -238,6 +301,7 @@ class Docstring(BaseDocstring):
             )
         return None
 
+    @memoized
     def get_items(self, section):
         # type: (Sections) -> Optional[List[str]]
         if section == Sections.ARGUMENTS_SECTION:
@@ -257,6 +321,7 @@ class Docstring(BaseDocstring):
             )
         return None
 
+    @memoized
     def get_noqas(self):
         # type: () -> Dict[str, List[str]]
         """Get a map of the errors ignored to their targets.
@@ -274,6 +339,7 @@ class Docstring(BaseDocstring):
             )
         return noqas
 
+    @memoized
     def get_line_numbers(self, node_type):
         # type: (str) -> Optional[Tuple[int, int]]
         """Get the line numbers for the first instance of the given section.
@@ -307,12 +373,12 @@ class Docstring(BaseDocstring):
             parameters.
 
         """
-        nodes = self._lookup[node_type]
-        for node in nodes:
-            for child in node.walk():
-                if child.value == value and child.line_numbers:
-                    return child.line_numbers
-        return None
+        return self._index_values(node_type).get(value)
+
+    @memoized
+    def _index_values(self, node_type):
+        # type: (str) -> Dict[str, Tuple[int, int]]
+        return index_values(self._lookup[node_type])
 
     @property
     def ignore_all(self):
@@ -17,6 +17,7 @@ from .integrity_checker import IntegrityChecker
 from .config import (
     get_config,
     get_logger,
+    CykBackend,
     LogLevel,
 )
 from .docstring.style import DocstringStyle
@@ -183,6 +184,33 @@ parser.add_argument(
         'ERROR level.'
     )
 )
+parser.add_argument(
+    '--cyk-backend',
+    type=str,
+    default=None,
+    choices=[
+        'python',
+        'numpy',
+    ],
+    help=(
+        'The implementation of the parser to use.  The numpy '
+        'backend is faster for long sections, but slower for '
+        'short ones, so it is only used for long sections.  It '
+        'requires numpy to be installed.  If it is not, the '
+        'python backend is used.'
+    )
+)
+parser.add_argument(
+    '--adaptive-parsing',
+    action='store_true',
+    default=False,
+    help=(
+        'Remember which parser succeeded for each shape of section, '
+        'and try it first when the same shape is seen again.  This '
+        'helps when checking many files which document their '
+        'functions in the same way.'
+    )
+)
 
 # ---------------------- MAIN SCRIPT ---------------------------------
 
@@ -212,10 +240,10 @@ def get_error_report(filename,
     program = read_program(filename)
     try:
         tree = ast.parse(program)
-        functions = get_function_descriptions(tree)
         checker = IntegrityChecker(
             raise_errors=raise_errors_for_syntax,
         )
+        functions = get_function_descriptions(tree, checker.config)
         for function in functions:
             checker.schedule(function)
         return checker.get_error_report_string(
@@ -303,6 +331,12 @@ def main():
         if args.log_level:
             config.log_level = LogLevel.from_string(args.log_level)
 
+        if args.cyk_backend:
+            config.cyk_backend = CykBackend.from_string(args.cyk_backend)
+
+        if args.adaptive_parsing:
+            config.adaptive_parsing = args.adaptive_parsing
+
         if args.ignore_regex:
             config.ignore_regex = args.ignore_regex
         if args.ignore_raise:
@@ -42,7 +42,7 @@ class DarglintChecker(object):
         # idea of where it was raised.
         last_line = 1
         try:
-            functions = get_function_descriptions(self.tree)
+            functions = get_function_descriptions(self.tree, self.config)
             checker = IntegrityChecker(
                 raise_errors=False,
             )
@@ -1,9 +1,11 @@
 """A linter for docstrings following the google docstring format."""
 import ast
 from collections import deque
+import re
 import sys
 from enum import Enum
 from typing import (
+    cast,
     Callable,
     Iterator,
     List,
@@ -15,13 +17,15 @@ from typing import (
     Any,
 )
 
-from .analysis.analysis_visitor import (
-    AnalysisVisitor,
+from .analysis.module_analysis_visitor import (
+    analyze_function,
+    FunctionAnalysis,
+    ModuleAnalysisVisitor,
 )
-from .analysis.function_and_method_visitor import (
-    FunctionAndMethodVisitor,
+from .config import (  # noqa: F401
+    Configuration,
+    get_logger,
 )
-from .config import get_logger
 from .analysis.analysis_helpers import (
     _has_decorator
 )
@@ -109,6 +113,29 @@ def get_line_number_from_function(fn):
     return line_number
 
 
+def is_skipped(name, docstring, is_property, config):
+    # type: (str, Optional[str], bool, Configuration) -> bool
+    """Whether a function's docstring is skipped, rather than checked.
+
+    Args:
+        name: The name of the function.
+        docstring: The function's docstring, if it has one.
+        is_property: Whether the function is a property.
+        config: The configuration the docstring would be checked with.
+
+    Returns:
+        True if the docstring won't be checked.
+
+    """
+    no_docstring = docstring is None
+    skip_by_regex = (
+        config.ignore_regex and
+        re.match(config.ignore_regex, name)
+    )
+    skip_property = config.ignore_properties and is_property
+    return bool(no_docstring or skip_by_regex or skip_property)
+
+
 class FunctionType(Enum):
 
     FUNCTION = 1
@@ -116,6 +143,21 @@ class FunctionType(Enum):
     PROPERTY = 3
 
 
+# The attributes of a `FunctionDescription` which come from analyzing
+# the function's body.
+_ANALYZED_ATTRIBUTES = {
+    'argument_names',
+    'argument_types',
+    'has_return',
+    'has_empty_return',
+    'has_yield',
+    'raises',
+    'variables',
+    'raises_assert',
+    'is_abstract',
+}
+
+
 class FunctionDescription(object):
     """Describes a function or method.
 
@@ -123,54 +165,82 @@ class FunctionDescription(object):
     a `FunctionDescription` describes the function itself.  (What,
     ideally, the docstring should describe.)
 
+    The attributes which come from the function's signature (its
+    name, docstring, and so on) are set up front.  The ones which
+    come from the function's analysis (its arguments, raises, and
+    so on) are set when one of them is first requested.  If the
+    function wasn't analyzed with the rest of the module, it's
+    analyzed then.
+
     """
 
-    def __init__(self, function_type, function):
-        # type: (FunctionType, Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None
+    def __init__(self, function_type, function, analysis=None):
+        # type: (FunctionType, Union[ast.FunctionDef, ast.AsyncFunctionDef], Optional[FunctionAnalysis]) -> None  # noqa: E501
         """Create a new FunctionDescription.
 
         Args:
             function_type: Type of the function.
             function: The base node of the function.
+            analysis: The function's analysis, if it's already been
+                done.  Otherwise, it's done when it's first needed.
 
         """
+        self.function_type = function_type
         self.is_method = (function_type == FunctionType.METHOD)
         self.is_property = (function_type == FunctionType.PROPERTY)
         self.function = function
         self.line_number = get_line_number_from_function(function)
         self.name = function.name
-        visitor = AnalysisVisitor()
-        try:
-            visitor.visit(function)
-        except Exception as ex:
-            msg = 'Failed to visit in {}: {}'.format(self.name, ex)
+        self.return_type = _get_return_type(function)
+        self.docstring = _get_docstring(function)
+        self._analysis = analysis
+        self._analyzed = False
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        # This is only called for attributes which haven't been set.
+        # If the analysis failed, they never are, as before.
+        if name not in _ANALYZED_ATTRIBUTES or self._analyzed:
+            raise AttributeError(name)
+        self._analyze()
+        return getattr(self, name)
+
+    def _analyze(self):
+        # type: () -> None
+        self._analyzed = True
+        analysis = self._analysis or analyze_function(self.function)
+        self._analysis = None
+        if analysis.error is not None:
+            msg = 'Failed to visit in {}: {}'.format(
+                self.name,
+                analysis.error,
+            )
             logger.debug(msg)
             return
-        self.argument_names = visitor.arguments
-        self.argument_types = visitor.types
-        if function_type != FunctionType.FUNCTION and len(self.argument_names) > 0:
-            if not _has_decorator(function, "staticmethod"):
+        self.argument_names = analysis.arguments
+        self.argument_types = analysis.types
+        if (self.function_type != FunctionType.FUNCTION
+                and len(self.argument_names) > 0):
+            if not _has_decorator(self.function, "staticmethod"):
                 self.argument_names.pop(0)
                 self.argument_types.pop(0)
-        self.has_return = bool(visitor.returns)
+        self.has_return = bool(analysis.returns)
         self.has_empty_return = False
         if self.has_return:
-            return_value = visitor.returns[0]
+            return_value = analysis.returns[0]
             self.has_empty_return = (
                 return_value is not None
                 and return_value.value is None
             )
-        self.return_type = _get_return_type(function)
-        self.has_yield = bool(visitor.yields)
-        self.raises = visitor.exceptions
-        self.docstring = _get_docstring(function)
-        self.variables = [x.id for x in visitor.variables]
-        self.raises_assert = bool(visitor.asserts)
-        self.is_abstract = visitor.is_abstract
+        self.has_yield = bool(analysis.yields)
+        self.raises = analysis.exceptions
+        self.variables = [x.id for x in analysis.variables]
+        self.raises_assert = bool(analysis.asserts)
+        self.is_abstract = analysis.is_abstract
 
 
-def get_function_descriptions(program):
-    # type: (ast.AST) -> List[FunctionDescription]
+def get_function_descriptions(program, config=None):
+    # type: (ast.AST, Optional[Configuration]) -> List[FunctionDescription]
     """Get function name, args, return presence and docstrings.
 
     This function should be called on the top level of the
@@ -178,6 +248,10 @@ def get_function_descriptions(program):
 
     Args:
         program: The tree representing the entire program.
+        config: The configuration the functions will be checked
+            with.  If given, only the functions which will be
+            checked are analyzed along with the module.  (The
+            others are analyzed if they're asked about.)
 
     Returns:
         A list of function descriptions pulled from the ast.
@@ -185,21 +259,45 @@ def get_function_descriptions(program):
     """
     ret = list()  # type: List[FunctionDescription]
 
-    visitor = FunctionAndMethodVisitor()
+    def is_checked(function):
+        # type: (Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool
+        return not is_skipped(
+            function.name,
+            _get_docstring(function),
+            visitor.is_property(function),
+            cast(Configuration, config),
+        )
+
+    visitor = ModuleAnalysisVisitor(
+        analyze=is_checked if config is not None else None,
+    )
     visitor.visit(program)
+    analyses = visitor.analyses
     for prop in visitor.properties:
         ret.append(
-            FunctionDescription(function_type=FunctionType.PROPERTY, function=prop)
+            FunctionDescription(
+                function_type=FunctionType.PROPERTY,
+                function=prop,
+                analysis=analyses.get(prop),
+            )
         )
 
     for method in visitor.methods:
         ret.append(
-            FunctionDescription(function_type=FunctionType.METHOD, function=method)
+            FunctionDescription(
+                function_type=FunctionType.METHOD,
+                function=method,
+                analysis=analyses.get(method),
+            )
         )
 
     for function in visitor.functions:
         ret.append(
-            FunctionDescription(function_type=FunctionType.FUNCTION, function=function)
+            FunctionDescription(
+                function_type=FunctionType.FUNCTION,
+                function=function,
+                analysis=analyses.get(function),
+            )
         )
 
     return ret
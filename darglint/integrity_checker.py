@@ -12,6 +12,7 @@ from typing import (  # noqa: F401
 
 from .function_description import (  # noqa: F401
     FunctionDescription,
+    is_skipped,
 )
 from .docstring.base import BaseDocstring
 from .docstring.docstring import Docstring
@@ -122,16 +123,12 @@ class IntegrityChecker(object):
 
     def _skip_checks(self, function):
         # type: (FunctionDescription) -> bool
-        no_docsting = function.docstring is None
-        skip_by_regex = (
-            self.config.ignore_regex and
-            re.match(self.config.ignore_regex, function.name)
+        return is_skipped(
+            function.name,
+            function.docstring,
+            function.is_property,
+            self.config,
         )
-        skip_property = (
-            self.config.ignore_properties and function.is_property
-        )
-
-        return bool(no_docsting or skip_by_regex or skip_property)
 
     def _check_parameter_types(self, docstring, function):
         # type: (BaseDocstring, FunctionDescription) -> None
@@ -241,7 +238,7 @@ class IntegrityChecker(object):
         if function.is_abstract:
             return
 
-        doc_yield = docstring.get_section(Sections.YIELDS_SECTION)
+        doc_yield = docstring.has_section(Sections.YIELDS_SECTION)
         fun_yield = function.has_yield
         ignore_missing = self._ignore_error(docstring, MissingYieldError)
         ignore_excess = self._ignore_error(docstring, ExcessYieldError)
@@ -272,7 +269,7 @@ class IntegrityChecker(object):
         if function.has_empty_return:
             return
 
-        doc_return = docstring.get_section(Sections.RETURNS_SECTION)
+        doc_return = docstring.has_section(Sections.RETURNS_SECTION)
         fun_return = function.has_return
         ignore_missing = self._ignore_error(docstring, MissingReturnError)
         ignore_excess = self._ignore_error(docstring, ExcessReturnError)
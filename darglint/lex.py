@@ -1,5 +1,6 @@
 """Defines a function for lexing a comment, `lex`."""
 
+import re
 from typing import (
     Iterator,
     List,
@@ -7,7 +8,7 @@ from typing import (
 )
 from .custom_assert import Assert
 from .peaker import Peaker
-from .token import Token, TokenType
+from .token import Token, TokenBuffer, TokenType
 from .config import (
     get_config,
 )
@@ -93,7 +94,7 @@ def lex(program):
 
     """
     extra = ''  # Extra characters which are pulled but unused from a check.
-    peaker = Peaker((x for x in program or []))  # the stream
+    peaker = Peaker(program or '')  # the stream
     line_number = 0
 
     # Set the amount of spaces which count as an indent.
@@ -240,3 +241,116 @@ def condense(tokens):
     ret.append(curr)
 
     return ret
+
+
+# Each kind of lexeme, in the same order as the checks in `lex`.
+# (The character classes don't overlap, so the order doesn't
+# actually matter.)  Separators are whitespace other than
+# spaces and newlines.
+_LEXEMES = re.compile('|'.join([
+    r'(?P<spaces> +)',
+    r'(?P<newline>\n)',
+    r'(?P<colon>:)',
+    r'(?P<hash>#)',
+    r'(?P<lparen>\()',
+    r'(?P<rparen>\))',
+    r'(?P<separators>[^\S \n]+)',
+    r'(?P<word>[^\s:#()]+)',
+]))
+
+_PUNCTUATION = {
+    'colon': TokenType.COLON,
+    'hash': TokenType.HASH,
+    'lparen': TokenType.LPAREN,
+    'rparen': TokenType.RPAREN,
+}
+
+
+def tokenize(program):
+    # type: (str) -> TokenBuffer
+    """Lex and condense the string in a single pass.
+
+    This produces the same tokens as `condense(lex(program))`, but
+    matches each lexeme with a single regular expression, rather
+    than one character at a time, and condenses the tokens as they
+    are found.
+
+    Args:
+        program: The program to lex, as a string.
+
+    Returns:
+        A buffer of condensed tokens.
+
+    """
+    ret = TokenBuffer(program or '')
+    if not program:
+        return ret
+    indentation = get_config().indentation
+    line_number = 0
+
+    # The token which is still being built, and the number of words
+    # which make it up, if it's a word.  Its value is read lazily
+    # from the span of the program it covers.
+    curr_type = None  # type: Optional[TokenType]
+    curr_start = 0
+    curr_end = 0
+    curr_line = 0
+    words = 0
+    encountered_noqa = False
+
+    for match in _LEXEMES.finditer(program):
+        kind = match.lastgroup
+        value = match.group()
+        if kind == 'word' and words and not encountered_noqa:
+            if value not in KEYWORDS and value.count('-') != len(value):
+                curr_end = match.end()
+                words += 1
+                continue
+        if kind == 'separators':
+            continue
+        if kind == 'spaces':
+            indents = len(value) // indentation
+        else:
+            indents = 1
+        for k in range(indents):
+            if curr_type is not None:
+                ret.append_span(
+                    curr_start,
+                    curr_end,
+                    curr_type,
+                    curr_line,
+                    joined=words > 1,
+                )
+            words = 0
+            curr_start = match.start()
+            curr_end = match.end()
+            curr_line = line_number
+            if kind == 'word':
+                if value in KEYWORDS:
+                    curr_type = KEYWORDS[value]
+                    # Only a noqa after the first token stops the
+                    # words which follow it from being joined.
+                    if value == 'noqa' and len(ret):
+                        encountered_noqa = True
+                elif value.count('-') == len(value):
+                    curr_type = TokenType.HEADER
+                else:
+                    curr_type = TokenType.WORD
+                    words = 1
+            elif kind == 'spaces':
+                curr_start += k * indentation
+                curr_end = curr_start + indentation
+                curr_type = TokenType.INDENT
+            elif kind == 'newline':
+                curr_type = TokenType.NEWLINE
+            else:
+                curr_type = _PUNCTUATION[kind]
+        if kind == 'newline':
+            line_number += 1
+            encountered_noqa = False
+
+    if curr_type is not None:
+        ret.append_span(
+            curr_start, curr_end, curr_type, curr_line, joined=words > 1,
+        )
+    return ret
@@ -6,6 +6,7 @@ from typing import (
     Iterator,
     Optional,
     List,
+    Sequence,
     Tuple,
 )
 
@@ -17,6 +18,11 @@ from .token import (
 WHITESPACE = {TokenType.INDENT, TokenType.NEWLINE}
 
 
+# The annotations of a node without any.  It's shared, so it
+# shouldn't be changed.
+EMPTY_ANNOTATIONS = ()  # type: Tuple[Any, ...]
+
+
 # A best guess at the maximum height of a docstring tree,
 # for use in recursion bounds checking.
 MAX_TREE_HEIGHT = 300
@@ -25,19 +31,32 @@ MAX_TREE_HEIGHT = 300
 class CykNode(object):
     """A node for use in a cyk parse."""
 
+    # The trees for every docstring in a file are kept until the
+    # file's errors are reported, so nodes are kept small.  (See
+    # `integration_tests/memory_benchmark.py`.)
+    __slots__ = (
+        'symbol',
+        'lchild',
+        'rchild',
+        'value',
+        'annotations',
+        'weight',
+        '_line_number_cache',
+    )
+
     def __init__(self,
                  symbol,
                  lchild=None,
                  rchild=None,
                  value=None,
-                 annotations=list(),
+                 annotations=EMPTY_ANNOTATIONS,
                  weight=0):
-        # type: (str, Optional[CykNode], Optional[CykNode], Optional[Token], List[Any], int) -> None  # noqa: E501
+        # type: (str, Optional[CykNode], Optional[CykNode], Optional[Token], Sequence[Any], int) -> None  # noqa: E501
         self.symbol = symbol
         self.lchild = lchild
         self.rchild = rchild
         self.value = value
-        self.annotations = annotations
+        self.annotations = annotations or EMPTY_ANNOTATIONS
         self._line_number_cache = None  # type: Optional[Tuple[int, int]]
 
         # If there is an explicit weight, we definitely want to use
@@ -46,14 +65,12 @@ class CykNode(object):
         # If no weight was given, but the children have weights, then
         # we probably want to give preference to this node over a node
         # which has no weights at all.
-        if weight:
-            self.weight = weight
-        else:
-            self.weight = max([
-                0,
-                self.lchild.weight if self.lchild else 0,
-                self.rchild.weight if self.rchild else 0,
-            ])
+        if not weight:
+            if lchild is not None and lchild.weight > weight:
+                weight = lchild.weight
+            if rchild is not None and rchild.weight > weight:
+                weight = rchild.weight
+        self.weight = weight
 
     def __repr__(self):
         if hasattr(self.value, 'token_type'):
@@ -83,11 +100,17 @@ class CykNode(object):
 
     def in_order_traverse(self):
         # type: () -> Iterator[CykNode]
-        if self.lchild:
-            yield from self.lchild.in_order_traverse()
-        yield self
-        if self.rchild:
-            yield from self.rchild.in_order_traverse()
+        # An explicit stack, so that yielding a node doesn't resume
+        # a generator for every level above it.
+        stack = list()  # type: List[CykNode]
+        curr = self  # type: Optional[CykNode]
+        while stack or curr is not None:
+            while curr is not None:
+                stack.append(curr)
+                curr = curr.lchild
+            curr = stack.pop()
+            yield curr
+            curr = curr.rchild
 
     def breadth_first_walk(self):
         queue = deque([self])
@@ -108,7 +131,7 @@ class CykNode(object):
 
     def walk(self):
         # type: () -> Iterator['CykNode']
-        yield from self.in_order_traverse()
+        return self.in_order_traverse()
 
     def equals(self, other):
         # type: (Optional['CykNode']) -> bool
@@ -124,6 +147,22 @@ class CykNode(object):
             return False
         return True
 
+    def has_text(self):
+        # type: () -> bool
+        """Return whether the reconstructed string would have any text.
+
+        This stops at the first leaf which isn't whitespace, so it's
+        cheaper than reconstructing the string.
+
+        Returns:
+            True if any leaf under this node has a non-whitespace value.
+
+        """
+        for node in self.walk():
+            if node.value and node.value.value.strip():
+                return True
+        return False
+
     def reconstruct_string(self, strictness=0):
         # type: (int) -> str
         """Reconstruct the docstring.
@@ -147,7 +186,7 @@ class CykNode(object):
         # window.
         window_size = 3
         window = deque(maxlen=window_size)  # type: deque
-        source = self.in_order_traverse()
+        source = self.walk()
 
         # Fill the buffer.
         while len(window) < window_size:
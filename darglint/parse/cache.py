@@ -0,0 +1,243 @@
+"""A cache of the parse results for sections.
+
+The same sections appear again and again in a codebase: `Returns:`
+sections with the same description, identical `Raises:` sections
+in sibling methods, and so on.  Since the result of parsing a
+section only depends on the parser and on the types, values and
+relative positions of its tokens, we can parse each distinct
+section once, and rebuild the tree for its repeats.
+
+The rebuilt tree refers to the tokens which were actually passed
+in, so that line numbers (and anything else about the tokens)
+are those of the repeat, rather than of the section which was
+parsed.
+
+"""
+
+from collections import (
+    OrderedDict,
+)
+import threading
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..node import (
+    CykNode,
+)
+from ..token import (
+    Token,
+    TokenBuffer,
+)
+
+
+# The default number of sections to keep.
+MAX_SECTIONS = 1024
+
+
+# A placeholder in the cache for sections which failed to parse.
+_FAILED = object()
+
+
+def _signature(tokens):
+    # type: (List[Token]) -> Tuple[Any, ...]
+    if isinstance(tokens, TokenBuffer):
+        # The buffer can tell us without reading the token values.
+        signature = tokens.signature()
+        if signature is not None:
+            return signature
+    base = tokens[0].line_number
+    return tuple(
+        (token.token_type, token.value, token.line_number - base)
+        for token in tokens
+    )
+
+
+def _leaf_indices(node, tokens):
+    # type: (CykNode, List[Token]) -> Dict[int, int]
+    """Find the position of each leaf's token in the section.
+
+    Args:
+        node: The root of the parse tree.
+        tokens: The section which was parsed.
+
+    Returns:
+        A map from the id of each leaf's token to its index in
+        the section.  Tokens which don't appear in the section
+        (if the parser created any) are left out.
+
+    """
+    positions = {id(token): i for i, token in enumerate(tokens)}
+    indices = dict()  # type: Dict[int, int]
+    stack = [node]
+    while stack:
+        curr = stack.pop()
+        if curr.value is not None and id(curr.value) in positions:
+            indices[id(curr.value)] = positions[id(curr.value)]
+        if curr.lchild:
+            stack.append(curr.lchild)
+        if curr.rchild:
+            stack.append(curr.rchild)
+    return indices
+
+
+class _Entry(object):
+
+    def __init__(self, node, tokens):
+        # type: (Any, List[Token]) -> None
+        self.node = node
+        self.base = tokens[0].line_number
+        if node is _FAILED:
+            self.indices = dict()  # type: Dict[int, int]
+        else:
+            self.indices = _leaf_indices(node, tokens)
+
+    def _rebase(self, token, tokens):
+        # type: (Token, List[Token]) -> Token
+        index = self.indices.get(id(token))
+        if index is not None:
+            return tokens[index]
+        return Token(
+            value=token.value,
+            token_type=token.token_type,
+            line_number=(
+                token.line_number - self.base + tokens[0].line_number
+            ),
+        )
+
+    def rebuild(self, tokens):
+        # type: (List[Token]) -> Optional[CykNode]
+        """Copy the cached tree, using the given tokens.
+
+        Args:
+            tokens: A section identical to the cached one, except,
+                perhaps, for its position in the docstring.
+
+        Returns:
+            A copy of the cached tree, whose leaves refer to the
+            given tokens.
+
+        """
+        if self.node is _FAILED:
+            return None
+
+        def copy(node):
+            # type: (CykNode) -> CykNode
+            return CykNode(
+                node.symbol,
+                value=(
+                    self._rebase(node.value, tokens)
+                    if node.value is not None else None
+                ),
+                annotations=node.annotations,
+                weight=node.weight,
+            )
+
+        root = copy(self.node)
+        stack = [(self.node, root)]
+        while stack:
+            original, node = stack.pop()
+            if original.lchild:
+                node.lchild = copy(original.lchild)
+                stack.append((original.lchild, node.lchild))
+            if original.rchild:
+                node.rchild = copy(original.rchild)
+                stack.append((original.rchild, node.rchild))
+        return root
+
+
+class SectionCache(object):
+    """A bounded, least-recently-used cache of parsed sections.
+
+    Docstrings can be checked in several threads at once (see
+    `IntegrityChecker`), so the cache's state is only changed while
+    holding its lock.  The sections themselves are parsed without it.
+    The cached trees are never handed out: every caller gets its
+    own copy.
+
+    """
+
+    def __init__(self, maxsize=MAX_SECTIONS):
+        # type: (int) -> None
+        """Create a new, empty cache.
+
+        Args:
+            maxsize: The most sections to keep.  Once the cache
+                is full, the least recently used section is dropped.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+
+        # Each section is usually tried with several parsers in a
+        # row, so we keep the signature of the last one.
+        self._last = None  # type: Optional[Tuple[List[Token], Tuple[Any, ...]]]  # noqa: E501
+
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._entries)
+
+    def clear(self):
+        # type: () -> None
+        """Remove every section, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._last = None
+            self.hits = 0
+            self.misses = 0
+
+    def parse(self, parser, parse, tokens):
+        # type: (Hashable, Callable[[List[Token]], Optional[CykNode]], List[Token]) -> Optional[CykNode]  # noqa: E501
+        """Parse the section, unless an identical one has been parsed.
+
+        Args:
+            parser: Identifies the parser: anything which affects the
+                result of the parse, other than the tokens.  (Usually
+                the grammar.)
+            parse: Parses the section, if it isn't in the cache.
+            tokens: The section to parse.
+
+        Returns:
+            The result of parsing the section.  This is a copy of the
+            cached tree, so it can be changed by the caller.
+
+        """
+        if not tokens or self.maxsize <= 0:
+            return parse(tokens)
+        with self._lock:
+            last = self._last
+            if last is None or last[0] is not tokens:
+                last = (tokens, _signature(tokens))
+                self._last = last
+            key = (parser, last[1])
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            else:
+                self.misses += 1
+        if entry is None:
+            node = parse(tokens)
+            entry = _Entry(
+                node if node is not None else _FAILED,
+                tokens,
+            )
+            with self._lock:
+                self._entries[key] = entry
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return entry.rebuild(tokens)
+
+
+# The cache used by the parser combinator.
+section_cache = SectionCache()
@@ -26,6 +26,283 @@ speed. (It actually made it worse.)
 
 """
 
+import inspect
+from itertools import (
+    islice,
+)
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from . import cyk_numpy
+from .cache import (
+    section_cache,
+)
+from .cyk import (
+    parse as cyk_parse,
+    recognize_start,
+)
+from .grammar import (  # noqa: F401
+    BaseGrammar,
+    union,
+)
+from ..config import (
+    get_config,
+    get_logger,
+    CykBackend,
+)
+from ..node import (  # noqa: F401
+    CykNode,
+)
+from ..token import (  # noqa: F401
+    Token,
+    TokenBuffer,
+    token_types,
+)
+
+
+# Whether we've already warned that the NumPy backend was
+# requested, but NumPy isn't installed.
+_warned_numpy_missing = False
+
+
+# The shortest section the NumPy backend is used for.  Below this,
+# its fixed cost outweighs what it saves, and the default backend
+# (which rejects most sections with the cheaper recognizer) is
+# faster.  (See `integration_tests/cyk_backend_benchmark.py`.)
+NUMPY_MIN_TOKENS = 20
+
+
+def _use_numpy(tokens):
+    # type: (List[Token]) -> bool
+    global _warned_numpy_missing
+    if get_config().cyk_backend != CykBackend.NUMPY:
+        return False
+    if len(tokens) < NUMPY_MIN_TOKENS:
+        return False
+    if cyk_numpy.available():
+        return True
+    if not _warned_numpy_missing:
+        get_logger().warning(
+            'The numpy CYK backend was requested, but numpy is not '
+            'installed.  Falling back to the python backend.'
+        )
+        _warned_numpy_missing = True
+    return False
+
+
+def parse_if_recognized(grammar, tokens):
+    # type: (BaseGrammar, List[Token]) -> Optional[CykNode]
+    """Parse the tokens with the grammar, if the grammar derives them.
+
+    Most grammars tried for a section fail, so we first run the
+    (much cheaper) recognizer, and only perform the full, weighted
+    parse for the grammar which accepts the section.  If the grammar
+    has several start symbols, the recognizer also tells us which
+    is preferred, so the parse only has to consider it.
+
+    If the NumPy backend is configured, it's used instead for
+    sections of at least `NUMPY_MIN_TOKENS` tokens.  (It recognizes
+    the section while parsing it, at little cost.)
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+
+    Returns:
+        The parse tree, or None if the grammar doesn't derive
+        the tokens.
+
+    """
+    if _use_numpy(tokens):
+        return cyk_numpy.parse(grammar, tokens)
+    start = recognize_start(grammar, tokens)
+    if start is None:
+        return None
+    return cyk_parse(grammar, tokens, start)
+
+
+def to_parsers(lookup):
+    # type: (Callable[..., List[Any]]) -> Callable[..., Iterator[Callable]]
+    """Convert a lookup of grammars into a lookup of parse functions.
+
+    Grammars which are tried one after the other are merged into
+    a single grammar (see `grammar.union`), so that the section is
+    only parsed once for all of them.
+
+    The results of each parser are cached (see `cache.section_cache`),
+    so that repeated sections are only parsed once.
+
+    Args:
+        lookup: For a given section, returns a list of grammars
+            or parse functions.
+
+    Returns:
+        A lookup which, for a given section, yields parse functions.
+
+    """
+    def to_parser(grammars):
+        # type: (List[Any]) -> Callable
+        if len(grammars) == 1:
+            grammar = grammars[0]
+        else:
+            grammar = union(*grammars)
+        return lambda x: section_cache.parse(
+            grammar,
+            lambda y: parse_if_recognized(grammar, y),
+            x,
+        )
+
+    def to_cached(parse):
+        # type: (Callable) -> Callable
+        return lambda x: section_cache.parse(parse, parse, x)
+
+    def mapped_lookup(section, section_index=-1):
+        grammars = list()  # type: List[Any]
+        for grammar in lookup(section, section_index):
+            if inspect.isclass(grammar):
+                grammars.append(grammar)
+                continue
+            if grammars:
+                yield to_parser(grammars)
+                grammars = list()
+            yield to_cached(grammar)
+        if grammars:
+            yield to_parser(grammars)
+    return mapped_lookup
+
+
+class SuccessStatistics(object):
+    """Which parser succeeded for each shape of section.
+
+    Most sections in a codebase share a handful of shapes, and a
+    section is usually parsed by the same parser as the last section
+    of the same shape.  So the parser which succeeded last time is
+    tried first, and the parsers before it are only tried if it
+    fails.  (Since the parsers can depend on more than the token
+    types, the prediction is never trusted to fail: if the predicted
+    parser doesn't succeed, every parser is tried, in order.)
+
+    This is only used if `adaptive_parsing` is configured, since,
+    if more than one parser could succeed for a section, the
+    predicted parser may not be the first in order.
+
+    """
+
+    # The most shapes of sections to remember.
+    MAX_SHAPES = 4096
+
+    def __init__(self):
+        # type: () -> None
+        self.winners = dict()  # type: Dict[Hashable, int]
+
+        # The number of sections parsed by the predicted parser, and
+        # the number of parsers that let us skip.
+        self.predicted = 0
+        self.skipped = 0
+
+    def clear(self):
+        # type: () -> None
+        """Forget every section, and reset the counters."""
+        self.winners.clear()
+        self.predicted = 0
+        self.skipped = 0
+
+    def key(self, top, section, index):
+        # type: (Callable, List[Token], int) -> Hashable
+        """Get the shape of the section.
+
+        Args:
+            top: The top-level parser, which identifies the style.
+            section: The section.
+            index: The index of the section in the docstring.  (The
+                first section can be a short description.)
+
+        Returns:
+            A key for the section, which is the same for every
+            section with the same token types, in the same position.
+
+        """
+        if isinstance(section, TokenBuffer):
+            shape = section.type_codes().tobytes()  # type: Hashable
+        else:
+            shape = tuple(token_types(section))
+        return (top, index == 0, shape)
+
+    def get(self, key):
+        # type: (Hashable) -> Optional[int]
+        """Get the index of the parser which succeeded.
+
+        Args:
+            key: The shape of the section.
+
+        Returns:
+            The index of the parser which last succeeded for this
+            shape, or None if none has.
+
+        """
+        return self.winners.get(key)
+
+    def record(self, key, winner):
+        # type: (Hashable, int) -> None
+        if key in self.winners or len(self.winners) < self.MAX_SHAPES:
+            self.winners[key] = winner
+
+
+# The statistics used by the parser combinator.
+success_statistics = SuccessStatistics()
+
+
+def _parse_section(parsers, section):
+    # type: (Iterator[Callable], List[Token]) -> Tuple[Optional[CykNode], int]
+    for i, parse in enumerate(parsers):
+        parsed = parse(section)
+        if parsed:
+            return parsed, i
+    return None, -1
+
+
+def parse_section(top, lookup, section, index):
+    # type: (Callable, Callable[..., Iterator[Callable]], List[Token], int) -> Optional[CykNode]  # noqa: E501
+    """Parse a single section from the top-level parser.
+
+    Args:
+        top: The top-level parser which produced the section.
+        lookup: For a given section, returns a list of possible
+            parsers.
+        section: The section to parse.
+        index: The index of the section in the docstring.
+
+    Returns:
+        The result of the first parser to succeed (or, if adaptive
+        parsing is configured, of the predicted parser, if it
+        succeeds), or None if none of them did.
+
+    """
+    if not get_config().adaptive_parsing:
+        parsed, _ = _parse_section(lookup(section, index), section)
+        return parsed
+    key = success_statistics.key(top, section, index)
+    winner = success_statistics.get(key)
+    if winner is not None:
+        parse = next(islice(lookup(section, index), winner, None), None)
+        parsed = parse(section) if parse else None
+        if parsed:
+            success_statistics.predicted += 1
+            success_statistics.skipped += winner
+            return parsed
+    parsed, winner = _parse_section(lookup(section, index), section)
+    if winner >= 0:
+        success_statistics.record(key, winner)
+    return parsed
+
 
 def parser_combinator(top, lookup, combinator, tokens):
     """Parse the given tokens, combining in the given fashion.
@@ -47,11 +324,7 @@ def parser_combinator(top, lookup, combinator, tokens):
     sections = top(tokens)
     parsed_sections = list()
     for i, section in enumerate(sections):
-        parsed = None
-        for parse in lookup(section, i):
-            parsed = parse(section)
-            if parsed:
-                break
+        parsed = parse_section(top, lookup, section, i)
         if not parsed:
             return None
         parsed_sections.append(parsed)
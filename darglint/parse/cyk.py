@@ -16,24 +16,378 @@ article, https://en.wikipedia.org/wiki/CYK_algorithm.
 
 """
 
-from typing import (
+from typing import (  # noqa: F401
+    Any,
+    Dict,
     Optional,
     List,
+    Tuple,
 )
 
 from .grammar import (
     BaseGrammar,
+    CompiledGrammar,
 )
-from ..token import (
+from ..token import (  # noqa: F401
     Token,
+    token_types,
 )
 from ..node import (
     CykNode,
 )
 
 
-def parse(grammar, tokens):
+def _materialize(compiled, chart, tokens, length, start, a):
+    # type: (CompiledGrammar, List[List[Optional[Dict[int, Any]]]], List[Token], int, int, int) -> CykNode  # noqa: E501
+    """Build the parse tree for the nonterminal over the given span.
+
+    Args:
+        compiled: The grammar which filled the chart.
+        chart: The chart of backpointers.
+        tokens: The tokens which were parsed.
+        length: The length of the span.
+        start: The first token in the span.
+        a: The nonterminal which derived the span.
+
+    Returns:
+        The root of the parse tree.
+
+    """
+    names = compiled.names
+
+    def create(length, start, a):
+        # type: (int, int, int) -> CykNode
+        if length == 1:
+            return CykNode(
+                names[a],
+                value=tokens[start],
+                weight=chart[0][start][a],  # type: ignore
+            )
+        weight, _, _, _, annotations = chart[length - 1][start][a]  # type: ignore  # noqa: E501
+        return CykNode(
+            names[a],
+            annotations=annotations,
+            weight=weight,
+        )
+
+    # We build the tree top-down, with an explicit stack, since
+    # the tree can be deeper than the recursion limit allows.
+    root = create(length, start, a)
+    stack = [(root, length, start, a)]
+    while stack:
+        node, length, start, a = stack.pop()
+        if length == 1:
+            continue
+        _, p, b, c, _ = chart[length - 1][start][a]  # type: ignore
+        node.lchild = create(p, start, b)
+        node.rchild = create(length - p, start + p, c)
+        stack.append((node.lchild, p, start, b))
+        stack.append((node.rchild, length - p, start + p, c))
+    return root
+
+
+def _get_edge_masks(compiled, types):
+    # type: (CompiledGrammar, List[Any]) -> Tuple[List[int], List[int]]
+    """Get the nonterminals which could begin or end at each token.
+
+    Args:
+        compiled: The grammar being parsed with.
+        types: The type of each token being parsed.
+
+    Returns:
+        For each token, the mask of nonterminals which can begin
+        with its type, and the mask of those which can end with it.
+
+    """
+    first_masks = compiled.first_masks
+    last_masks = compiled.last_masks
+    return (
+        [first_masks.get(token_type, 0) for token_type in types],
+        [last_masks.get(token_type, 0) for token_type in types],
+    )
+
+
+def _could_derive(compiled, firsts, lasts, n):
+    # type: (CompiledGrammar, List[int], List[int], int) -> bool
+    """Check whether a start symbol could derive the whole sentence.
+
+    This is only a necessary condition: a start symbol has to
+    be able to begin with the first token, end with the last,
+    and derive a sentence of this length.  It lets us reject
+    many sentences without filling the chart.
+
+    Args:
+        compiled: The grammar being parsed with.
+        firsts: The masks of nonterminals which can begin at
+            each token.
+        lasts: The masks of nonterminals which can end at each
+            token.
+        n: The number of tokens.
+
+    Returns:
+        False if no start symbol can derive the sentence.
+
+    """
+    mask = firsts[0] & lasts[n - 1] & compiled.length_mask(n)
+    return bool(mask & compiled.start_mask)
+
+
+def parse(grammar, tokens, start=None):
+    # type: (BaseGrammar, List[Token], Optional[int]) -> Optional[CykNode]
+    """Parse the tokens using a sparse chart.
+
+    Each span of the chart only records the nonterminals which
+    were actually derived for it, as a map from the nonterminal
+    to a backpointer describing the best derivation found so far.
+    Most spans derive few (or no) nonterminals, so this avoids
+    allocating a slot for every production in every span, as
+    `parse_dense` does.  The parse tree is only built for the
+    winning derivation of the start symbol.
+
+    Rather than trying every derivation for each split of a
+    span, we look up the derivations by the pairs of children
+    actually present in the two halves.  (See `CompiledGrammar`.)
+
+    Spans which no nonterminal could derive, given the types of
+    their first and last tokens and their length, are skipped
+    entirely.
+
+    If the grammar has several start symbols (see `grammar.union`),
+    the tree is built for the first of them which derives the
+    tokens.
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+        start: If given, the only start symbol to parse for.  Only
+            the nonterminals which can occur in its parse trees
+            are added to the chart.  (See `recognize_start`.)
+
+    Returns:
+        The root of the parse tree, if the tokens are a member
+        of the grammar's language, otherwise None.
+
+    """
+    if not tokens:
+        return None
+    compiled = grammar.compile()
+    binary = compiled.binary
+    n = len(tokens)
+
+    # chart[l - 1][s] describes the nonterminals derived for the
+    # span of length l starting at token s, or is None if there
+    # are none.
+    #
+    # The first row holds the weights of the nonterminals which
+    # derive the token, straight from the grammar's terminal table.
+    # (So it's shared between all tokens of the same type.)  The
+    # other rows hold backpointers, of the form
+    #
+    #     (weight, split, left child, right child, annotations)
+    #
+    # where the weight is that which the node would have.
+    chart = [
+        [None] * (n - l) for l in range(n)
+    ]  # type: List[List[Optional[Dict[int, Any]]]]
+    terminal_table = compiled.terminal_table
+    types = token_types(tokens)
+    chart[0] = [
+        terminal_table.get(token_type) for token_type in types
+    ]
+    firsts, lasts = _get_edge_masks(compiled, types)
+    if not _could_derive(compiled, firsts, lasts, n):
+        return None
+    starts = compiled.starts
+    reachable = -1
+    if start is not None:
+        starts = [start]
+        reachable = compiled.reachable_masks[start]
+    for l in range(2, n + 1):
+        row = chart[l - 1]
+        length_mask = (
+            compiled.length_mask(l) & compiled.binary_mask & reachable
+        )
+        for s in range(n - l + 1):
+            if not firsts[s] & lasts[s + l - 1] & length_mask:
+                continue
+            cell = None  # type: Optional[Dict[int, Any]]
+            for p in range(1, l):
+                left = chart[p - 1][s]
+                if not left:
+                    continue
+                right = chart[l - p - 1][s + p]
+                if not right:
+                    continue
+                matches = list()
+                for b in left:
+                    by_right = binary.get(b)
+                    if not by_right:
+                        continue
+                    for c in right:
+                        rules = by_right.get(c)
+                        if rules:
+                            for rule in rules:
+                                if reachable >> rule[1] & 1:
+                                    matches.append((rule, b, c))
+                if not matches:
+                    continue
+
+                # Apply the rules in the order they appear in the
+                # grammar, so that ties are broken consistently.
+                if len(matches) > 1:
+                    matches.sort(key=lambda x: x[0][0])
+                if cell is None:
+                    cell = dict()
+                for (_, a, annotations, weight), b, c in matches:
+                    old = cell.get(a)
+                    if old and old[0] > weight:
+                        continue
+                    if not weight:
+                        # A node without an explicit weight takes
+                        # on the weight of its heaviest child.
+                        weight = max(
+                            0,
+                            left[b] if p == 1 else left[b][0],
+                            right[c] if p == l - 1 else right[c][0],
+                        )
+                    cell[a] = (weight, p, b, c, annotations)
+            row[s] = cell
+    root = chart[n - 1][0]
+    if not root:
+        return None
+    for a in starts:
+        if a in root:
+            return _materialize(compiled, chart, tokens, n, 0, a)
+    return None
+
+
+def _recognize(compiled, tokens):
+    # type: (CompiledGrammar, List[Token]) -> int
+    """Get the nonterminals which derive the tokens.
+
+    This fills the same chart as `parse`, but each span is
+    represented only by a bitmask of the nonterminals which
+    derive it.  Since no weights are tracked and no nodes or
+    backpointers are built, it's a cheap way to reject a
+    grammar before parsing with it.
+
+    Args:
+        compiled: The grammar to recognize with.
+        tokens: The tokens to recognize.
+
+    Returns:
+        A mask of the nonterminals which derive the whole of the
+        tokens.  (Or 0, if no start symbol could.)
+
+    """
+    if not tokens or not compiled.starts:
+        return 0
+    right_masks = compiled.right_masks
+    binary_masks = compiled.binary_masks
+    n = len(tokens)
+    terminal_masks = compiled.terminal_masks
+    types = token_types(tokens)
+    chart = [
+        [terminal_masks.get(token_type, 0) for token_type in types]
+    ] + [
+        [0] * (n - l) for l in range(1, n)
+    ]
+
+    # The same pairs of masks occur over and over again (for example,
+    # in a run of words), so we remember what each pair derives.
+    combined = dict()  # type: Dict[Tuple[int, int], int]
+
+    firsts, lasts = _get_edge_masks(compiled, types)
+    if not _could_derive(compiled, firsts, lasts, n):
+        return 0
+    for l in range(2, n + 1):
+        row = chart[l - 1]
+        length_mask = compiled.length_mask(l) & compiled.binary_mask
+        for s in range(n - l + 1):
+            if not firsts[s] & lasts[s + l - 1] & length_mask:
+                continue
+            mask = 0
+            for p in range(1, l):
+                left = chart[p - 1][s]
+                if not left:
+                    continue
+                right = chart[l - p - 1][s + p]
+                if not right:
+                    continue
+                derived = combined.get((left, right))
+                if derived is None:
+                    derived = 0
+                    key = (left, right)
+                    while left:
+                        lowest = left & -left
+                        left ^= lowest
+                        b = lowest.bit_length() - 1
+                        if not right & right_masks[b]:
+                            continue
+                        for c_bit, parents in binary_masks[b]:
+                            if right & c_bit:
+                                derived |= parents
+                    combined[key] = derived
+                mask |= derived
+            row[s] = mask
+    return chart[n - 1][0]
+
+
+def recognize(grammar, tokens):
+    # type: (BaseGrammar, List[Token]) -> bool
+    """Determine whether the grammar derives the tokens.
+
+    Args:
+        grammar: The grammar to recognize with.
+        tokens: The tokens to recognize.
+
+    Returns:
+        True if the tokens are a member of the grammar's language,
+        otherwise false.
+
+    """
+    compiled = grammar.compile()
+    return bool(_recognize(compiled, tokens) & compiled.start_mask)
+
+
+def recognize_start(grammar, tokens):
+    # type: (BaseGrammar, List[Token]) -> Optional[int]
+    """Get the preferred start symbol which derives the tokens.
+
+    Args:
+        grammar: The grammar to recognize with.
+        tokens: The tokens to recognize.
+
+    Returns:
+        The first of the grammar's start symbols which derives
+        the tokens, or None if none of them do.
+
+    """
+    compiled = grammar.compile()
+    derived = _recognize(compiled, tokens)
+    for start in compiled.starts:
+        if derived >> start & 1:
+            return start
+    return None
+
+
+def parse_dense(grammar, tokens):
     # type: (BaseGrammar, List[Token]) -> Optional[CykNode]
+    """Parse the tokens using a dense, n x n x r chart.
+
+    This is the original implementation of `parse`.  It is kept
+    as a reference, for testing and benchmarking the sparse
+    implementation against.
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+
+    Returns:
+        The root of the parse tree, if the tokens are a member
+        of the grammar's language, otherwise None.
+
+    """
     if not tokens:
         return None
     n = len(tokens)
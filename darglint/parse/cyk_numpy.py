@@ -0,0 +1,305 @@
+"""A vectorized implementation of the CYK algorithm, using NumPy.
+
+NumPy is an optional dependency: if it isn't installed, `available`
+returns False, and `darglint.parse.cyk` should be used instead.
+
+For each span, the chart records which rules have a left child
+deriving it (by the span's length and start), and which have a right
+child deriving it (by its length and end), packed into bits.  The
+children of every split of a span are then slices of the chart, so
+each row is computed with a handful of array operations over every
+split and every binary rule at once, rather than by visiting each
+split in turn.
+
+The weight and winning derivation of every span and nonterminal
+are computed along with its row, from every split and rule whose
+children derive the span.  (Whether or not the span could appear
+in a parse tree for the start symbol.)  Ties are broken in the same
+order as in `darglint.parse.cyk.parse`, and since the result is
+always identical to its, the two can be used interchangeably.
+
+"""
+
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from .grammar import (  # noqa: F401
+    BaseGrammar,
+    CompiledGrammar,
+)
+from ..node import (  # noqa: F401
+    CykNode,
+)
+from ..token import (  # noqa: F401
+    Token,
+    token_types,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def available():
+    # type: () -> bool
+    """Return true if NumPy is installed.
+
+    Returns:
+        True if this backend can be used, otherwise false.
+
+    """
+    return np is not None
+
+
+class _Tables(object):
+    """The compiled grammar, as arrays over its binary rules."""
+
+    def __init__(self, compiled):
+        # type: (CompiledGrammar) -> None
+        r = len(compiled.symbols)
+        rules = sorted(
+            (rule, b, c)
+            for b, by_right in compiled.binary.items()
+            for c, rules in by_right.items()
+            for rule in rules
+        )
+
+        # The smallest types which can hold a rule's index, and any
+        # weight a node could have.  (A node's weight is either its
+        # rule's weight, or one of its children's, or zero.)
+        self.rule_type = np.min_scalar_type(max(len(rules) - 1, 0))
+        weights = [0] + [rule[3] for rule, _, _ in rules] + [
+            weight
+            for derived in compiled.terminal_table.values()
+            for weight in derived.values()
+        ]
+        self.weight_type = np.result_type(
+            np.min_scalar_type(min(weights)),
+            np.min_scalar_type(max(weights)),
+        )
+
+        # The rules, in the order they are declared.
+        self.parents = np.array(
+            [rule[1] for rule, _, _ in rules], dtype=np.intp,
+        )
+        self.lefts = np.array([b for _, b, _ in rules], dtype=np.intp)
+        self.rights = np.array([c for _, _, c in rules], dtype=np.intp)
+        self.weights = np.array(
+            [rule[3] for rule, _, _ in rules], dtype=self.weight_type,
+        )
+        self.annotations = [rule[2] for rule, _, _ in rules]
+
+        self.terminals = dict()  # type: Dict[Any, Any]
+        for token_type, derived in compiled.terminal_table.items():
+            row = np.zeros(r, dtype=bool)
+            row[list(derived)] = True
+            self.terminals[token_type] = row
+
+
+_tables = dict()  # type: Dict[CompiledGrammar, _Tables]
+
+
+def _get_tables(compiled):
+    # type: (CompiledGrammar) -> _Tables
+    if compiled not in _tables:
+        _tables[compiled] = _Tables(compiled)
+    return _tables[compiled]
+
+
+def _best(starts, parents, splits, rules, raw, node):
+    # type: (Any, Any, Any, Any, Any, Any) -> Any
+    """Choose the winning derivation for each span and nonterminal.
+
+    The candidates must be sorted by span, nonterminal, split and
+    then rule.  As in `cyk.parse`, each candidate replaces the one
+    before it, unless the previous candidate's weight is greater
+    than the new candidate's (explicit) weight.  Since this has to
+    be done in order, we step through the candidates one at a time,
+    but we do so for every span and nonterminal at once.
+
+    Args:
+        starts: The start of each candidate's span.
+        parents: The nonterminal each candidate derives.
+        splits: The split of each candidate.
+        rules: The rule of each candidate.
+        raw: The explicit weight of each candidate's rule.
+        node: The weight the candidate's node would have.
+
+    Returns:
+        The indices of the first candidate of each group, and of
+        the winning candidate of each group.
+
+    """
+    m = len(starts)
+    first = np.ones(m, dtype=bool)
+    first[1:] = (starts[1:] != starts[:-1]) | (parents[1:] != parents[:-1])
+    group = np.cumsum(first) - 1
+    firsts = np.flatnonzero(first)
+    positions = np.arange(m)
+    rank = positions - np.maximum.accumulate(np.where(first, positions, 0))
+
+    by_rank = np.argsort(rank, kind='stable')
+    bounds = np.searchsorted(rank[by_rank], np.arange(rank.max() + 2))
+    best_weight = np.zeros(len(firsts), dtype=node.dtype)
+    best = np.full(len(firsts), -1, dtype=np.intp)
+    for k in range(len(bounds) - 1):
+        indices = by_rank[bounds[k]:bounds[k + 1]]
+        groups = group[indices]
+        replace = (best[groups] < 0) | (best_weight[groups] <= raw[indices])
+        indices = indices[replace]
+        groups = groups[replace]
+        best_weight[groups] = node[indices]
+        best[groups] = indices
+    return firsts, best
+
+
+def parse(grammar, tokens):
+    # type: (BaseGrammar, List[Token]) -> Optional[CykNode]
+    """Parse the tokens using a vectorized chart.
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+
+    Returns:
+        The root of the parse tree, if the tokens are a member
+        of the grammar's language, otherwise None.
+
+    """
+    if not tokens:
+        return None
+    compiled = grammar.compile()
+    if not compiled.starts:
+        return None
+    tables = _get_tables(compiled)
+    n = len(tokens)
+    r = len(compiled.symbols)
+
+    # For each span and nonterminal, the weight its node would have.
+    weights = np.zeros((n + 1, n, r), dtype=tables.weight_type)
+
+    # For each span and rule, whether the span is derived by the
+    # rule's left child (by length and then start), and whether it's
+    # derived by the rule's right child (by length and then end.)
+    # That way, the children of every split of a span are slices.
+    # Each span's rules are packed into bits.
+    rule_count = len(tables.lefts)
+    packed = (rule_count + 7) // 8
+    derives_left = np.zeros((n + 1, n, packed), dtype=np.uint8)
+    derives_right = np.zeros((n + 1, n + 1, packed), dtype=np.uint8)
+
+    # The split and rule of the winning derivation of each span and
+    # nonterminal, for each length.  These are only read when
+    # building the tree, so each length only holds its own spans.
+    split_type = np.min_scalar_type(n)
+    winning_split = [None, None]  # type: List[Any]
+    winning_rule = [None, None]  # type: List[Any]
+
+    terminal_table = compiled.terminal_table
+    derives = np.zeros((n, r), dtype=bool)
+    for s, token_type in enumerate(token_types(tokens)):
+        derived = terminal_table.get(token_type)
+        if derived:
+            derives[s] = tables.terminals[token_type]
+            weights[1, s, list(derived)] = list(derived.values())
+    derives_left[1] = np.packbits(derives[:, tables.lefts], axis=1)
+    derives_right[1, 1:] = np.packbits(derives[:, tables.rights], axis=1)
+
+    for l in range(2, n + 1):
+        count = n - l + 1
+        # For split p and start s, the left child has length p and
+        # starts at s, and the right child has length l - p and
+        # ends at s + l.
+        matches = (
+            derives_left[1:l, :count]
+            & derives_right[l - 1:0:-1, l:]
+        )
+        derives = np.zeros((count, r), dtype=bool)
+        winning_split.append(None)
+        winning_rule.append(None)
+        if not matches.any():
+            continue
+
+        # Every (split, start, rule) whose children derive the two
+        # halves of the span, ordered so that ties are broken in the
+        # same way as in `cyk.parse`.
+        # (Each byte of the matches holds eight rules.)
+        p, s, k = np.nonzero(matches)
+        bits = np.unpackbits(matches[p, s, k][:, None], axis=1)
+        del matches
+        m, bit = np.nonzero(bits)
+        p = p[m] + 1
+        s = s[m]
+        i = k[m] * 8 + bit
+        a = tables.parents[i]
+        order = np.lexsort((i, p, a, s))
+        p, s, i, a = p[order], s[order], i[order], a[order]
+        b = tables.lefts[i]
+        c = tables.rights[i]
+        raw = tables.weights[i]
+        node = np.where(
+            raw != 0,
+            raw,
+            np.maximum(
+                np.maximum(weights[p, s, b], weights[l - p, s + p, c]),
+                0,
+            ),
+        )
+
+        firsts, best = _best(s, a, p, i, raw, node)
+        s = s[firsts]
+        a = a[firsts]
+        derives[s, a] = True
+        derives_left[l, :count] = np.packbits(
+            derives[:, tables.lefts], axis=1,
+        )
+        derives_right[l, l:] = np.packbits(
+            derives[:, tables.rights], axis=1,
+        )
+        weights[l, s, a] = node[best]
+        winning_split[l] = np.zeros((count, r), dtype=split_type)
+        winning_split[l][s, a] = p[best]
+        winning_rule[l] = np.zeros((count, r), dtype=tables.rule_type)
+        winning_rule[l][s, a] = i[best]
+
+    # The last row is the span of every token.
+    starts = [a for a in compiled.starts if derives[0, a]]
+    if not starts:
+        return None
+
+    # Build the tree top-down, with an explicit stack, as in
+    # `cyk._materialize`.
+    names = compiled.names
+    annotations = tables.annotations
+
+    def create(length, start, a):
+        # type: (int, int, int) -> CykNode
+        weight = int(weights[length, start, a])
+        if length == 1:
+            return CykNode(names[a], value=tokens[start], weight=weight)
+        return CykNode(
+            names[a],
+            annotations=annotations[winning_rule[length][start, a]],
+            weight=weight,
+        )
+
+    root = create(n, 0, starts[0])
+    stack = [(root, n, 0, starts[0])]
+    while stack:
+        node, length, start, a = stack.pop()
+        if length == 1:
+            continue
+        p = int(winning_split[length][start, a])
+        i = winning_rule[length][start, a]
+        b = int(tables.lefts[i])
+        c = int(tables.rights[i])
+        node.lchild = create(p, start, b)
+        node.rchild = create(length - p, start + p, c)
+        stack.append((node.lchild, p, start, b))
+        stack.append((node.rchild, length - p, start + p, c))
+    return root
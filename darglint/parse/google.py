@@ -1,6 +1,10 @@
-import inspect
-from typing import (
+from typing import (  # noqa: F401
+    Any,
+    Callable,
     List,
+    Optional,
+    Sequence,
+    Tuple,
 )
 from functools import (
     reduce,
@@ -10,17 +14,20 @@ from ..custom_assert import Assert
 from ..token import (
     Token,
     TokenType,
-    KEYWORDS,
-)
-from .cyk import (
-    parse as cyk_parse,
+    KEYWORD_CODES,
+    type_codes,
 )
 from ..node import (
     CykNode,
 )
 
 from .combinator import (
+    parse_section as parse_combined_section,
     parser_combinator,
+    to_parsers,
+)
+from .items import (
+    parse_items,
 )
 from .long_description import (
     parse as long_description_parse,
@@ -39,90 +46,147 @@ from .grammars.google_yields_section_without_type import (
 )
 
 
-def _get_split_end_with_indents(tokens, i):
-    # type: (List[Token], int) -> int
-    """Return the index of the end of this split, or 0.
+_NEWLINE = TokenType.NEWLINE.value
+_INDENT = TokenType.INDENT.value
+
+
+def _section_spans(codes):
+    # type: (Sequence[int]) -> List[Tuple[int, int]]
+    """Find the start and end of each section, in a single pass.
+
+    Sections are separated by runs of newlines and indents.  A
+    run separates two sections if it has two newlines in a row,
+    or if it has at least two newlines, and the text after it
+    begins with a keyword at the start of a line.  Any indents
+    at the end of the run belong to the next section.
 
     Args:
-        tokens: A list of tokens.
-        i: The current index.
+        codes: The codes of the token types (see `TokenBuffer`.)
 
     Returns:
-        If i is the start of a split, return the index of the
-        token after the end of the split (or the last token, if
-        it's the end of the docstring.)  If we're not at a split,
-        return 0.
+        The start and end of each section.
 
     """
-    newline_count = 0
-    newline_run = 0
-    highest_newline_run = 0
-    j = i
-    while j < len(tokens):
-        if tokens[j].token_type == TokenType.NEWLINE:
-            newline_count += 1
-            newline_run += 1
-            if newline_run > highest_newline_run:
-                highest_newline_run = newline_run
-        elif tokens[j].token_type == TokenType.INDENT:
-            newline_run = 0
-        else:
-            break
-        j += 1
-
-    # Back up so that we don't remove indents on the same line as
-    # the encountered text.
-    while (j < len(tokens)
-            and j > 1
-            and tokens[j - 1].token_type == TokenType.INDENT):
-        j -= 1
-
-    # TODO: Do we want to check for keywords before assuming a
-    # new section?  If we have line-separated sections in args,
-    # which do not have indents, then we will parse incorrectly.
-    if newline_count < 2:
-        return 0
-
-    # If there are two newlines in a row, we have a break, no
-    # matter what.
-    if highest_newline_run > 1:
-        return j
-
-    # If there were not 2+ newlines in a row, (i.e. there were
-    # indented lines in with these), then it's only a new section
-    # if it starts with a keyword.
-    if (j < len(tokens)
-            and tokens[j].token_type in KEYWORDS
-            and tokens[j - 1].token_type == TokenType.NEWLINE):
-        return j
-
-    return 0
+    n = len(codes)
+    spans = list()  # type: List[Tuple[int, int]]
+
+    # Strip leading newlines.
+    i = 0
+    while i < n and codes[i] == _NEWLINE:
+        i += 1
+    prev = i
+
+    while i < n:
+        if codes[i] != _NEWLINE and codes[i] != _INDENT:
+            i += 1
+            continue
+
+        # Scan to the end of this run of whitespace.
+        newline_count = 0
+        newline_run = 0
+        highest_newline_run = 0
+        j = i
+        while j < n:
+            if codes[j] == _NEWLINE:
+                newline_count += 1
+                newline_run += 1
+                if newline_run > highest_newline_run:
+                    highest_newline_run = newline_run
+            elif codes[j] == _INDENT:
+                newline_run = 0
+            else:
+                break
+            j += 1
+        end = j
+
+        # Back up so that we don't remove indents on the same line as
+        # the encountered text.
+        while j < n and j > i and codes[j - 1] == _INDENT:
+            j -= 1
+
+        # If there are two newlines in a row, we have a break, no
+        # matter what.  If there were not 2+ newlines in a row, (i.e.
+        # there were indented lines in with these), then it's only a
+        # new section if it starts with a keyword.
+        #
+        # TODO: Do we want to check for keywords before assuming a
+        # new section?  If we have line-separated sections in args,
+        # which do not have indents, then we will parse incorrectly.
+        if newline_count >= 2 and (
+            highest_newline_run > 1
+            or (j < n
+                and codes[j] in KEYWORD_CODES
+                and codes[j - 1] == _NEWLINE)
+        ):
+            if i > prev:
+                spans.append((prev, i))
+            prev = j
+        i = end
+
+    if n > prev:
+        spans.append((prev, n))
+    return spans
 
 
 def top_parse(tokens):
     # type: (List[Token]) -> List[List[Token]]
-    all_sections = list()
-    curr = 0
-    # Strip leading newlines.
-    while curr < len(tokens) and tokens[curr].token_type == TokenType.NEWLINE:
-        curr += 1
-    prev = curr
-
-    while curr < len(tokens):
-        split_end = _get_split_end_with_indents(tokens, curr)
-        if split_end > curr:
-            if tokens[prev:curr]:
-                all_sections.append(
-                    tokens[prev:curr]
-                )
-            curr = split_end
-            prev = curr
-        else:
-            curr += 1
-    last_section = tokens[prev:curr]
-    if last_section:
-        all_sections.append(last_section)
-    return all_sections
+    return [
+        tokens[start:end]
+        for start, end in _section_spans(type_codes(tokens))
+    ]
+
+
+def _split_items(tokens):
+    # type: (List[Token]) -> Optional[List[Tuple[int, int]]]
+    """Find the items in an item-list section, such as Args.
+
+    Each item begins on a line which is indented exactly once.
+
+    Args:
+        tokens: The tokens in the section.
+
+    Returns:
+        The start and end of each item, or None if the section
+        doesn't look like a list of items.
+
+    """
+    if (len(tokens) < 5
+            or tokens[1].token_type != TokenType.COLON
+            or tokens[2].token_type != TokenType.NEWLINE
+            or tokens[3].token_type != TokenType.INDENT
+            or tokens[-1].token_type == TokenType.NEWLINE):
+        return None
+    pieces = list()
+    start = 3
+    for i in range(start, len(tokens) - 2):
+        if (tokens[i].token_type == TokenType.NEWLINE
+                and tokens[i + 1].token_type == TokenType.INDENT
+                and tokens[i + 2].token_type not in {
+                    TokenType.INDENT,
+                    TokenType.NEWLINE,
+                }):
+            pieces.append((start, i))
+            start = i + 1
+    pieces.append((start, len(tokens)))
+    return pieces
+
+
+def _items_parser(grammar, item, items):
+    # type: (Any, str, str) -> Callable[[List[Token]], Optional[CykNode]]
+    def parse(tokens):
+        # type: (List[Token]) -> Optional[CykNode]
+        return parse_items(grammar, item, items, tokens, _split_items(tokens))
+    return parse
+
+
+# Parse long item-list sections one item at a time.  If that
+# fails, the section is parsed whole by the next grammar.
+_parse_argument_items = _items_parser(
+    ArgumentsGrammar, 'item-argument', 'items-argument',
+)
+_parse_exception_items = _items_parser(
+    RaisesGrammar, 'item-exception', 'items-exception',
+)
 
 
 def _match(token):
@@ -143,6 +207,7 @@ def _match(token):
             long_description_parse,
         ],
         TokenType.ARGUMENTS: [
+            _parse_argument_items,
             ArgumentsGrammar,
             long_description_parse,
         ],
@@ -152,6 +217,7 @@ def _match(token):
             long_description_parse,
         ],
         TokenType.RAISES: [
+            _parse_exception_items,
             RaisesGrammar,
             long_description_parse,
         ],
@@ -188,11 +254,39 @@ def combinator(*args):
         return CykNode(symbol='docstring')
 
 
+def section_keyword(section):
+    # type: (List[Token]) -> TokenType
+    """Get the type of the token which determines the section's parsers.
+
+    Args:
+        section: A non-empty section from `top_parse`.
+
+    Returns:
+        The type of the token which `lookup` matches on.
+
+    """
+    return section[0].token_type
+
+
+_parsers = to_parsers(lookup)
+
+
+def parse_section(section, index):
+    # type: (List[Token], int) -> Optional[CykNode]
+    """Parse a single section from `top_parse`.
+
+    Args:
+        section: The section to parse.
+        index: The index of the section in the docstring.
+
+    Returns:
+        The parsed section, or None if it couldn't be parsed.
+
+    """
+    return parse_combined_section(top_parse, _parsers, section, index)
+
+
 def parse(tokens):
-    def mapped_lookup(section, section_index=-1):
-        for grammar in lookup(section, section_index):
-            if inspect.isclass(grammar):
-                yield lambda x: cyk_parse(grammar, x)
-            else:
-                yield grammar
-    return parser_combinator(top_parse, mapped_lookup, combinator, tokens)
+    return parser_combinator(
+        top_parse, _parsers, combinator, tokens
+    )
@@ -4,8 +4,10 @@ import abc
 from typing import (  # noqa: F401
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -48,8 +50,317 @@ class Production(object):
 P = Production
 
 
+def _to_mask(symbols):
+    # type: (Iterable[int]) -> int
+    mask = 0
+    for symbol in symbols:
+        mask |= 1 << symbol
+    return mask
+
+
+class CompiledGrammar(object):
+    """An integer-coded form of a grammar, for use by the parser.
+
+    Every nonterminal is given an integer identifier, and the binary
+    derivations are indexed by their children, so that the parser
+    only has to visit derivations whose children were actually
+    derived.
+
+    """
+
+    def __init__(self, grammar):
+        # type: (Any) -> None
+        """Compile the given grammar.
+
+        Args:
+            grammar: The grammar to compile.
+
+        """
+        # The names of the nonterminals, indexed by their identifier.
+        self.symbols = list()  # type: List[str]
+        self.lookup = dict()  # type: Dict[str, int]
+        for production in grammar.productions:
+            self._get_id(production.lhs)
+
+        # The terminal derivations, in the order they are declared.
+        self.terminals = list()  # type: List[Tuple[Any, int, int]]
+
+        # A map from the left child to a map from the right child
+        # to the rules which derive them.  Each rule is described by
+        # its position in the grammar (used to break ties the same
+        # way, no matter the order the rules are visited in), the
+        # parent, the annotations and the weight.
+        self.binary = dict()  # type: Dict[int, Dict[int, List[Tuple[int, int, List[Annotation], int]]]]  # noqa: E501
+
+        ordinal = 0
+        for production in grammar.productions:
+            a = self.lookup[production.lhs]
+            for derivation in production.rhs:
+                if len(derivation) <= 2:
+                    token_type, weight = derivation  # type: ignore
+                    self.terminals.append((token_type, a, weight))
+                    continue
+                annotations, B, C, weight = derivation  # type: ignore
+                b = self._get_id(B)
+                c = self._get_id(C)
+                self.binary.setdefault(b, dict()).setdefault(c, list()).append(
+                    (ordinal, a, annotations, weight)
+                )
+                ordinal += 1
+
+        # A map from the token type to the nonterminals which derive
+        # it, and the weights of those derivations.  If a nonterminal
+        # derives the same token type more than once, the last
+        # derivation wins.
+        self.terminal_table = dict()  # type: Dict[Any, Dict[int, int]]
+        for token_type, a, weight in self.terminals:
+            self.terminal_table.setdefault(token_type, dict())[a] = weight
+
+        # The same tables, as bitmasks over the nonterminals, for
+        # use in recognizing (rather than parsing) a sentence.
+        self.terminal_masks = {
+            token_type: _to_mask(derived)
+            for token_type, derived in self.terminal_table.items()
+        }  # type: Dict[Any, int]
+
+        # For each left child, the mask of right children it has
+        # rules for, and a list of each right child's bit paired
+        # with the mask of parents derived from the two.
+        self.right_masks = [0] * len(self.symbols)
+        self.binary_masks = [
+            list() for _ in self.symbols
+        ]  # type: List[List[Tuple[int, int]]]
+        for b, by_right in self.binary.items():
+            for c, rules in by_right.items():
+                self.right_masks[b] |= 1 << c
+                self.binary_masks[b].append(
+                    (1 << c, _to_mask(rule[1] for rule in rules))
+                )
+
+        # The start symbols, in order of preference.  Most grammars
+        # have only one, but the union of several grammars has one
+        # for each of them.  (See `union`.)
+        self.starts = [
+            self.lookup[start]
+            for start in (grammar.starts or [grammar.start])
+            if start in self.lookup
+        ]
+        self.start = self.starts[0] if self.starts else -1
+        self.start_mask = _to_mask(self.starts)
+
+        # The names to give the nodes of each nonterminal.  These
+        # only differ from the symbols for nonterminals which had
+        # to be renamed when merging grammars.
+        self.names = [
+            grammar.display_names.get(symbol, symbol)
+            for symbol in self.symbols
+        ]
+
+        self._compute_lengths()
+        self._compute_edges()
+
+        # For each token type, the mask of nonterminals which can
+        # begin (or end) with it.
+        self.first_masks = dict()  # type: Dict[Any, int]
+        self.last_masks = dict()  # type: Dict[Any, int]
+        for a in range(len(self.symbols)):
+            for token_type in self.first[a]:
+                self.first_masks[token_type] = (
+                    self.first_masks.get(token_type, 0) | 1 << a
+                )
+            for token_type in self.last[a]:
+                self.last_masks[token_type] = (
+                    self.last_masks.get(token_type, 0) | 1 << a
+                )
+
+        # The mask of nonterminals which can derive a span of the
+        # given length.  Past the end of the list, only the unbounded
+        # nonterminals can.
+        longest = max(
+            [x for x in self.min_lengths + self.max_lengths if x] + [1]
+        )
+        self.length_masks = [
+            _to_mask(
+                a for a in range(len(self.symbols))
+                if self._fits(a, l)
+            )
+            for l in range(longest + 1)
+        ]
+        self.unbounded_mask = _to_mask(
+            a for a in range(len(self.symbols))
+            if self.min_lengths[a] is not None
+            and self.max_lengths[a] is None
+        )
+
+        # The nonterminals which are derived by a binary rule.  (All
+        # the others only derive single tokens.)
+        self.binary_mask = _to_mask(
+            rule[1]
+            for by_right in self.binary.values()
+            for rules in by_right.values()
+            for rule in rules
+        )
+
+        # For each start symbol, the nonterminals which can occur
+        # in its parse trees.
+        children = [set() for _ in self.symbols]  # type: List[Set[int]]
+        for a, b, c in self._rules():
+            children[a].update((b, c))
+        self.reachable_masks = dict()  # type: Dict[int, int]
+        for start in self.starts:
+            seen = {start}
+            stack = [start]
+            while stack:
+                for child in children[stack.pop()]:
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+            self.reachable_masks[start] = _to_mask(seen)
+
+    def length_mask(self, length):
+        # type: (int) -> int
+        """Get the nonterminals which can derive a span of the length.
+
+        Args:
+            length: The length of the span.
+
+        Returns:
+            A mask of the nonterminals which can derive a span
+            of the given length.
+
+        """
+        if length < len(self.length_masks):
+            return self.length_masks[length]
+        return self.unbounded_mask
+
+    def _fits(self, a, length):
+        # type: (int, int) -> bool
+        shortest = self.min_lengths[a]
+        longest = self.max_lengths[a]
+        if shortest is None or length < shortest:
+            return False
+        return longest is None or length <= longest
+
+    def _rules(self):
+        # type: () -> Iterable[Tuple[int, int, int]]
+        for b, by_right in self.binary.items():
+            for c, rules in by_right.items():
+                for rule in rules:
+                    yield rule[1], b, c
+
+    def _compute_lengths(self):
+        # type: () -> None
+        """Compute the shortest and longest spans of each nonterminal.
+
+        A nonterminal which derives nothing has neither.  A
+        nonterminal which can derive arbitrarily long spans has
+        no longest span.
+
+        """
+        r = len(self.symbols)
+        rules = list(self._rules())
+
+        self.min_lengths = [None] * r  # type: List[Optional[int]]
+        for _, a, _ in self.terminals:
+            self.min_lengths[a] = 1
+        changed = True
+        while changed:
+            changed = False
+            for a, b, c in rules:
+                left = self.min_lengths[b]
+                right = self.min_lengths[c]
+                if left is None or right is None:
+                    continue
+                current = self.min_lengths[a]
+                if current is None or left + right < current:
+                    self.min_lengths[a] = left + right
+                    changed = True
+
+        # A nonterminal is unbounded if it can reach a cycle
+        # through rules which derive something.
+        children = [set() for _ in range(r)]  # type: List[Set[int]]
+        for a, b, c in rules:
+            if (self.min_lengths[b] is not None
+                    and self.min_lengths[c] is not None):
+                children[a].update((b, c))
+        reachable = list()  # type: List[Set[int]]
+        for a in range(r):
+            seen = set()  # type: Set[int]
+            stack = list(children[a])
+            while stack:
+                curr = stack.pop()
+                if curr in seen:
+                    continue
+                seen.add(curr)
+                stack.extend(children[curr])
+            reachable.append(seen)
+        cyclic = {a for a in range(r) if a in reachable[a]}
+        unbounded = {
+            a for a in range(r)
+            if a in cyclic or reachable[a] & cyclic
+        }
+
+        self.max_lengths = [
+            1 if x is not None else None for x in self.min_lengths
+        ]  # type: List[Optional[int]]
+        for a in unbounded:
+            self.max_lengths[a] = None
+        changed = True
+        while changed:
+            changed = False
+            for a, b, c in rules:
+                if a in unbounded:
+                    continue
+                left = self.max_lengths[b]
+                right = self.max_lengths[c]
+                if left is None or right is None:
+                    continue
+                current = self.max_lengths[a]
+                if current is None or left + right > current:
+                    self.max_lengths[a] = left + right
+                    changed = True
+
+    def _compute_edges(self):
+        # type: () -> None
+        """Compute the token types each nonterminal can begin or end with."""
+        r = len(self.symbols)
+        self.first = [set() for _ in range(r)]  # type: List[Set[Any]]
+        self.last = [set() for _ in range(r)]  # type: List[Set[Any]]
+        for token_type, a, _ in self.terminals:
+            self.first[a].add(token_type)
+            self.last[a].add(token_type)
+        rules = list(self._rules())
+        changed = True
+        while changed:
+            changed = False
+            for a, b, c in rules:
+                if (self.min_lengths[b] is None
+                        or self.min_lengths[c] is None):
+                    continue
+                if not self.first[b] <= self.first[a]:
+                    self.first[a] |= self.first[b]
+                    changed = True
+                if not self.last[c] <= self.last[a]:
+                    self.last[a] |= self.last[c]
+                    changed = True
+
+    def _get_id(self, symbol):
+        # type: (str) -> int
+        if symbol not in self.lookup:
+            self.lookup[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return self.lookup[symbol]
+
+
 class BaseGrammar(abc.ABC):
 
+    # Additional start symbols, in order of preference, and the
+    # names nonterminals should be displayed with, if they differ
+    # from the symbols.  These are only used by the union of
+    # several grammars.  (See `union`.)
+    starts = list()  # type: List[str]
+    display_names = dict()  # type: Dict[str, str]
+
     @property
     @abc.abstractmethod
     def productions(self):
@@ -81,6 +392,26 @@ class BaseGrammar(abc.ABC):
             lookup[symbol] = i
         return lookup
 
+    @classmethod
+    def compile(cls):
+        # type: () -> CompiledGrammar
+        """Get the compiled form of this grammar.
+
+        The grammar is only compiled once, the first time this
+        is called.
+
+        Returns:
+            The compiled grammar.
+
+        """
+        # Look in the class's own dictionary, so that subclasses
+        # don't inherit the compiled form of their parent.
+        compiled = cls.__dict__.get('_compiled')
+        if compiled is None:
+            compiled = CompiledGrammar(cls)
+            cls._compiled = compiled  # type: ignore
+        return compiled
+
     @classmethod
     def to_dot(cls):
         # () -> str
@@ -167,3 +498,138 @@ class BaseGrammar(abc.ABC):
                     )
         ret += '}'
         return ret
+
+
+def _get_definitions(grammar):
+    # type: (Any) -> Dict[str, List[Derivation]]
+    definitions = dict()  # type: Dict[str, List[Derivation]]
+    for production in grammar.productions:
+        definitions.setdefault(production.lhs, list()).extend(production.rhs)
+    return definitions
+
+
+def _get_mentions(grammar):
+    # type: (Any) -> Set[str]
+    mentions = {grammar.start}
+    for production in grammar.productions:
+        mentions.add(production.lhs)
+        for derivation in production.rhs:
+            if len(derivation) == 4:
+                mentions.update(derivation[1:3])
+    return mentions
+
+
+_unions = dict()  # type: Dict[Tuple[Any, ...], Any]
+
+
+def union(*grammars):
+    # type: (Any) -> Any
+    """Merge the grammars into one grammar with several start symbols.
+
+    Alternative grammars for a section (for example, the returns
+    section with and without a type) share most of their
+    nonterminals.  Parsing with their union fills one chart
+    for all of them, and the parse tree for the first grammar
+    (in the order given) which derives the section is returned.
+
+    A nonterminal is shared between the grammars if every grammar
+    which mentions it defines it in the same way, in terms of
+    nonterminals which are also shared.  Otherwise, each grammar
+    gets its own copy of the nonterminal, which is renamed.  The
+    nodes in the parse tree still receive their original names,
+    so the tree is identical to one from the original grammar.
+
+    Args:
+        grammars: The grammars to merge, in order of preference.
+
+    Returns:
+        A grammar whose start symbols are those of the given
+        grammars.
+
+    """
+    if grammars in _unions:
+        return _unions[grammars]
+
+    definitions = [_get_definitions(grammar) for grammar in grammars]
+    mentions = [_get_mentions(grammar) for grammar in grammars]
+    mentioned_by = dict()  # type: Dict[str, List[int]]
+    for i, mentioned in enumerate(mentions):
+        for symbol in mentioned:
+            mentioned_by.setdefault(symbol, list()).append(i)
+
+    # Start by assuming every nonterminal which is defined the same
+    # way everywhere it's mentioned can be shared, and then remove
+    # those which depend on nonterminals which can't be.
+    shared = set()  # type: Set[str]
+    for symbol, indices in mentioned_by.items():
+        if len(indices) < 2:
+            continue
+        if any(symbol not in definitions[i] for i in indices):
+            continue
+        first = definitions[indices[0]][symbol]
+        if all(definitions[i][symbol] == first for i in indices[1:]):
+            shared.add(symbol)
+    changed = True
+    while changed:
+        changed = False
+        for symbol in list(shared):
+            i = mentioned_by[symbol][0]
+            for derivation in definitions[i][symbol]:
+                if len(derivation) != 4:
+                    continue
+                if any(
+                    len(mentioned_by[child]) > 1 and child not in shared
+                    for child in derivation[1:3]
+                ):
+                    shared.remove(symbol)
+                    changed = True
+                    break
+
+    display_names = dict()  # type: Dict[str, str]
+
+    def rename(i, symbol):
+        # type: (int, str) -> str
+        if symbol in shared or len(mentioned_by[symbol]) < 2:
+            return symbol
+        renamed = '{}@{}'.format(symbol, i)
+        display_names[renamed] = symbol
+        return renamed
+
+    productions = list()  # type: List[Production]
+    for i, grammar in enumerate(grammars):
+        for production in grammar.productions:
+            # Shared nonterminals are only defined by the first
+            # grammar which mentions them.
+            if (production.lhs in shared
+                    and mentioned_by[production.lhs][0] != i):
+                continue
+            rhs = list()  # type: List[Derivation]
+            for derivation in production.rhs:
+                if len(derivation) == 4:
+                    annotations, B, C, weight = derivation  # type: ignore
+                    derivation = (
+                        annotations, rename(i, B), rename(i, C), weight,
+                    )
+                rhs.append(derivation)
+            productions.append(Production(
+                rename(i, production.lhs),
+                *rhs,
+                annotations=production.annotations
+            ))
+
+    starts = [
+        rename(i, grammar.start) for i, grammar in enumerate(grammars)
+    ]
+    merged = type(
+        'UnionGrammar',
+        (BaseGrammar,),
+        {
+            'productions': productions,
+            'start': starts[0],
+            'starts': starts,
+            'display_names': display_names,
+            'grammars': grammars,
+        },
+    )
+    _unions[grammars] = merged
+    return merged
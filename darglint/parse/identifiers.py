@@ -2,7 +2,8 @@ import abc
 
 from ..custom_assert import Assert
 from .cyk import CykNode
-from typing import (
+from typing import (  # noqa: F401
+    Any,
     Callable,
     List,
     Optional,
@@ -14,6 +15,46 @@ from ..token import (
 )
 
 
+def _always(node):
+    # type: (CykNode) -> bool
+    return True
+
+
+def _has_lchild(node):
+    # type: (CykNode) -> bool
+    return bool(node.lchild)
+
+
+def _has_rchild(node):
+    # type: (CykNode) -> bool
+    return bool(node.rchild)
+
+
+def _unexpected(value):
+    # type: (Any) -> None
+    Assert(
+        False,
+        'Expected path extraction to yield str '
+        'or None but was {}'.format(
+            value.__class__.__name__
+        )
+    )
+    return None
+
+
+def _value(node):
+    # type: (CykNode) -> Optional[str]
+    value = node.value
+    if not value:
+        return None
+    return value.value
+
+
+def _none(node):
+    # type: (CykNode) -> None
+    return None
+
+
 class Continuation(object):
     """Represents a continuation of a path.
 
@@ -21,6 +62,10 @@ class Continuation(object):
     tree.  The wrapper, Path, returns continuations.  Each
     continuation either performs a branching or a chain.
 
+    The first time a continuation extracts a value, it's compiled
+    into a function which follows the path directly.  (See
+    `compile`.)
+
     """
 
     def __init__(self, path, condition, child=None):
@@ -29,6 +74,24 @@ class Continuation(object):
         self.condition = condition
         self.child = child
         self._sealed = False
+        self._compiled = None  # type: Optional[Callable[[CykNode], Union[str, CykNode, None]]]  # noqa: E501
+
+        # The continuations which have this one as a child, so that
+        # their compiled functions can be discarded when this one
+        # is extended.
+        self._parents = list()  # type: List[Continuation]
+        if isinstance(child, tuple):
+            for branch in child:
+                branch._parents.append(self)
+        elif isinstance(child, Continuation):
+            child._parents.append(self)
+
+    def _invalidate(self):
+        # type: () -> None
+        """Discard the compiled functions of this and its ancestors."""
+        self._compiled = None
+        for parent in self._parents:
+            parent._invalidate()
 
     def of(self, path):
         # type: (str) -> Continuation
@@ -39,7 +102,9 @@ class Continuation(object):
         if isinstance(self.child, Continuation):
             self.child.of(path)
         elif self.child is None:
-            self.child = Continuation(path, lambda _: True, None)
+            self.child = Continuation(path, _always, None)
+            self.child._parents.append(self)
+        self._invalidate()
         return self
 
     def branch(self, *continuations):
@@ -49,9 +114,103 @@ class Continuation(object):
             'Sealed continuations shouldn\'t be extended!',
         )
         self.child = continuations
+        for continuation in continuations:
+            continuation._parents.append(self)
         self._sealed = True
+        self._invalidate()
         return self
 
+    def _compile_end(self):
+        # type: () -> Callable[[CykNode], Union[str, CykNode, None]]
+        """Compile what happens at the end of this continuation's path.
+
+        Returns:
+            A function which takes the node at the end of the path,
+            and returns the extracted value.
+
+        """
+        if isinstance(self.child, tuple):
+            # In branching, we try each branch until one
+            # succeeds.  Branches are always terminal.
+            branches = [branch.compile() for branch in self.child]
+
+            def end(curr):
+                # type: (CykNode) -> Union[str, CykNode, None]
+                for branch in branches:
+                    result = branch(curr)
+                    if result is not None:
+                        return result
+                return None
+            return end
+
+        if isinstance(self.child, Continuation):
+            # In an unconditional chain, we fail if any in the
+            # chain fail.
+            child = self.child.compile()
+
+            def chain(curr):
+                # type: (CykNode) -> Union[str, CykNode, None]
+                result = child(curr)
+                if result is None or isinstance(result, str):
+                    return result
+                return _unexpected(result)
+            return chain
+
+        return lambda curr: curr
+
+    def compile(self):
+        # type: () -> Callable[[CykNode], Union[str, CykNode, None]]
+        """Compile this continuation into a function.
+
+        The function takes each turn of the path in sequence, rather
+        than interpreting the path, and calls the compiled children
+        directly.  It's kept until this continuation, or one of its
+        descendants, is extended.
+
+        Returns:
+            A function which extracts the value described by this
+            continuation from the given node.
+
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        turns = list()  # type: List[str]
+        end = None  # type: Optional[Callable[[CykNode], Union[str, CykNode, None]]]  # noqa: E501
+        for letter in self.path:
+            if letter == 'l':
+                turns.append('lchild')
+            elif letter == 'r':
+                turns.append('rchild')
+            elif letter == 'v':
+                # The value ends the path: the rest is never taken.
+                end = _value
+                break
+            else:
+                end = _none
+                break
+        else:
+            end = self._compile_end()
+
+        condition = self.condition
+        checked = condition is not _always
+
+        def extract(node):
+            # type: (CykNode) -> Union[str, CykNode, None]
+            if checked and not condition(node):
+                return None
+            curr = node
+            if curr is None:
+                return None
+            for turn in turns:
+                curr = getattr(curr, turn)
+                if curr is None:
+                    return None
+            return end(curr)
+
+        self._compiled = extract
+        return self._compiled
+
     def extract(self, node):
         # type: (CykNode) -> Union[str, CykNode, None]
         """Extract the value of the leaf node described by this path.
@@ -64,64 +223,7 @@ class Continuation(object):
             path.
 
         """
-        if not self.condition(node):
-            return None
-        curr = node  # type: Optional[CykNode]
-        for letter in self.path:
-            if curr and letter == 'r':
-                curr = curr.rchild
-            elif curr and letter == 'l':
-                curr = curr.lchild
-            elif curr and letter == 'v' and curr.value:
-                return curr.value.value
-            else:
-                return None
-        if curr is None:
-            return None
-
-        is_branch = isinstance(self.child, tuple)
-        is_continuation = isinstance(self.child, Continuation)
-        if is_branch:
-            for branch in self.child:  # type: ignore
-                next_curr = branch.extract(curr)
-                if isinstance(next_curr, str):
-                    return next_curr
-                elif next_curr is None:
-                    # In branching, we try each branch until
-                    # one succeeds.
-                    continue
-                elif isinstance(next_curr, CykNode):
-                    return next_curr
-                else:
-                    Assert(
-                        False,
-                        'Expected path extraction to yield str '
-                        'or None or CykNode but was {}'.format(
-                            next_curr.__class__.__name__
-                        )
-                    )
-                    return None
-            # Branches are always terminal.  If we haven't
-            # found the result by this point, there is none.
-            return None
-        elif is_continuation:
-            next_curr = self.child.extract(curr)  # type: ignore
-            if isinstance(next_curr, str):
-                return next_curr
-            elif next_curr is None:
-                # In an unconditional chain, we fail if any
-                # in the chain fail.
-                return None
-            else:
-                Assert(
-                    False,
-                    'Expected path extraction to yield str '
-                    'or None but was {}'.format(
-                        next_curr.__class__.__name__
-                    )
-                )
-                return None
-        return curr
+        return self.compile()(node)
 
 
 class Path(object):
@@ -152,7 +254,7 @@ class Path(object):
             A continuation of the path.
 
         """
-        return Continuation(path, lambda _: True)
+        return Continuation(path, _always)
 
     @staticmethod
     def branch(*paths):
@@ -166,7 +268,7 @@ class Path(object):
             A continuation representing the path.
 
         """
-        return Continuation('', lambda _: True, paths)
+        return Continuation('', _always, paths)
 
     # These methods are technically unnecessary -- they are
     # synonymous with an `of`.  However, it makes for nicer
@@ -174,12 +276,12 @@ class Path(object):
     @staticmethod
     def if_left(path):
         # type: (str) -> Continuation
-        return Continuation(path, lambda x: bool(x.lchild))
+        return Continuation(path, _has_lchild)
 
     @staticmethod
     def if_right(path):
         # type: (str) -> Continuation
-        return Continuation(path, lambda x: bool(x.rchild))
+        return Continuation(path, _has_rchild)
 
 
 class Identifier(abc.ABC):
@@ -284,6 +386,9 @@ class YieldTypeIdentifier(Identifier):
     path = Path.of('lv')
 
 
+_NOQA_VALUE = Path.branch(Path.of('rrv'), Path.of('rrlv'))
+
+
 class NoqaIdentifier(Identifier):
 
     key = 'id_Noqa'
@@ -293,8 +398,7 @@ class NoqaIdentifier(Identifier):
     def extract(node):
         # type: (CykNode) -> str
         if node.rchild and node.rchild.rchild:
-            path = Path.branch(Path.of('rrv'), Path.of('rrlv'))
-            value = path.extract(node)
+            value = _NOQA_VALUE.extract(node)
             if isinstance(value, str):
                 return value
             # path2 = Path.of('rrlv')
@@ -0,0 +1,297 @@
+"""Parse sections which are lists of items one item at a time.
+
+Sections such as the arguments section can hold many items, and
+parsing them whole costs O(n^3) in the length of the section.
+Instead, the section can be cut into its items, each of which is
+parsed on its own, and the tree for the whole section assembled
+from them.  This is linear in the number of items.
+
+The assembled tree must be the same one the whole section would
+parse to.  That holds for well-formed items: each item is derived
+by the grammar's item symbol, with a positive weight, and without
+any errors.  In that case, the parser always prefers the split
+between the first item and the rest of the list.  (Malformed items
+can be absorbed by their neighbors -- for example, as a badly
+indented continuation of the previous item's description.)  If
+any item is malformed, we give up, and the section should be
+parsed whole.
+
+"""
+
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .cyk import (
+    parse as cyk_parse,
+)
+from .grammar import (  # noqa: F401
+    BaseGrammar,
+    CompiledGrammar,
+)
+from ..errors import (
+    DarglintError,
+)
+from ..node import (
+    CykNode,
+)
+from ..token import (  # noqa: F401
+    Token,
+)
+
+
+_grammars = dict()  # type: Dict[Tuple[Any, str], Any]
+
+
+def _with_start(grammar, start):
+    # type: (Any, str) -> Any
+    """Get a copy of the grammar with a different start symbol.
+
+    Args:
+        grammar: The grammar to copy.
+        start: The new start symbol.
+
+    Returns:
+        A subclass of the grammar, starting with the given symbol.
+
+    """
+    key = (grammar, start)
+    if key not in _grammars:
+        _grammars[key] = type(grammar.__name__, (grammar,), {'start': start})
+    return _grammars[key]
+
+
+def _find_rule(compiled, a, b, c):
+    # type: (CompiledGrammar, str, str, str) -> Optional[Tuple[Any, int]]
+    """Find the annotations and weight of the rule a -> b c.
+
+    Args:
+        compiled: The grammar to search.
+        a: The parent.
+        b: The left child.
+        c: The right child.
+
+    Returns:
+        The annotations and weight of the first such rule,
+        or None if there is no such rule.
+
+    """
+    lookup = compiled.lookup
+    if a not in lookup or b not in lookup or c not in lookup:
+        return None
+    rules = compiled.binary.get(lookup[b], dict()).get(lookup[c], list())
+    for _, parent, annotations, weight in rules:
+        if parent == lookup[a]:
+            return annotations, weight
+    return None
+
+
+def _count_rules(compiled, a):
+    # type: (CompiledGrammar, str) -> int
+    """Count the derivations (terminal or not) of the nonterminal.
+
+    Args:
+        compiled: The grammar to search.
+        a: The nonterminal.
+
+    Returns:
+        The number of derivations of the nonterminal.
+
+    """
+    parent = compiled.lookup[a]
+    count = sum(1 for _, x, _ in compiled.terminals if x == parent)
+    for by_right in compiled.binary.values():
+        for rules in by_right.values():
+            count += sum(1 for rule in rules if rule[1] == parent)
+    return count
+
+
+def _is_well_formed(node):
+    # type: (CykNode) -> bool
+    if node.weight <= 0:
+        return False
+    stack = [node]
+    while stack:
+        curr = stack.pop()
+        for annotation in curr.annotations:
+            if issubclass(annotation, DarglintError):
+                return False
+        if curr.lchild:
+            stack.append(curr.lchild)
+        if curr.rchild:
+            stack.append(curr.rchild)
+    return True
+
+
+def _count_leaves(node):
+    # type: (CykNode) -> int
+    count = 0
+    stack = [node]
+    while stack:
+        curr = stack.pop()
+        if curr.value is not None:
+            count += 1
+        if curr.lchild:
+            stack.append(curr.lchild)
+        if curr.rchild:
+            stack.append(curr.rchild)
+    return count
+
+
+def parse_items(grammar, item, items, tokens, pieces):
+    # type: (Any, str, str, List[Token], Optional[List[Tuple[int, int]]]) -> Optional[CykNode]  # noqa: E501
+    """Parse a section which is a list of items, one item at a time.
+
+    The grammar should describe the list of items in the usual
+    way, as
+
+        <items> ::= <item> <newline> <items> | <item>
+
+    Everything before the first item (the section's header) is
+    parsed along with the first item, and the rest of the list
+    is spliced in afterwards.
+
+    Args:
+        grammar: The grammar for the whole section.
+        item: The symbol for a single item.
+        items: The symbol for a list of items.
+        tokens: The tokens in the section.
+        pieces: The start and end of each item.  The items should
+            be separated by a single newline, and the last should
+            end the section.
+
+    Returns:
+        The same tree as parsing the whole section with the grammar
+        would return, or None if the section couldn't be parsed this
+        way.  (In which case it should be parsed whole.)
+
+    """
+    if not pieces or len(pieces) < 2:
+        return None
+    compiled = grammar.compile()
+    for symbol in (item, items):
+        if symbol not in compiled.lookup:
+            return None
+
+    # Parse each of the items on its own.  The last item is the
+    # end of the list, so it's derived by the list symbol.
+    item_grammar = _with_start(grammar, item)
+    items_grammar = _with_start(grammar, items)
+    parsed = list()  # type: List[CykNode]
+    for i, (start, end) in enumerate(pieces):
+        is_last = i == len(pieces) - 1
+        node = cyk_parse(
+            items_grammar if is_last else item_grammar,
+            tokens[start:end],
+        )
+        if node is None or not _is_well_formed(node):
+            return None
+        parsed.append(node)
+
+    # Parse the header, along with the first item, as though it were
+    # the whole section, and find the node which covers the items.
+    first_start, first_end = pieces[0]
+    root = cyk_parse(grammar, tokens[:first_end])
+    if root is None:
+        return None
+    spine = list()  # type: List[CykNode]
+    node = root
+    position = 0
+    while position < first_start:
+        if not node.lchild or not node.rchild:
+            return None
+        spine.append(node)
+        position += _count_leaves(node.lchild)
+        node = node.rchild
+    if position != first_start:
+        return None
+
+    # Each node above the items only has the one derivation, so it
+    # doesn't matter that it will cover more tokens.
+    for parent in spine:
+        if _count_rules(compiled, parent.symbol) != 1:
+            return None
+
+    # Find the rules which join the items together.
+    separator = None  # type: Optional[str]
+    for c in compiled.binary.get(compiled.lookup[item], dict()):
+        for rule in compiled.binary[compiled.lookup[item]][c]:
+            if rule[1] == compiled.lookup[items]:
+                separator = compiled.symbols[c]
+    if separator is None:
+        return None
+    head_rule = _find_rule(compiled, node.symbol, item, separator)
+    newline = None  # type: Optional[str]
+    for b in compiled.symbols:
+        if _find_rule(compiled, separator, b, items):
+            newline = b
+            break
+    if head_rule is None or newline is None:
+        return None
+    newline_id = compiled.lookup[newline]
+
+    def create_newline(index):
+        # type: (int) -> Optional[CykNode]
+        token = tokens[index]
+        weights = compiled.terminal_table.get(token.token_type, dict())
+        if newline_id not in weights:
+            return None
+        return CykNode(newline, value=token, weight=weights[newline_id])
+
+    # Join the items, from the last to the first.
+    separator_rule = _find_rule(compiled, separator, newline, items)
+    list_rule = _find_rule(compiled, items, item, separator)
+    if separator_rule is None or list_rule is None:
+        return None
+    rest = parsed[-1]
+    for i in range(len(pieces) - 2, -1, -1):
+        newline_node = create_newline(pieces[i][1])
+        if newline_node is None:
+            return None
+        annotations, weight = separator_rule
+        joined = CykNode(
+            separator,
+            lchild=newline_node,
+            rchild=rest,
+            annotations=annotations,
+            weight=weight,
+        )
+        if i == 0:
+            symbol = node.symbol
+            annotations, weight = head_rule
+        else:
+            symbol = items
+            annotations, weight = list_rule
+        rest = CykNode(
+            symbol,
+            lchild=parsed[i],
+            rchild=joined,
+            annotations=annotations,
+            weight=weight,
+        )
+
+    # Replace the first item with the list, and update the weights
+    # of the nodes above it.
+    if not spine:
+        return rest
+    spine[-1].rchild = rest
+    for parent in reversed(spine):
+        rule = _find_rule(
+            compiled,
+            parent.symbol,
+            parent.lchild.symbol,  # type: ignore
+            parent.rchild.symbol,  # type: ignore
+        )
+        if rule is None:
+            return None
+        weight = rule[1]
+        parent.weight = weight or max(
+            0,
+            parent.lchild.weight,  # type: ignore
+            parent.rchild.weight,  # type: ignore
+        )
+    return root
@@ -166,7 +166,7 @@ def _parse_long_description(peaker):
 
 def parse(tokens):
     # type: (List[Token]) -> Optional[CykNode]
-    peaker = Peaker((x for x in tokens), lookahead=5)
+    peaker = Peaker(tokens, lookahead=5)
     if not peaker.has_next():
         return None
 
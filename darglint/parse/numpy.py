@@ -1,8 +1,9 @@
-import inspect
-from typing import (
+from typing import (  # noqa: F401
     List,
     Optional,
     Callable,
+    Sequence,
+    Tuple,
     Union,
     Dict,
 )
@@ -17,9 +18,6 @@ from ..node import (
     CykNode,
 )
 from ..custom_assert import Assert
-from .cyk import (
-    parse as cyk_parse,
-)
 from .grammars.numpy_arguments_section import (
     ArgumentsGrammar,
 )
@@ -48,28 +46,40 @@ from .grammar import (
     BaseGrammar,
 )
 from .combinator import (
+    parse_section as parse_combined_section,
     parser_combinator,
+    to_parsers,
 )
 from ..token import (
-    KEYWORDS,
+    KEYWORD_CODES,
+    type_codes,
 )
 from .long_description import (
     parse as long_description_parse,
 )
 
 
-def top_parse(tokens):
-    # type: (List[Token]) -> List[List[Token]]
-    """Split the docstring into sections.
+_NEWLINE = TokenType.NEWLINE.value
+_HEADER = TokenType.HEADER.value
+_OTHER = TokenType.OTHER.value
+_ARGUMENTS = TokenType.ARGUMENTS.value
+_SEE = TokenType.SEE.value
+_ALSO = TokenType.ALSO.value
 
-    Each section will be parsed individually, according
-    to the combinator.
+
+def _section_spans(codes):
+    # type: (Sequence[int]) -> List[Tuple[int, int]]
+    """Find the start and end of each section, in a single pass.
+
+    The first section is the short description (and the newlines
+    after it.)  Every other section begins with a keyword and a
+    header (a line of hyphens.)
 
     Args:
-        tokens: The tokens representing the entire docstring.
+        codes: The codes of the token types (see `TokenBuffer`.)
 
     Returns:
-        The docstring, split into sections.
+        The start and end of each section.
 
     """
     def at_section_boundary(i):
@@ -84,33 +94,33 @@ def top_parse(tokens):
             If 0, then this is not a new section.
 
         """
-        if i >= len(tokens):
+        if i >= len(codes):
             return 0
-        if tokens[i].token_type == TokenType.OTHER:
+        if codes[i] == _OTHER:
             if (
-                i + 3 < len(tokens) and
-                tokens[i + 1].token_type == TokenType.ARGUMENTS and
-                tokens[i + 2].token_type == TokenType.NEWLINE and
-                tokens[i + 3].token_type == TokenType.HEADER
+                i + 3 < len(codes) and
+                codes[i + 1] == _ARGUMENTS and
+                codes[i + 2] == _NEWLINE and
+                codes[i + 3] == _HEADER
             ):
                 return 4
             else:
                 return 0
-        elif tokens[i].token_type == TokenType.SEE:
+        elif codes[i] == _SEE:
             if (
-                i + 3 < len(tokens) and
-                tokens[i + 1].token_type == TokenType.ALSO and
-                tokens[i + 2].token_type == TokenType.NEWLINE and
-                tokens[i + 3].token_type == TokenType.HEADER
+                i + 3 < len(codes) and
+                codes[i + 1] == _ALSO and
+                codes[i + 2] == _NEWLINE and
+                codes[i + 3] == _HEADER
             ):
                 return 4
             else:
                 return 0
-        elif tokens[i].token_type in KEYWORDS:
+        elif codes[i] in KEYWORD_CODES:
             if (
-                i + 2 < len(tokens) and
-                tokens[i + 1].token_type == TokenType.NEWLINE and
-                tokens[i + 2].token_type == TokenType.HEADER
+                i + 2 < len(codes) and
+                codes[i + 1] == _NEWLINE and
+                codes[i + 2] == _HEADER
             ):
                 return 3
             else:
@@ -119,30 +129,49 @@ def top_parse(tokens):
             return 0
 
     # Handle an empty docstring.
-    if not tokens:
+    if not codes:
         return list()
 
-    curr = list()  # type: List[Token]
-    overall = list()  # type: List[List[Token]]
     i = 0
-    while i < len(tokens) and tokens[i].token_type != TokenType.NEWLINE:
+    while i < len(codes) and codes[i] != _NEWLINE:
         i += 1
-    while i < len(tokens) and tokens[i].token_type == TokenType.NEWLINE:
+    while i < len(codes) and codes[i] == _NEWLINE:
         i += 1
-    overall = [tokens[:i]]
-    while i < len(tokens):
+    spans = [(0, i)]
+
+    # Each section is a contiguous run of tokens, starting here.
+    start = i
+    while i < len(codes):
         beginning_tokens = at_section_boundary(i)
-        if beginning_tokens and curr:
-            overall.append(curr)
-            curr = list()
-            curr.extend(tokens[i:i + beginning_tokens + 1])
+        if beginning_tokens and i > start:
+            spans.append((start, i))
+            start = i
             i += beginning_tokens + 1
         else:
-            curr.append(tokens[i])
             i += 1
-    if curr:
-        overall.append(curr)
-    return overall
+    if start < len(codes):
+        spans.append((start, len(codes)))
+    return spans
+
+
+def top_parse(tokens):
+    # type: (List[Token]) -> List[List[Token]]
+    """Split the docstring into sections.
+
+    Each section will be parsed individually, according
+    to the combinator.
+
+    Args:
+        tokens: The tokens representing the entire docstring.
+
+    Returns:
+        The docstring, split into sections.
+
+    """
+    return [
+        tokens[start:end]
+        for start, end in _section_spans(type_codes(tokens))
+    ]
 
 
 def _match(token):
@@ -230,12 +259,40 @@ def combinator(*args):
         return CykNode(symbol='docstring')
 
 
+def section_keyword(section):
+    # type: (List[Token]) -> TokenType
+    """Get the type of the token which determines the section's parsers.
+
+    Args:
+        section: A non-empty section from `top_parse`.
+
+    Returns:
+        The type of the token which `lookup` matches on.
+
+    """
+    return section[0].token_type
+
+
+_parsers = to_parsers(lookup)
+
+
+def parse_section(section, index):
+    # type: (List[Token], int) -> Optional[CykNode]
+    """Parse a single section from `top_parse`.
+
+    Args:
+        section: The section to parse.
+        index: The index of the section in the docstring.
+
+    Returns:
+        The parsed section, or None if it couldn't be parsed.
+
+    """
+    return parse_combined_section(top_parse, _parsers, section, index)
+
+
 def parse(tokens):
     # type: (List[Token]) -> Optional[CykNode]
-    def mapped_lookup(section, section_index=-1):
-        for grammar in lookup(section, section_index):
-            if inspect.isclass(grammar):
-                yield lambda x: cyk_parse(grammar, x)
-            else:
-                yield grammar
-    return parser_combinator(top_parse, mapped_lookup, combinator, tokens)
+    return parser_combinator(
+        top_parse, _parsers, combinator, tokens
+    )
@@ -1,6 +1,8 @@
-import inspect
-from typing import (
+from typing import (  # noqa: F401
     List,
+    Optional,
+    Sequence,
+    Tuple,
 )
 from functools import (
     reduce,
@@ -10,16 +12,16 @@ from ..custom_assert import Assert
 from ..token import (
     Token,
     TokenType,
-    KEYWORDS,
-)
-from .cyk import (
-    parse as cyk_parse,
+    KEYWORD_CODES,
+    type_codes,
 )
 from ..node import (
     CykNode,
 )
 from .combinator import (
+    parse_section as parse_combined_section,
     parser_combinator,
+    to_parsers,
 )
 from .long_description import (
     parse as long_description_parse,
@@ -37,52 +39,62 @@ from .grammars.sphinx_yields_section import YieldsGrammar
 from .grammars.sphinx_yield_type_section import YieldTypeGrammar
 
 
-def two_newline_separated_or_keyword(tokens, i):
-    # type: (List[Token], int) -> int
-    newline_count = 0
-    j = i
-    while j < len(tokens):
-        if tokens[j].token_type == TokenType.NEWLINE:
-            newline_count += 1
-        else:
-            break
-        j += 1
+_NEWLINE = TokenType.NEWLINE.value
+_COLON = TokenType.COLON.value
+
+
+def _section_spans(codes):
+    # type: (Sequence[int]) -> List[Tuple[int, int]]
+    """Find the start and end of each section, in a single pass.
+
+    Sections are separated by two or more newlines, or by a single
+    newline, if it's followed by a colon and a keyword.  (That is,
+    each item is its own section.)
 
-    if newline_count >= 2:
-        return j
+    Args:
+        codes: The codes of the token types (see `TokenBuffer`.)
 
-    if (j + 1 < len(tokens)
-            and tokens[j].token_type == TokenType.COLON
-            and tokens[j + 1].token_type in KEYWORDS):
-        return j
+    Returns:
+        The start and end of each section.
 
-    return 0
+    """
+    n = len(codes)
+    spans = list()  # type: List[Tuple[int, int]]
+
+    # Strip leading newlines.
+    i = 0
+    while i < n and codes[i] == _NEWLINE:
+        i += 1
+    prev = i
+
+    while i < n:
+        if codes[i] != _NEWLINE:
+            i += 1
+            continue
+        j = i
+        while j < n and codes[j] == _NEWLINE:
+            j += 1
+        if j - i >= 2 or (
+            j + 1 < n
+            and codes[j] == _COLON
+            and codes[j + 1] in KEYWORD_CODES
+        ):
+            if i > prev:
+                spans.append((prev, i))
+            prev = j
+        i = j
+
+    if n > prev:
+        spans.append((prev, n))
+    return spans
 
 
 def top_parse(tokens):
     # type: (List[Token]) -> List[List[Token]]
-    all_sections = list()
-    curr = 0
-    # Strip leading newlines.
-    while curr < len(tokens) and tokens[curr].token_type == TokenType.NEWLINE:
-        curr += 1
-    prev = curr
-
-    while curr < len(tokens):
-        split_end = two_newline_separated_or_keyword(tokens, curr)
-        if split_end > curr:
-            if tokens[prev:curr]:
-                all_sections.append(
-                    tokens[prev:curr]
-                )
-            curr = split_end
-            prev = curr
-        else:
-            curr += 1
-    last_section = tokens[prev:curr]
-    if last_section:
-        all_sections.append(last_section)
-    return all_sections
+    return [
+        tokens[start:end]
+        for start, end in _section_spans(type_codes(tokens))
+    ]
 
 
 def _match(token):
@@ -183,11 +195,42 @@ def combinator(*args):
         return CykNode(symbol='docstring')
 
 
+def section_keyword(section):
+    # type: (List[Token]) -> Optional[TokenType]
+    """Get the type of the token which determines the section's parsers.
+
+    Args:
+        section: A non-empty section from `top_parse`.
+
+    Returns:
+        The type of the token which `lookup` matches on.
+
+    """
+    if (section[0].token_type == TokenType.COLON
+            and len(section) > 1):
+        return section[1].token_type
+    return None
+
+
+_parsers = to_parsers(lookup)
+
+
+def parse_section(section, index):
+    # type: (List[Token], int) -> Optional[CykNode]
+    """Parse a single section from `top_parse`.
+
+    Args:
+        section: The section to parse.
+        index: The index of the section in the docstring.
+
+    Returns:
+        The parsed section, or None if it couldn't be parsed.
+
+    """
+    return parse_combined_section(top_parse, _parsers, section, index)
+
+
 def parse(tokens):
-    def mapped_lookup(section, section_index=-1):
-        for grammar in lookup(section, section_index):
-            if inspect.isclass(grammar):
-                yield lambda x: cyk_parse(grammar, x)
-            else:
-                yield grammar
-    return parser_combinator(top_parse, mapped_lookup, combinator, tokens)
+    return parser_combinator(
+        top_parse, _parsers, combinator, tokens
+    )
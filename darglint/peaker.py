@@ -1,5 +1,6 @@
 """Describes Peaker, a stream transformer for peaking ahead."""
 from collections import deque
+from collections.abc import Sequence
 
 from typing import (  # noqa: F401
     Callable,
@@ -24,6 +25,14 @@ class Peaker(Generic[T]):
     class _Empty(object):
         value = None
 
+    def __new__(cls, stream, lookahead=1):
+        # type: (Iterator[T], int) -> Peaker[T]
+        # Sequences can be indexed directly, so they don't need
+        # to be buffered.
+        if cls is Peaker and isinstance(stream, Sequence):
+            cls = SequencePeaker
+        return super(Peaker, cls).__new__(cls)
+
     def __init__(self, stream, lookahead=1):
         # type: (Iterator[T], int) -> None
         """Create a new peaker.
@@ -167,3 +176,135 @@ class Peaker(Generic[T]):
         while self.has_next() and test(self.peak()):
             passing_elements.append(self.next())
         return passing_elements
+
+
+class SequencePeaker(Peaker[T]):
+    """A peaker over a sequence, such as a string or a list.
+
+    Rather than buffering items from an iterator, this keeps an
+    index into the sequence, so peaking is a lookup, and `take_while`
+    returns a slice.  `Peaker` creates one of these when it's given
+    a sequence.
+
+    """
+
+    def __init__(self, stream, lookahead=1):
+        # type: (Sequence[T], int) -> None
+        """Create a new peaker.
+
+        Args:
+            stream: A sequence of T objects, which may be empty.
+            lookahead: The amount of lookahead this should allow
+                in the stream.
+
+        """
+        self.stream = stream  # type: ignore
+        self.lookahead = lookahead
+        self.index = 0
+        self.length = len(stream)
+
+    def next(self):
+        # type: () -> T
+        """Get the next item in the stream, moving it forward.
+
+        Side effects:
+            Moves the stream forward.
+
+        Raises:
+            StopIteration: If there are no more items in the stream.
+
+        Returns:
+            The next item of type T in the stream.
+
+        """
+        if self.index >= self.length:
+            raise StopIteration
+        self.prev = self.stream[self.index]  # type: ignore
+        self.index += 1
+        return self.prev
+
+    def peak(self, lookahead=1):
+        # type: (int) -> Optional[T]
+        """Get the next letter in the stream, without moving it forward.
+
+        Args:
+            lookahead: The amount of tokens to look ahead in
+                the buffer.
+
+        Raises:
+            Exception: If we are not able to buffer to the given
+                lookahead.
+
+        Returns:
+            The next item of type T in the stream.
+
+        """
+        if lookahead > self.lookahead:
+            raise Exception(
+                'Cannot peak to {}: beyond buffer lookahead {}'.format(
+                    lookahead, self.lookahead
+                )
+            )
+        index = self.index + lookahead - 1
+        if index >= self.length:
+            return None
+        return self.stream[index]  # type: ignore
+
+    def rpeak(self, lookahead=1):
+        # type: (int) -> T
+        """Peak at the item lookahead ahead, raising an exception if empty.
+
+        Args:
+            lookahead: The amount of tokens to look ahead in
+                the buffer.
+
+        Raises:
+            Exception: If we are not able to buffer to the given
+                lookahead.
+            IndexError: If there are no items at the given index ahead.
+
+        Returns:
+            The next item of type T in the stream.
+
+        """
+        if lookahead > self.lookahead:
+            raise Exception(
+                'Cannot peak to {}: beyond buffer lookahead {}'.format(
+                    lookahead, self.lookahead
+                )
+            )
+        index = self.index + lookahead - 1
+        if index >= self.length:
+            raise IndexError
+        return self.stream[index]  # type: ignore
+
+    def has_next(self):
+        # type: () -> bool
+        """Tell whether there are more tokens in the stream.
+
+        Returns:
+            True if there are more tokens, false otherwise.
+
+        """
+        return self.index < self.length
+
+    def take_while(self, test):
+        # type: (Callable) -> List[T]
+        """Return elements from the stream while they pass the test.
+
+        Args:
+            test: A function which returns true if we would like to collect
+                the token, or false if we would like to stop.
+
+        Returns:
+            A list of items (of type T), which pass the given test function.
+
+        """
+        start = end = self.index
+        while end < self.length and test(self.stream[end]):  # type: ignore
+            end += 1
+        if end == start:
+            return []
+        self.index = end
+        self.prev = self.stream[end - 1]  # type: ignore
+        return list(self.stream[start:end])  # type: ignore
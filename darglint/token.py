@@ -1,6 +1,19 @@
 """Defines the tokens that result from lexing, as well as their types."""
 
+from array import array
+from collections.abc import Sequence as SequenceABC
 from enum import Enum
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 
 class BaseTokenType(Enum):
@@ -60,6 +73,9 @@ KEYWORDS = {
     TokenType.REFERENCES,
 }
 
+# The codes (see `TokenBuffer`) of the keyword token types.
+KEYWORD_CODES = {token_type.value for token_type in KEYWORDS}
+
 
 class Token(object):
     """A token representing anything which can appear in a docstring."""
@@ -99,3 +115,286 @@ class Token(object):
 
         """
         return str(self)
+
+
+# The token types, indexed by their codes (their values.)
+_TYPES_BY_CODE = [None] * (max(x.value for x in TokenType) + 1)  # type: List[Any]  # noqa: E501
+for _token_type in TokenType:
+    _TYPES_BY_CODE[_token_type.value] = _token_type
+
+_INDENT = TokenType.INDENT.value
+
+
+class _Storage(object):
+    """The arrays shared by a buffer and its slices."""
+
+    def __init__(self, source):
+        # type: (str) -> None
+        self.source = source
+        self.types = array('B')
+        self.line_numbers = array('L')
+
+        # The span of the source which each token was lexed from.
+        # Tokens which were appended with an explicit value have
+        # an empty span, and their value in `values`.
+        self.starts = array('L')
+        self.ends = array('L')
+        self.values = dict()  # type: Dict[int, str]
+
+        # The words which were condensed into a single token.
+        self.joined = set()  # type: Set[int]
+
+        self.views = list()  # type: List[Optional[Token]]
+
+    def value(self, i):
+        # type: (int) -> str
+        if i in self.values:
+            return self.values[i]
+        if self.types[i] == _INDENT:
+            return ' ' * 4
+        text = self.source[self.starts[i]:self.ends[i]]
+        if i in self.joined:
+            return ' '.join(text.split())
+        return text
+
+
+class _TokenView(Token):
+    """A token in a `TokenBuffer`, whose value is read lazily."""
+
+    def __init__(self, storage, index):
+        # type: (_Storage, int) -> None
+        self._storage = storage
+        self._index = index
+        self._value = None  # type: Optional[str]
+        self.token_type = _TYPES_BY_CODE[storage.types[index]]
+        self.line_number = storage.line_numbers[index]
+
+    @property  # type: ignore
+    def value(self):
+        # type: () -> str
+        if self._value is None:
+            self._value = self._storage.value(self._index)
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        # type: (str) -> None
+        self._value = value
+
+
+class TokenBuffer(object):
+    """A compact sequence of tokens.
+
+    Rather than a `Token` object for each token, the buffer holds
+    parallel arrays of the token types (as their integer codes),
+    line numbers, and the span of the source each token was lexed
+    from.  A `Token` is only created for a position when it is
+    indexed, and then it's kept, so that indexing the same position
+    always gives the same token.  Its value is only read from the
+    source when it's used.
+
+    Slicing a buffer gives a buffer over the same arrays.  Only
+    tokens of type `TokenType` can be held in a buffer.
+
+    """
+
+    def __init__(self, source=''):
+        # type: (str) -> None
+        """Create an empty buffer.
+
+        Args:
+            source: The string which the tokens will be lexed from.
+
+        """
+        self._storage = _Storage(source)
+        self._start = 0
+        self._stop = 0
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        # type: (Sequence[Token]) -> TokenBuffer
+        """Create a buffer holding the given tokens.
+
+        Args:
+            tokens: The tokens to hold.  The buffer will return
+                these same tokens when indexed.
+
+        Returns:
+            A buffer holding the tokens.
+
+        """
+        if isinstance(tokens, TokenBuffer):
+            return tokens
+        buffer = cls()
+        for token in tokens:
+            buffer.append(token.value, token.token_type, token.line_number)
+        buffer._storage.views = list(tokens)
+        return buffer
+
+    def _append(self, token_type, line_number, start, end):
+        # type: (TokenType, int, int, int) -> None
+        storage = self._storage
+        if self._stop != len(storage.types):
+            raise ValueError('Cannot append to a slice of a buffer.')
+        storage.types.append(token_type.value)
+        storage.line_numbers.append(line_number)
+        storage.starts.append(start)
+        storage.ends.append(end)
+        storage.views.append(None)
+        self._stop += 1
+
+    def append(self, value, token_type, line_number):
+        # type: (str, TokenType, int) -> None
+        """Add a token to the end of the buffer.
+
+        Args:
+            value: The value of the token.
+            token_type: The type of the token.
+            line_number: The line number where the token resides.
+
+        Raises:
+            ValueError: If this buffer is a slice of another.
+
+        """
+        self._append(token_type, line_number, 0, 0)
+        self._storage.values[self._stop - 1] = value
+
+    def append_span(self, start, end, token_type, line_number, joined=False):
+        # type: (int, int, TokenType, int, bool) -> None
+        """Add a token, lexed from the source, to the end of the buffer.
+
+        Args:
+            start: The index in the source where the token begins.
+            end: The index in the source after the token.
+            token_type: The type of the token.
+            line_number: The line number where the token resides.
+            joined: Whether the token is several words, condensed
+                into one.  Its value will be the words, separated by
+                single spaces.
+
+        Raises:
+            ValueError: If this buffer is a slice of another.
+
+        """
+        self._append(token_type, line_number, start, end)
+        if joined:
+            self._storage.joined.add(self._stop - 1)
+
+    def type_codes(self):
+        # type: () -> Sequence[int]
+        """Get the code of each token's type.
+
+        Returns:
+            The value of each token's `TokenType`.
+
+        """
+        return self._storage.types[self._start:self._stop]
+
+    def token_types(self):
+        # type: () -> List[TokenType]
+        """Get the type of each token.
+
+        Returns:
+            The type of each token.
+
+        """
+        return [_TYPES_BY_CODE[code] for code in self.type_codes()]
+
+    def signature(self):
+        # type: () -> Optional[Tuple[bytes, str]]
+        """Get a key identifying these tokens, wherever they occur.
+
+        Two sections with the same signature have the same token
+        types, values and relative line numbers.  (Though sections
+        with the same tokens may have different signatures.)
+
+        Returns:
+            The type codes and the source the tokens were lexed
+            from, or None if any token wasn't lexed from the source.
+
+        """
+        storage = self._storage
+        if not len(self) or storage.values and any(
+            i in storage.values for i in range(self._start, self._stop)
+        ):
+            return None
+        return (
+            self.type_codes().tobytes(),
+            storage.source[
+                storage.starts[self._start]:storage.ends[self._stop - 1]
+            ],
+        )
+
+    def _view(self, i):
+        # type: (int) -> Token
+        storage = self._storage
+        view = storage.views[i]
+        if view is None:
+            view = _TokenView(storage, i)
+            storage.views[i] = view
+        return view
+
+    def __len__(self):
+        # type: () -> int
+        return self._stop - self._start
+
+    def __iter__(self):
+        # type: () -> Iterator[Token]
+        for i in range(self._start, self._stop):
+            yield self._view(i)
+
+    def __getitem__(self, index):
+        # type: (Union[int, slice]) -> Any
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            sliced = TokenBuffer()
+            sliced._storage = self._storage
+            sliced._start = self._start + start
+            sliced._stop = self._start + max(start, stop)
+            return sliced
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('TokenBuffer index out of range')
+        return self._view(self._start + index)
+
+    def __repr__(self):
+        return 'TokenBuffer({})'.format(list(self))
+
+
+SequenceABC.register(TokenBuffer)
+
+
+def token_types(tokens):
+    # type: (Sequence[Token]) -> List[Any]
+    """Get the type of each token.
+
+    Args:
+        tokens: A list of tokens, or a `TokenBuffer`.
+
+    Returns:
+        The type of each token.
+
+    """
+    if isinstance(tokens, TokenBuffer):
+        return tokens.token_types()
+    return [token.token_type for token in tokens]
+
+
+def type_codes(tokens):
+    # type: (Sequence[Token]) -> Sequence[int]
+    """Get the code of each token's type.
+
+    Args:
+        tokens: A list of tokens, or a `TokenBuffer`.  Each token
+            should be of type `TokenType`.
+
+    Returns:
+        The value of each token's type.
+
+    """
+    if isinstance(tokens, TokenBuffer):
+        return tokens.type_codes()
+    return [token.token_type.value for token in tokens]
@@ -0,0 +1,123 @@
+"""Find the section lengths where the NumPy backend is faster.
+
+Every grammar which would be tried for each section of the goldens
+is parsed the way the parser combinator would with each backend:
+the python backend runs the recognizer, and only parses if it
+succeeds; the NumPy backend parses directly.  Arguments sections
+with more and more items are added, since the goldens have few long
+sections.  The total time for each backend is reported by section
+length, which is how `combinator.NUMPY_MIN_TOKENS` was chosen.
+
+To run,
+
+    python integration_tests/cyk_backend_benchmark.py
+
+"""
+
+import inspect
+import time
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from darglint.lex import (
+    condense,
+    lex,
+)
+from darglint.parse import (
+    cyk,
+    cyk_numpy,
+    google,
+)
+
+from cyk_benchmark import (
+    _read_goldens,
+    get_workload,
+)
+
+
+# The upper bound of each bucket of section lengths.
+BUCKETS = [8, 16, 24, 32, 48, 64, 128, 256, 512]
+
+
+def parse_python(grammar, section):
+    # type: (Any, List[Any]) -> Any
+    start = cyk.recognize_start(grammar, section)
+    if start is None:
+        return None
+    return cyk.parse(grammar, section, start)
+
+
+def long_arguments_sections():
+    # type: () -> List[Tuple[Any, List[Any]]]
+    """Get the grammars and sections for long arguments sections.
+
+    Returns:
+        A list of grammars and the tokens they would parse.
+
+    """
+    workload = list()
+    for items in [2, 4, 8, 16, 32]:
+        docstring = 'Do it.\n\nArgs:\n' + '\n'.join([
+            '    x{} (int): The argument number {}.'.format(i, i)
+            for i in range(items)
+        ]) + '\n'
+        tokens = condense(lex(docstring))
+        section = google.top_parse(tokens)[1]
+        for grammar in google.lookup(section, 1):
+            if inspect.isclass(grammar):
+                workload.append((grammar, section))
+    return workload
+
+
+def measure(engine, workload):
+    # type: (Callable, List[Tuple[Any, List[Any]]]) -> Dict[int, float]
+    """Measure the time the engine takes for each bucket of lengths.
+
+    Args:
+        engine: The parse function to measure.
+        workload: The grammars and sections to parse.
+
+    Returns:
+        The total time taken for each bucket, in seconds.
+
+    """
+    durations = {bucket: 0.0 for bucket in BUCKETS}
+    for grammar, section in workload:
+        bucket = next(x for x in BUCKETS if len(section) <= x)
+        start = time.perf_counter()
+        engine(grammar, section)
+        durations[bucket] += time.perf_counter() - start
+    return durations
+
+
+if __name__ == '__main__':
+    if not cyk_numpy.available():
+        print('NumPy is not installed.')
+        exit(1)
+    workload = get_workload(_read_goldens()) + long_arguments_sections()
+    counts = {bucket: 0 for bucket in BUCKETS}
+    for _, section in workload:
+        counts[next(x for x in BUCKETS if len(section) <= x)] += 1
+    python = measure(parse_python, workload)
+    numpy = measure(cyk_numpy.parse, workload)
+    print('{}{}{}{}'.format(
+        'tokens'.ljust(10),
+        'parses'.ljust(10),
+        'python (s)'.ljust(15),
+        'numpy (s)',
+    ))
+    lower = 0
+    for bucket in BUCKETS:
+        if counts[bucket]:
+            print('{}{}{}{}'.format(
+                '{}-{}'.format(lower + 1, bucket).ljust(10),
+                str(counts[bucket]).ljust(10),
+                '{:.3f}'.format(python[bucket]).ljust(15),
+                '{:.3f}'.format(numpy[bucket]),
+            ))
+        lower = bucket
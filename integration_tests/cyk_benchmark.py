@@ -0,0 +1,125 @@
+"""Compare the CYK engines against each other on the goldens.
+
+Each golden is lexed and split into sections, and every grammar
+which would be tried for a section is run through each engine.
+The total time and the peak memory allocated during the parse
+are reported for each engine.
+
+To run,
+
+    python integration_tests/cyk_benchmark.py
+
+"""
+
+import inspect
+import json
+import time
+import tracemalloc
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from darglint.lex import (
+    condense,
+    lex,
+)
+from darglint.parse import (
+    cyk,
+    cyk_numpy,
+    google,
+    numpy,
+    sphinx,
+)
+
+
+ENGINES = [
+    ('dense', cyk.parse_dense),
+    ('sparse', cyk.parse),
+]  # type: List[Tuple[str, Callable]]
+
+if cyk_numpy.available():
+    ENGINES.append(('numpy', cyk_numpy.parse))
+
+
+MODULES = {
+    'GOOGLE': google,
+    'SPHINX': sphinx,
+    'NUMPY': numpy,
+}
+
+
+def _read_goldens(filename='integration_tests/goldens.json'):
+    # type: (str) -> List[Dict[str, Any]]
+    with open(filename, 'r') as fin:
+        return json.load(fin)
+
+
+def get_workload(goldens):
+    """Get every (grammar, section) pair which would be parsed.
+
+    Args:
+        goldens: The goldens to get sections from.
+
+    Returns:
+        A list of grammars and the tokens they would parse.
+
+    """
+    workload = list()
+    for golden in goldens:
+        module = MODULES[golden['type']]
+        tokens = condense(lex(golden['docstring']))
+        for i, section in enumerate(module.top_parse(tokens)):
+            for grammar in module.lookup(section, i):
+                if inspect.isclass(grammar):
+                    workload.append((grammar, section))
+    return workload
+
+
+def measure(engine, workload):
+    # type: (Callable, List[Tuple[Any, List[Any]]]) -> Tuple[float, int]
+    """Measure the time and peak memory of the engine.
+
+    Args:
+        engine: The parse function to measure.
+        workload: The grammars and sections to parse.
+
+    Returns:
+        The total time taken, in seconds, and the largest peak
+        memory of any single parse, in bytes.
+
+    """
+    duration = 0.0
+    for grammar, section in workload:
+        start = time.time()
+        engine(grammar, section)
+        duration += time.time() - start
+
+    # Measure memory separately, since tracing slows everything
+    # down considerably.
+    peak = 0
+    for grammar, section in workload:
+        tracemalloc.start()
+        engine(grammar, section)
+        _, curr_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = max(peak, curr_peak)
+    return duration, peak
+
+
+if __name__ == '__main__':
+    workload = get_workload(_read_goldens())
+    print('{} sections'.format(len(workload)))
+    print('{}{}{}'.format(
+        'engine'.ljust(15), 'time (s)'.ljust(15), 'peak (KiB)',
+    ))
+    for name, engine in ENGINES:
+        duration, peak = measure(engine, workload)
+        print('{}{}{}'.format(
+            name.ljust(15),
+            '{:.3f}'.format(duration).ljust(15),
+            peak // 1024,
+        ))
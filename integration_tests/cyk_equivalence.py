@@ -0,0 +1,56 @@
+"""Make sure the CYK backends agree on every section of the goldens.
+
+To run,
+
+    python -m unittest integration_tests.cyk_equivalence
+
+"""
+
+from unittest import (
+    skipIf,
+    TestCase,
+)
+
+from darglint.parse import (
+    cyk,
+    cyk_numpy,
+)
+
+from .cyk_benchmark import (
+    _read_goldens,
+    get_workload,
+)
+
+
+class CykEquivalenceTest(TestCase):
+
+    def setUp(self):
+        self.workload = get_workload(_read_goldens())
+
+    def assertSameTree(self, actual, expected, message):
+        if expected is None:
+            self.assertIsNone(actual, message)
+            return
+        self.assertIsNotNone(actual, message)
+        actual_nodes = list(actual.in_order_traverse())
+        expected_nodes = list(expected.in_order_traverse())
+        self.assertEqual(len(actual_nodes), len(expected_nodes), message)
+        for x, y in zip(actual_nodes, expected_nodes):
+            self.assertEqual(x.symbol, y.symbol, message)
+            self.assertEqual(x.value, y.value, message)
+            self.assertEqual(x.weight, y.weight, message)
+            self.assertEqual(
+                list(x.annotations), list(y.annotations), message,
+            )
+
+    @skipIf(not cyk_numpy.available(), 'NumPy is not installed.')
+    def test_numpy_backend_matches_sparse(self):
+        for grammar, section in self.workload:
+            self.assertSameTree(
+                cyk_numpy.parse(grammar, section),
+                cyk.parse(grammar, section),
+                '{} disagreed on {}'.format(
+                    grammar.__name__,
+                    ' '.join(token.value or '' for token in section),
+                ),
+            )
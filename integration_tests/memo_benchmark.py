@@ -0,0 +1,96 @@
+"""Count the tree walks made while checking each docstring.
+
+Every check asks the docstring for its noqas, items, types or line
+numbers, and computing any of these walks some part of the tree.
+With memoization (see `darglint.docstring.base.memoized`), each is
+only computed once per docstring.  For each function in darglint's
+own source, this runs the checks, and prints the mean number of
+walks per docstring with and without memoization.
+
+To run,
+
+    python -m pytest -s integration_tests/memo_benchmark.py
+
+"""
+
+import ast
+from collections import (
+    Counter,
+)
+import os
+from typing import (  # noqa: F401
+    List,
+)
+from unittest import (
+    mock,
+    TestCase,
+)
+
+from darglint.docstring.base import (  # noqa: F401
+    BaseDocstring,
+)
+from darglint.docstring import (
+    google,
+)
+from darglint.function_description import (
+    get_function_descriptions,
+)
+from darglint.integrity_checker import (
+    IntegrityChecker,
+)
+from darglint.utils import (
+    ConfigurationContext,
+)
+
+
+SOURCE = os.path.join(os.path.dirname(__file__), '..', 'darglint')
+
+
+def _functions():
+    for root, _, filenames in os.walk(SOURCE):
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            with open(os.path.join(root, filename), 'r') as fin:
+                program = ast.parse(fin.read())
+            yield from get_function_descriptions(program)
+
+
+class MemoBenchmark(TestCase):
+
+    def test_walks_per_docstring(self):
+        docstrings = list()  # type: List[BaseDocstring]
+
+        def from_google(root):
+            docstring = google.Docstring(root)
+            docstrings.append(docstring)
+            return docstring
+
+        with ConfigurationContext(), mock.patch(
+            'darglint.integrity_checker.Docstring.from_google',
+            side_effect=from_google,
+        ):
+            checker = IntegrityChecker()
+            for function in _functions():
+                checker.run_checks(function)
+            checker.executor.shutdown()
+
+        self.assertTrue(docstrings)
+        calls = Counter()  # type: Counter
+        computed = Counter()  # type: Counter
+        for docstring in docstrings:
+            calls.update(docstring.memo.calls)
+            computed.update(docstring.memo.computed)
+
+        print('{} docstrings'.format(len(docstrings)))
+        print('{:<32}{:>10}{:>10}'.format('', 'before', 'after'))
+        for name in sorted(calls):
+            print('{:<32}{:>10.2f}{:>10.2f}'.format(
+                name,
+                calls[name] / len(docstrings),
+                computed[name] / len(docstrings),
+            ))
+        before = sum(calls.values()) / len(docstrings)
+        after = sum(computed.values()) / len(docstrings)
+        print('{:<32}{:>10.2f}{:>10.2f}'.format('total', before, after))
+        self.assertLessEqual(after, before)
@@ -0,0 +1,95 @@
+"""Measure the memory held by the nodes of a parse tree.
+
+The parse trees for every docstring in a file are kept until the
+file's errors are reported, so the size of each node matters.  This
+parses the docstring in `integration_tests/max_golden.json` (the
+same file read by `max_golden_profile.py`), and then, using
+tracemalloc, measures the memory held by
+
+- a copy of each node in the tree, and
+- the line numbers cached on each node.
+
+The tokens are shared with the original tree, so they aren't counted.
+To run,
+
+    python -m pytest -s integration_tests/memory_benchmark.py
+
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+    List,
+    Tuple,
+)
+from unittest import (
+    TestCase,
+)
+
+from darglint.lex import (
+    tokenize,
+)
+from darglint.node import (
+    CykNode,
+)
+from darglint.parse import (
+    google,
+)
+
+
+def _copy(node):
+    # type: (CykNode) -> CykNode
+    return CykNode(
+        node.symbol,
+        lchild=_copy(node.lchild) if node.lchild else None,
+        rchild=_copy(node.rchild) if node.rchild else None,
+        value=node.value,
+        annotations=node.annotations,
+        weight=node.weight,
+    )
+
+
+def _measure(f):
+    # type: (Callable[[], Any]) -> Tuple[Any, int]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = f()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+class MemoryBenchmark(TestCase):
+
+    def test_bytes_per_node(self):
+        with open('integration_tests/max_golden.json', 'r') as fin:
+            data = json.load(fin)
+        assert len(data) == 1
+        golden = data[0]
+        original = google.parse(tokenize(golden['docstring']))
+        self.assertIsNotNone(original)
+
+        root, nodes = _measure(lambda: _copy(original))
+        count = len(list(root.in_order_traverse()))
+
+        def cache_line_numbers():
+            for node in root.in_order_traverse():
+                node.line_numbers
+
+        _, line_numbers = _measure(cache_line_numbers)
+
+        print('{} nodes'.format(count))
+        print('{:<24}{:>10}{:>16}'.format('', 'bytes', 'bytes per node'))
+        for name, size in [
+            ('nodes', nodes),
+            ('line numbers', line_numbers),
+            ('total', nodes + line_numbers),
+        ]:
+            print('{:<24}{:>10}{:>16.1f}'.format(name, size, size / count))
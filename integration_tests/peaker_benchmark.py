@@ -0,0 +1,86 @@
+"""Micro-benchmarks comparing the buffered and sequence peakers.
+
+Each workload is run with a `Peaker` over an iterator (which buffers
+its lookahead in a deque) and over the sequence itself (which gets a
+`SequencePeaker`.)  The timings are printed, and the sequence peaker
+is expected to be at least as fast.
+
+To run,
+
+    python -m pytest -s integration_tests/peaker_benchmark.py
+
+"""
+
+import time
+from typing import (  # noqa: F401
+    Any,
+    Callable,
+)
+from unittest import (
+    TestCase,
+)
+
+from darglint.lex import (
+    tokenize,
+)
+from darglint.peaker import (
+    Peaker,
+    SequencePeaker,
+)
+
+
+REPETITIONS = 20
+
+TEXT = '\n'.join([
+    'Args:',
+    '    x (int): The first argument, which goes on for a while.',
+    '    y: The second, with (parentheses) and: colons.',
+    '',
+]) * 200
+
+
+def _time(fun, stream):
+    # type: (Callable[[Peaker], Any], Callable[[], Any]) -> float
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        fun(Peaker(stream(), lookahead=5))
+    return time.perf_counter() - start
+
+
+def _take_words(peaker):
+    # type: (Peaker) -> None
+    while peaker.has_next():
+        if peaker.peak().isspace():
+            peaker.next()
+        else:
+            peaker.take_while(lambda x: not x.isspace())
+
+
+def _step(peaker):
+    # type: (Peaker) -> None
+    while peaker.has_next():
+        peaker.peak(lookahead=5)
+        peaker.next()
+
+
+class PeakerBenchmark(TestCase):
+
+    def compare(self, name, fun, sequence):
+        # type: (str, Callable[[Peaker], Any], Any) -> None
+        self.assertIsInstance(Peaker(sequence), SequencePeaker)
+        buffered = _time(fun, lambda: (x for x in sequence))
+        indexed = _time(fun, lambda: sequence)
+        print('{}: buffered {:.4f}s, sequence {:.4f}s'.format(
+            name, buffered, indexed,
+        ))
+        self.assertLessEqual(indexed, buffered)
+
+    def test_take_while_over_string(self):
+        self.compare('take_while over str', _take_words, TEXT)
+
+    def test_step_over_string(self):
+        self.compare('next/peak over str', _step, TEXT)
+
+    def test_step_over_tokens(self):
+        tokens = list(tokenize(TEXT))
+        self.compare('next/peak over list', _step, tokens)
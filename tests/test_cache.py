@@ -0,0 +1,147 @@
+"""Tests for the cache of parsed sections."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from darglint.lex import (
+    condense,
+    lex,
+)
+from darglint.parse.cache import (
+    SectionCache,
+)
+from darglint.parse.cyk import (
+    parse as cyk_parse,
+)
+from darglint.parse.grammars.google_raises_section import (
+    RaisesGrammar,
+)
+
+
+def _tokenize(section, line_number=0):
+    tokens = condense(lex(section))
+    for token in tokens:
+        token.line_number += line_number
+    return tokens
+
+
+def _leaves(node):
+    return [x.value for x in node.in_order_traverse() if x.value is not None]
+
+
+class SectionCacheTest(TestCase):
+
+    section = '\n'.join([
+        'Raises:',
+        '    ValueError: If it is wrong.',
+    ])
+
+    def setUp(self):
+        self.calls = 0
+
+    def parse(self, tokens):
+        self.calls += 1
+        return cyk_parse(RaisesGrammar, tokens)
+
+    def test_repeated_section_parsed_once(self):
+        cache = SectionCache()
+        first = _tokenize(self.section)
+        second = _tokenize(self.section, line_number=10)
+        expected = cache.parse(RaisesGrammar, self.parse, first)
+        actual = cache.parse(RaisesGrammar, self.parse, second)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(expected)
+        self.assertTrue(actual.equals(cyk_parse(RaisesGrammar, second)))
+
+    def test_rebuilt_tree_uses_given_tokens(self):
+        cache = SectionCache()
+        cache.parse(RaisesGrammar, self.parse, _tokenize(self.section))
+        tokens = _tokenize(self.section, line_number=10)
+        node = cache.parse(RaisesGrammar, self.parse, tokens)
+        for leaf in _leaves(node):
+            self.assertTrue(any(leaf is token for token in tokens))
+        self.assertEqual(node.line_numbers, (10, 11))
+
+    def test_parsers_cached_separately(self):
+        cache = SectionCache()
+        tokens = _tokenize(self.section)
+        cache.parse(RaisesGrammar, self.parse, tokens)
+        cache.parse('other', self.parse, tokens)
+        self.assertEqual(self.calls, 2)
+
+    def test_different_values_not_shared(self):
+        cache = SectionCache()
+        cache.parse(RaisesGrammar, self.parse, _tokenize(self.section))
+        tokens = _tokenize(self.section.replace('wrong', 'right'))
+        node = cache.parse(RaisesGrammar, self.parse, tokens)
+        self.assertEqual(self.calls, 2)
+        self.assertIn('If it is right.', [x.value for x in _leaves(node)])
+
+    def test_failures_cached(self):
+        cache = SectionCache()
+        tokens = _tokenize('Raises:')
+        self.assertIsNone(cache.parse(RaisesGrammar, self.parse, tokens))
+        self.assertIsNone(cache.parse(RaisesGrammar, self.parse, tokens))
+        self.assertEqual(self.calls, 1)
+
+    def test_least_recently_used_dropped(self):
+        cache = SectionCache(maxsize=2)
+        sections = [
+            _tokenize(self.section.replace('wrong', word))
+            for word in ['a', 'b', 'c']
+        ]
+        cache.parse(RaisesGrammar, self.parse, sections[0])
+        cache.parse(RaisesGrammar, self.parse, sections[1])
+        cache.parse(RaisesGrammar, self.parse, sections[0])
+        cache.parse(RaisesGrammar, self.parse, sections[2])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(self.calls, 3)
+        cache.parse(RaisesGrammar, self.parse, sections[0])
+        self.assertEqual(self.calls, 3)
+        cache.parse(RaisesGrammar, self.parse, sections[1])
+        self.assertEqual(self.calls, 4)
+
+    def test_zero_size_disables_cache(self):
+        cache = SectionCache(maxsize=0)
+        tokens = _tokenize(self.section)
+        cache.parse(RaisesGrammar, self.parse, tokens)
+        cache.parse(RaisesGrammar, self.parse, tokens)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear_resets_counters(self):
+        cache = SectionCache()
+        cache.parse(RaisesGrammar, self.parse, _tokenize(self.section))
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_changes_to_result_not_cached(self):
+        cache = SectionCache()
+        first = cache.parse(
+            RaisesGrammar, self.parse, _tokenize(self.section),
+        )
+        first.symbol = 'changed'
+        first.annotations = ('changed',)
+        first.lchild = None
+        tokens = _tokenize(self.section)
+        second = cache.parse(RaisesGrammar, self.parse, tokens)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(second.equals(cyk_parse(RaisesGrammar, tokens)))
+
+    def test_shared_between_threads(self):
+        cache = SectionCache(maxsize=4)
+        sections = [
+            _tokenize(self.section.replace('wrong', str(i)), line_number=i)
+            for i in range(16)
+        ]
+
+        def parse(i):
+            tokens = sections[i % len(sections)]
+            node = cache.parse(RaisesGrammar, self.parse, tokens)
+            return node.equals(cyk_parse(RaisesGrammar, tokens))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertTrue(all(executor.map(parse, range(400))))
+        self.assertEqual(cache.hits + cache.misses, 400)
+        self.assertLessEqual(len(cache), 4)
@@ -5,6 +5,7 @@ from random import (
     randint,
 )
 from string import ascii_letters
+import tempfile
 from unittest import (
     mock,
     TestCase,
@@ -15,6 +16,8 @@ from darglint.config import (
     POSSIBLE_CONFIG_FILENAMES,
     find_config_file_in_path,
     get_logger,
+    CykBackend,
+    load_config_file,
     LogLevel,
 )
 from darglint.utils import (
@@ -100,3 +103,30 @@ class LoggingTestCase(TestCase):
         with ConfigurationContext(log_level=LogLevel.ERROR):
             logger = get_logger()
             self.assertEqual(logger.level, LogLevel.ERROR.value)
+
+
+class CykBackendTestCase(TestCase):
+
+    def test_from_string(self):
+        self.assertEqual(CykBackend.from_string('numpy'), CykBackend.NUMPY)
+        self.assertEqual(CykBackend.from_string(' Python '), CykBackend.PYTHON)
+        with self.assertRaises(ValueError):
+            CykBackend.from_string('fortran')
+
+    def test_backend_read_from_config_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.cfg') as fout:
+            fout.write('[darglint]\ncyk_backend=numpy\n')
+            fout.flush()
+            config = load_config_file(fout.name)
+        self.assertEqual(config.cyk_backend, CykBackend.NUMPY)
+
+
+class AdaptiveParsingTestCase(TestCase):
+
+    def test_read_from_config_file(self):
+        for value, expected in [('true', True), ('False', False)]:
+            with tempfile.NamedTemporaryFile('w', suffix='.cfg') as fout:
+                fout.write('[darglint]\nadaptive_parsing={}\n'.format(value))
+                fout.flush()
+                config = load_config_file(fout.name)
+            self.assertEqual(config.adaptive_parsing, expected)
@@ -4,11 +4,26 @@ from collections import (
     deque,
 )
 from unittest import (
+    mock,
+    skipIf,
     TestCase,
 )
 import random
 
-from darglint.parse.cyk import parse
+from darglint.parse import (
+    cyk_numpy,
+)
+from darglint.parse.cyk import (
+    _could_derive,
+    _get_edge_masks,
+    parse,
+    parse_dense,
+    recognize,
+    recognize_start,
+)
+from darglint.node import (
+    CykNode,
+)
 from darglint.parse.grammar import (
     BaseGrammar,
 )
@@ -454,6 +469,251 @@ class PhoneNumberTests(TestCase):
             self.assertTrue(self.contains_annotation(node, ConfusionError))
 
 
+class SparseChartTest(TestCase):
+    """Make sure the sparse chart agrees with the dense chart."""
+
+    def assertSameTree(self, actual, expected):
+        if expected is None:
+            self.assertIsNone(actual)
+            return
+        self.assertIsNotNone(actual)
+        actual_nodes = list(actual.in_order_traverse())
+        expected_nodes = list(expected.in_order_traverse())
+        self.assertEqual(len(actual_nodes), len(expected_nodes))
+        for x, y in zip(actual_nodes, expected_nodes):
+            self.assertEqual(x.symbol, y.symbol)
+            self.assertEqual(x.value, y.value)
+            self.assertEqual(x.weight, y.weight)
+            self.assertEqual(list(x.annotations), list(y.annotations))
+
+    def test_phone_numbers_match_dense(self):
+        for _ in range(20):
+            number = ''.join([
+                random.choice('0123456789-.')
+                for _ in range(random.randint(1, 15))
+            ])
+            tokens = pn_lex(number)
+            self.assertSameTree(
+                parse(PhoneNumberGrammar, tokens),
+                parse_dense(PhoneNumberGrammar, tokens),
+            )
+
+    def test_google_sections_match_dense(self):
+        from darglint.lex import condense, lex
+        from darglint.parse.google import lookup, top_parse
+        docstring = '\n'.join([
+            'Do something.',
+            '',
+            'Args:',
+            '    x (int): The first.',
+            '    y: The second, which',
+            '        takes two lines.  # noqa: DAR102',
+            '',
+            'Returns:',
+            '    int: The result.',
+            '',
+            'Raises:',
+            '    ValueError: Sometimes.',
+            '',
+        ])
+        for i, section in enumerate(top_parse(condense(lex(docstring)))):
+            for grammar in lookup(section, i):
+                if not isinstance(grammar, type):
+                    continue
+                self.assertSameTree(
+                    parse(grammar, section),
+                    parse_dense(grammar, section),
+                )
+
+
+class BackpointerChartTest(TestCase):
+
+    def test_only_nodes_in_the_final_tree_are_created(self):
+        created = list()
+
+        class CountingNode(CykNode):
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        tokens = pn_lex('983-32.1')
+        with mock.patch('darglint.parse.cyk.CykNode', CountingNode):
+            node = parse(PhoneNumberGrammar, tokens)
+        self.assertTrue(node)
+        self.assertEqual(
+            len(created),
+            len(list(node.in_order_traverse())),
+        )
+
+
+class RecognizerTest(TestCase):
+
+    def test_recognizer_agrees_with_parser(self):
+        for _ in range(30):
+            number = ''.join([
+                random.choice('0123456789-.')
+                for _ in range(random.randint(1, 12))
+            ])
+            tokens = pn_lex(number)
+            self.assertEqual(
+                recognize(PhoneNumberGrammar, tokens),
+                parse(PhoneNumberGrammar, tokens) is not None,
+                'Disagreement on {}'.format(number),
+            )
+
+    def test_sentences_rejected_by_their_edges(self):
+        # A sentence can't end with a verb, so there's no need to
+        # fill the chart.
+        tokens = ekg_lex('qam qet loD qet')
+        compiled = ErrorKlingonGrammar.compile()
+        self.assertFalse(
+            _could_derive(compiled, *_get_edge_masks(compiled, tokens), 4)
+        )
+        self.assertIsNone(parse(ErrorKlingonGrammar, tokens))
+        self.assertFalse(recognize(ErrorKlingonGrammar, tokens))
+
+    def test_recognize_start(self):
+        compiled = ErrorKlingonGrammar.compile()
+        tokens = ekg_lex('qam qet loD')
+        start = recognize_start(ErrorKlingonGrammar, tokens)
+        self.assertEqual(start, compiled.start)
+        self.assertTrue(
+            parse(ErrorKlingonGrammar, tokens, start).equals(
+                parse(ErrorKlingonGrammar, tokens)
+            )
+        )
+        self.assertIsNone(
+            recognize_start(ErrorKlingonGrammar, ekg_lex('qam qet'))
+        )
+
+    def test_recognize_empty(self):
+        self.assertFalse(recognize(SimpleKlingonGrammar, []))
+
+    def test_recognize_error_grammar(self):
+        self.assertTrue(recognize(ErrorKlingonGrammar, ekg_lex('qet loD')))
+        self.assertTrue(
+            recognize(ErrorKlingonGrammar, ekg_lex('qam qet loD'))
+        )
+        self.assertFalse(recognize(ErrorKlingonGrammar, ekg_lex('qam qet')))
+
+
+@skipIf(not cyk_numpy.available(), 'NumPy is not installed.')
+class NumpyBackendTest(TestCase):
+    """Make sure the NumPy backend agrees with the sparse chart."""
+
+    assertSameTree = SparseChartTest.assertSameTree
+
+    def test_phone_numbers_match_sparse(self):
+        for _ in range(20):
+            number = ''.join([
+                random.choice('0123456789-.')
+                for _ in range(random.randint(1, 15))
+            ])
+            tokens = pn_lex(number)
+            self.assertSameTree(
+                cyk_numpy.parse(PhoneNumberGrammar, tokens),
+                parse(PhoneNumberGrammar, tokens),
+            )
+
+    def test_ambiguous_and_weighted_grammars_match_sparse(self):
+        for sentence in ['qet loD', 'qam qet loD', 'qam qet', 'loD']:
+            tokens = ekg_lex(sentence)
+            self.assertSameTree(
+                cyk_numpy.parse(ErrorKlingonGrammar, tokens),
+                parse(ErrorKlingonGrammar, tokens),
+            )
+        tokens = [
+            Token(value='Hegh', token_type=AKT.VERB, line_number=0),
+            Token(value="be'", token_type=AKT.BE, line_number=0),
+            Token(value="be'", token_type=AKT.BE, line_number=0),
+        ]
+        self.assertSameTree(
+            cyk_numpy.parse(AmbiguousKlingonGrammar, tokens),
+            parse(AmbiguousKlingonGrammar, tokens),
+        )
+
+    def test_docstring_sections_match_sparse(self):
+        from darglint.lex import condense, lex
+        from darglint.parse import google, numpy, sphinx
+        docstrings = {
+            google: '\n'.join([
+                'Do something.',
+                '',
+                'Args:',
+                '    x (int): The first.',
+                '    y: The second, which',
+                '        takes two lines.  # noqa: DAR102',
+                '',
+                'Returns:',
+                '    int: The result.',
+                '',
+                'Raises:',
+                '    ValueError: Sometimes.',
+                '',
+            ]),
+            sphinx: '\n'.join([
+                'Do something.',
+                '',
+                ':param x: The first.',
+                ':type x: int',
+                ':raises ValueError: Sometimes.',
+                ':returns: The result.',
+                ':rtype: int',
+                '',
+            ]),
+            numpy: '\n'.join([
+                'Do something.',
+                '',
+                'Parameters',
+                '----------',
+                'x : int',
+                '    The first.',
+                '',
+                'Returns',
+                '-------',
+                'int',
+                '    The result.',
+                '',
+            ]),
+        }
+        for module, docstring in docstrings.items():
+            tokens = condense(lex(docstring))
+            for i, section in enumerate(module.top_parse(tokens)):
+                for grammar in module.lookup(section, i):
+                    if not isinstance(grammar, type):
+                        continue
+                    self.assertSameTree(
+                        cyk_numpy.parse(grammar, section),
+                        parse(grammar, section),
+                    )
+
+    def test_large_and_negative_weights_match_sparse(self):
+        class NounsGrammar(BaseGrammar):
+            productions = [
+                P('sentence',
+                    ([], 'noun', 'sentence', -300),
+                    ([], 'sentence', 'noun', 400),
+                    ([], 'noun', 'noun', 0)),
+                P('noun', (KT.NOUN, -2)),
+            ]
+
+            start = 'sentence'
+
+        for length in range(2, 8):
+            tokens = [
+                Token(value='loD', token_type=KT.NOUN, line_number=0)
+                for _ in range(length)
+            ]
+            self.assertSameTree(
+                cyk_numpy.parse(NounsGrammar, tokens),
+                parse(NounsGrammar, tokens),
+            )
+
+    def test_empty(self):
+        self.assertIsNone(cyk_numpy.parse(SimpleKlingonGrammar, []))
+
+
 def verify_implementation():
     """Run many iterations and report the data for analysis.
 
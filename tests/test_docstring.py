@@ -619,6 +619,40 @@ class DocstringMethodTest(TestCase):
             docstring.get_section(Sections.RETURNS_SECTION),
         ]))
 
+    def test_has_section_agrees_with_get_section(self):
+        raw_docstrings = [
+            '\n'.join([
+                'Short description.',
+                '',
+                'Long description.',
+                '',
+                'Args:',
+                '    x: Some value.',
+                '',
+                'Returns:',
+                '    When it completes.',
+            ]),
+            'Short description.',
+        ]
+        for raw_docstring in raw_docstrings:
+            docstring = Docstring.from_google(raw_docstring)
+            for section in docstring.supported_sections:
+                self.assertEqual(
+                    docstring.has_section(section),
+                    bool(docstring.get_section(section)),
+                )
+
+    def test_has_section_does_not_reconstruct(self):
+        docstring = Docstring.from_google('\n'.join([
+            'Short description.',
+            '',
+            'Returns:',
+            '    When it completes.',
+        ]))
+        self.assertTrue(docstring.has_section(Sections.RETURNS_SECTION))
+        self.assertFalse(docstring.has_section(Sections.YIELDS_SECTION))
+        self.assertEqual(docstring.memo.calls['get_section'], 0)
+
 
 class DocstringForSphinxTests(TestCase):
 
@@ -1065,3 +1099,154 @@ class DocstringForNumpyTest(TestCase):
                     is_strictness_satisfied,
                     msg=raw_docstring,
                 )
+
+    def test_get_section_leaves_arguments_section_alone(self):
+        raw_docstring = '\n'.join([
+            'Frobulate.',
+            '',
+            'Parameters',
+            '----------',
+            'x : int',
+            '    The x.',
+            '',
+            'Other Parameters',
+            '----------------',
+            'y : int',
+            '    The y.',
+            '',
+        ])
+        expected = Docstring.from_numpy(
+            raw_docstring,
+        ).get_line_numbers_for_value('arguments-section', 'y')
+        docstring = Docstring.from_numpy(raw_docstring)
+        self.assertTrue(docstring.get_section(Sections.ARGUMENTS_SECTION))
+        self.assertTrue(docstring.has_section(Sections.ARGUMENTS_SECTION))
+        self.assertEqual(
+            docstring.get_line_numbers_for_value('arguments-section', 'y'),
+            expected,
+        )
+
+
+class MemoizationTest(TestCase):
+
+    def test_derived_views_computed_once(self):
+        raw_docstrings = [
+            (
+                Docstring.from_google,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    'Args:',
+                    '    x: The x.  # noqa: DAR103',
+                    '',
+                ]),
+            ),
+            (
+                Docstring.from_sphinx,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    'Without types.  # noqa: DAR103',
+                    '',
+                    ':param x: The x.',
+                    '',
+                    '',
+                ]),
+            ),
+            (
+                Docstring.from_numpy,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    'Parameters',
+                    '----------',
+                    'x : int',
+                    '    The x.  # noqa: DAR103',
+                    '',
+                ]),
+            ),
+        ]
+        for from_raw, raw_docstring in raw_docstrings:
+            docstring = from_raw(raw_docstring)
+            with self.subTest(raw_docstring):
+                noqas = docstring.get_noqas()
+                self.assertIs(docstring.get_noqas(), noqas)
+                self.assertEqual(docstring.memo.calls['get_noqas'], 2)
+                self.assertEqual(docstring.memo.computed['get_noqas'], 1)
+
+                items = docstring.get_items(Sections.ARGUMENTS_SECTION)
+                self.assertEqual(items, ['x'])
+                self.assertIs(
+                    docstring.get_items(Sections.ARGUMENTS_SECTION),
+                    items,
+                )
+                self.assertIsNone(
+                    docstring.get_items(Sections.RAISES_SECTION),
+                )
+                self.assertEqual(docstring.memo.computed['get_items'], 2)
+
+
+class LineNumbersForValueTest(TestCase):
+
+    def test_line_numbers_for_items(self):
+        raw_docstrings = [
+            (
+                Docstring.from_google,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    'Args:',
+                    '    x: The x.',
+                    '    y: The y.',
+                    '',
+                ]),
+                4,
+            ),
+            (
+                Docstring.from_sphinx,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    ':param x: The x.',
+                    ':param y: The y.',
+                    '',
+                    '',
+                ]),
+                3,
+            ),
+            (
+                Docstring.from_numpy,
+                '\n'.join([
+                    'Frobulate.',
+                    '',
+                    'Parameters',
+                    '----------',
+                    'x : int',
+                    '    The x.',
+                    'y : int',
+                    '    The y.',
+                    '',
+                ]),
+                6,
+            ),
+        ]
+        for from_raw, raw_docstring, line in raw_docstrings:
+            docstring = from_raw(raw_docstring)
+            with self.subTest(raw_docstring):
+                for _ in range(2):
+                    self.assertEqual(
+                        docstring.get_line_numbers_for_value(
+                            'arguments-section', 'y',
+                        ),
+                        (line, line),
+                    )
+                self.assertIsNone(
+                    docstring.get_line_numbers_for_value(
+                        'arguments-section', 'z',
+                    ),
+                )
+
+                # The section is only walked once.
+                self.assertEqual(
+                    docstring.memo.computed['_index_values'], 1,
+                )
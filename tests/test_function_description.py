@@ -1,6 +1,12 @@
 import ast
-from unittest import TestCase
+from unittest import (
+    mock,
+    TestCase,
+)
+from darglint.analysis.module_analysis_visitor import analyze_function
 from darglint.function_description import get_function_descriptions
+from darglint.integrity_checker import IntegrityChecker
+from darglint.utils import ConfigurationContext
 from .utils import (
     require_python,
     reindent,
@@ -490,3 +496,92 @@ class GetFunctionsAndDocstrings(TestCase):
         )
         function = functions[0]
         self.assertTrue(function.is_property)
+
+
+class LazyAnalysisTest(TestCase):
+
+    def get_functions(self, program, config=None):
+        return {
+            function.name: function
+            for function in get_function_descriptions(
+                ast.parse(reindent(program)),
+                config,
+            )
+        }
+
+    def test_checked_functions_analyzed_with_module(self):
+        program = '''
+            class A(object):
+
+                @property
+                def value(self):
+                    """The value."""
+                    return 1
+
+                def _private(self):
+                    """Private."""
+                    return 2
+
+                def undocumented(self):
+                    return 3
+
+                def checked(self, x):
+                    """Checked.
+
+                    Args:
+                        x: The x.
+
+                    """
+                    pass
+        '''
+        with ConfigurationContext(
+            ignore_regex='^_',
+            ignore_properties=True,
+        ) as config, mock.patch(
+            'darglint.function_description.analyze_function',
+            wraps=analyze_function,
+        ) as analyze:
+            functions = self.get_functions(program, config)
+            checker = IntegrityChecker()
+            for function in functions.values():
+                checker.run_checks(function)
+            self.assertEqual(analyze.call_count, 0)
+            self.assertEqual(functions['checked'].argument_names, ['x'])
+            self.assertEqual(analyze.call_count, 0)
+
+    def test_skipped_functions_analyzed_when_needed(self):
+        with ConfigurationContext() as config, mock.patch(
+            'darglint.function_description.analyze_function',
+            wraps=analyze_function,
+        ) as analyze:
+            functions = self.get_functions('''
+                def documented(x):
+                    """Documented."""
+                    raise ValueError()
+
+                def _helper(y):
+                    return y
+            ''', config)
+            self.assertEqual(functions['documented'].raises, {'ValueError'})
+            self.assertEqual(functions['_helper'].name, '_helper')
+            self.assertEqual(analyze.call_count, 0)
+
+            function = functions['_helper']
+            self.assertEqual(function.argument_names, ['y'])
+            self.assertTrue(function.has_return)
+            self.assertEqual(analyze.call_count, 1)
+
+    def test_failed_analysis_leaves_attributes_missing(self):
+        with mock.patch(
+            'darglint.analysis.module_analysis_visitor.'
+            'ModuleAnalysisVisitor.analyze_pure_abstract',
+            side_effect=ValueError('Unable to analyze.'),
+        ):
+            functions = self.get_functions('''
+                def broken():
+                    """Broken."""
+                    pass
+            ''')
+        self.assertFalse(hasattr(functions['broken'], 'raises'))
+        self.assertFalse(hasattr(functions['broken'], 'has_return'))
+        self.assertEqual(functions['broken'].docstring, 'Broken.')
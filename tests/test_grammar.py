@@ -2,8 +2,17 @@
 
 from unittest import TestCase
 
-from darglint.parse.grammar import BaseGrammar
+from darglint.parse.cyk import (
+    parse,
+)
+from darglint.parse.grammar import (
+    BaseGrammar,
+    union,
+)
 from darglint.parse.grammar import Production as P
+from darglint.token import (
+    Token,
+)
 
 
 class GrammarTest(TestCase):
@@ -41,3 +50,196 @@ class ProductionTest(TestCase):
             pass
 
         P.with_annotations('sentence', [OutOfOrder], ('noun', 'verb'))
+
+
+class CompiledGrammarTest(TestCase):
+
+    class SentenceGrammar(BaseGrammar):
+        productions = [
+            P('sentence', ([], 'noun', 'verb', 0), ([], 'noun', 'phrase', 1)),
+            P('phrase', ([], 'verb', 'noun', 0)),
+            P('noun', ('NOUN', 0)),
+            P('verb', ('VERB', 0)),
+        ]
+        start = 'sentence'
+
+    def test_nonterminals_are_numbered_in_order(self):
+        compiled = self.SentenceGrammar.compile()
+        self.assertEqual(
+            compiled.symbols,
+            ['sentence', 'phrase', 'noun', 'verb'],
+        )
+        self.assertEqual(compiled.start, 0)
+
+    def test_binary_rules_indexed_by_children(self):
+        compiled = self.SentenceGrammar.compile()
+        noun = compiled.lookup['noun']
+        verb = compiled.lookup['verb']
+        phrase = compiled.lookup['phrase']
+        self.assertEqual(
+            [(a, w) for _, a, _, w in compiled.binary[noun][verb]],
+            [(compiled.lookup['sentence'], 0)],
+        )
+        self.assertEqual(
+            [(a, w) for _, a, _, w in compiled.binary[noun][phrase]],
+            [(compiled.lookup['sentence'], 1)],
+        )
+        self.assertEqual(
+            [(a, w) for _, a, _, w in compiled.binary[verb][noun]],
+            [(phrase, 0)],
+        )
+
+    def test_terminals_compiled(self):
+        compiled = self.SentenceGrammar.compile()
+        self.assertEqual(
+            compiled.terminals,
+            [
+                ('NOUN', compiled.lookup['noun'], 0),
+                ('VERB', compiled.lookup['verb'], 0),
+            ],
+        )
+
+    def test_terminal_table_by_token_type(self):
+        class WordGrammar(BaseGrammar):
+            productions = [
+                P('word', ('WORD', 0), ('COLON', 0), ('WORD', 2)),
+                P('ident', ('WORD', 1)),
+            ]
+            start = 'word'
+
+        compiled = WordGrammar.compile()
+        word = compiled.lookup['word']
+        ident = compiled.lookup['ident']
+        self.assertEqual(
+            compiled.terminal_table,
+            {
+                'WORD': {word: 2, ident: 1},
+                'COLON': {word: 0},
+            },
+        )
+
+    def test_compiled_once(self):
+        self.assertIs(
+            self.SentenceGrammar.compile(),
+            self.SentenceGrammar.compile(),
+        )
+
+    def test_subclass_compiled_separately(self):
+        self.SentenceGrammar.compile()
+
+        class QuestionGrammar(self.SentenceGrammar):
+            start = 'phrase'
+
+        self.assertEqual(QuestionGrammar.compile().start, 1)
+        self.assertEqual(self.SentenceGrammar.compile().start, 0)
+
+    def test_span_lengths(self):
+        class ListGrammar(BaseGrammar):
+            productions = [
+                P('list', ([], 'item', 'list', 0), ([], 'item', 'end', 0)),
+                P('item', ([], 'word', 'comma', 0)),
+                P('end', ('WORD', 0)),
+                P('word', ('WORD', 0)),
+                P('comma', ('COMMA', 0)),
+                P('never', ([], 'word', 'missing', 0)),
+            ]
+            start = 'list'
+
+        compiled = ListGrammar.compile()
+        lengths = {
+            symbol: (compiled.min_lengths[a], compiled.max_lengths[a])
+            for a, symbol in enumerate(compiled.symbols)
+        }
+        self.assertEqual(lengths['list'], (3, None))
+        self.assertEqual(lengths['item'], (2, 2))
+        self.assertEqual(lengths['word'], (1, 1))
+        self.assertEqual(lengths['never'], (None, None))
+
+        list_bit = 1 << compiled.lookup['list']
+        item_bit = 1 << compiled.lookup['item']
+        self.assertFalse(compiled.length_mask(2) & list_bit)
+        self.assertTrue(compiled.length_mask(2) & item_bit)
+        self.assertTrue(compiled.length_mask(100) & list_bit)
+        self.assertFalse(compiled.length_mask(100) & item_bit)
+
+    def test_first_and_last_token_types(self):
+        compiled = self.SentenceGrammar.compile()
+        sentence = compiled.lookup['sentence']
+        phrase = compiled.lookup['phrase']
+        self.assertEqual(compiled.first[sentence], {'NOUN'})
+        self.assertEqual(compiled.last[sentence], {'NOUN', 'VERB'})
+        self.assertEqual(compiled.first[phrase], {'VERB'})
+        self.assertEqual(compiled.last[phrase], {'NOUN'})
+        self.assertTrue(compiled.first_masks['VERB'] & 1 << phrase)
+        self.assertFalse(compiled.first_masks['VERB'] & 1 << sentence)
+
+
+class UnionTest(TestCase):
+
+    class TypedGrammar(BaseGrammar):
+        productions = [
+            P('section', ([], 'type', 'body', 0)),
+            P('type', ('TYPE', 0)),
+            P('body', ([], 'word', 'body', 0), ('WORD', 0)),
+            P('word', ('WORD', 0)),
+        ]
+        start = 'section'
+
+    class UntypedGrammar(BaseGrammar):
+        productions = [
+            P('section', ([], 'word', 'body', 0), ('WORD', 0)),
+            P('body', ([], 'word', 'body', 0), ('WORD', 0)),
+            P('word', ('WORD', 0)),
+        ]
+        start = 'section'
+
+    def lex(self, *token_types):
+        return [
+            Token(value=x.lower(), token_type=x, line_number=0)
+            for x in token_types
+        ]
+
+    def test_identical_nonterminals_shared(self):
+        merged = union(self.TypedGrammar, self.UntypedGrammar)
+        lhs = [production.lhs for production in merged.productions]
+        self.assertEqual(lhs.count('body'), 1)
+        self.assertEqual(lhs.count('word'), 1)
+
+    def test_conflicting_nonterminals_renamed(self):
+        merged = union(self.TypedGrammar, self.UntypedGrammar)
+        compiled = merged.compile()
+        sections = [
+            a for a, name in enumerate(compiled.names)
+            if name == 'section'
+        ]
+        self.assertEqual(len(sections), 2)
+        self.assertEqual(compiled.starts, sections)
+        self.assertNotEqual(
+            compiled.symbols[sections[0]],
+            compiled.symbols[sections[1]],
+        )
+
+    def test_preferred_start_parsed(self):
+        merged = union(self.TypedGrammar, self.UntypedGrammar)
+        for token_types in [
+            ('TYPE', 'WORD', 'WORD'),
+            ('WORD', 'WORD'),
+            ('WORD',),
+            ('TYPE',),
+        ]:
+            tokens = self.lex(*token_types)
+            expected = (
+                parse(self.TypedGrammar, tokens)
+                or parse(self.UntypedGrammar, tokens)
+            )
+            actual = parse(merged, tokens)
+            if expected is None:
+                self.assertIsNone(actual)
+            else:
+                self.assertTrue(actual.equals(expected))
+
+    def test_union_created_once(self):
+        self.assertIs(
+            union(self.TypedGrammar, self.UntypedGrammar),
+            union(self.TypedGrammar, self.UntypedGrammar),
+        )
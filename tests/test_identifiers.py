@@ -129,6 +129,34 @@ class PathTestCase(TestCase):
             'value',
         )
 
+    def test_compiled_once(self):
+        path = Path.of('l').branch(Path.if_left('lv'), Path.of('rv'))
+        self.assertIs(path.compile(), path.compile())
+
+    def test_extending_recompiles(self):
+        node = _l(_r(_v()))
+        path = Path.of('l')
+        self.assertIsInstance(path.extract(node), CykNode)
+        path.of('rv')
+        self.assertEqual(path.extract(node), target)
+
+    def test_extending_child_recompiles_parents(self):
+        node = _l(_r(_v()))
+        child = Path.of('l')
+        path = Path.branch(Path.if_right('rv'), child)
+        self.assertIsInstance(path.extract(node), CykNode)
+        child.of('rv')
+        self.assertEqual(path.extract(node), target)
+
+    def test_value_ends_path(self):
+        node = _l(_v())
+        path = Path.of('lvr').of('l')
+        self.assertEqual(path.extract(node), target)
+
+    def test_missing_value(self):
+        node = _l(_r(_v()))
+        self.assertIsNone(Path.of('lv').extract(node))
+
     def _random_node(self, minlength=1, maxlength=100):
         curr = _v()
         path = 'v'
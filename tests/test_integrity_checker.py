@@ -271,6 +271,40 @@ class IntegrityCheckerNumpyTestCase(TestCase):
             ),
         )
 
+    def test_excess_items_reported_on_their_lines(self):
+        program = '\n'.join([
+            'def f(x):',
+            '    """Frobulate.',
+            '',
+            '    Parameters',
+            '    ----------',
+            '    x : int',
+            '        The x.',
+            '    y : int',
+            '        The y.',
+            '',
+            '    Raises',
+            '    ------',
+            '    ValueError',
+            '        Sometimes.',
+            '    KeyError',
+            '        Other times.',
+            '',
+            '    """',
+            '    raise ValueError()',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker(self.config)
+        checker.run_checks(functions[0])
+        self.assertEqual(
+            [(type(x), x.line_numbers) for x in checker.errors],
+            [
+                (ExcessParameterError, (6, 6)),
+                (ExcessRaiseError, (13, 13)),
+            ],
+        )
+
 
 class IntegrityCheckerSphinxTestCase(TestCase):
 
@@ -528,6 +562,32 @@ class IntegrityCheckerSphinxTestCase(TestCase):
             errors[0].__class__.__name__
         )
 
+    def test_excess_items_reported_on_their_lines(self):
+        program = '\n'.join([
+            'def f(x):',
+            '    """Frobulate.',
+            '',
+            '    :param x: The x.',
+            '    :param y: The y.',
+            '    :raises ValueError: Sometimes.',
+            '    :raises KeyError: Other times.',
+            '',
+            '    """',
+            '    raise ValueError()',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker(self.config)
+        checker.run_checks(functions[0])
+        self.assertEqual(
+            [(type(x), x.line_numbers) for x in checker.errors],
+            [
+                (ExcessParameterError, (3, 3)),
+                (ExcessRaiseError, (5, 5)),
+            ],
+        )
+
+
 class IntegrityCheckerTestCase(TestCase):
 
     def test_ignore_private_methods(self):
@@ -0,0 +1,128 @@
+"""Tests for parsing item-list sections one item at a time."""
+
+from random import (
+    choice,
+    randint,
+)
+from unittest import TestCase
+
+from darglint.lex import (
+    condense,
+    lex,
+)
+from darglint.parse.cyk import (
+    parse as cyk_parse,
+)
+from darglint.parse.google import (
+    _parse_argument_items,
+    _parse_exception_items,
+    _split_items,
+)
+from darglint.parse.grammars.google_arguments_section import (
+    ArgumentsGrammar,
+)
+from darglint.parse.grammars.google_raises_section import (
+    RaisesGrammar,
+)
+
+MAX_REPS = 20
+
+
+def _tokenize(section):
+    return condense(lex(section))
+
+
+class ParseItemsTest(TestCase):
+
+    def assertSameTree(self, grammar, parse_items, section):
+        tokens = _tokenize(section)
+        expected = cyk_parse(grammar, tokens)
+        actual = parse_items(tokens)
+        self.assertIsNotNone(actual, section)
+        self.assertTrue(
+            actual.equals(expected),
+            'Trees differ for:\n{}\n\n{}\n\n{}'.format(
+                section, actual, expected,
+            ),
+        )
+
+    def test_split_at_each_item(self):
+        tokens = _tokenize('\n'.join([
+            'Args:',
+            '    x: The first.',
+            '    y (int): The second,',
+            '        which goes on.',
+            '    z: The third.',
+        ]))
+        pieces = _split_items(tokens)
+        self.assertEqual(len(pieces), 3)
+        self.assertEqual(pieces[0][0], 3)
+        self.assertEqual(pieces[-1][1], len(tokens))
+        for (_, end), (start, _) in zip(pieces, pieces[1:]):
+            self.assertEqual(end + 1, start)
+
+    def test_not_split_without_header(self):
+        self.assertIsNone(_split_items(_tokenize('x: The first.')))
+
+    def test_arguments_same_as_whole_parse(self):
+        self.assertSameTree(
+            ArgumentsGrammar,
+            _parse_argument_items,
+            '\n'.join([
+                'Args:',
+                '    x: The first.',
+                '    y (int): The second,',
+                '        which goes on.',
+                '    *args: The rest.',
+            ]),
+        )
+
+    def test_raises_same_as_whole_parse(self):
+        self.assertSameTree(
+            RaisesGrammar,
+            _parse_exception_items,
+            '\n'.join([
+                'Raises:',
+                '    ValueError: If it is wrong.',
+                '    KeyError: If it is missing.',
+                '    Exception: Otherwise.',
+            ]),
+        )
+
+    def test_malformed_item_falls_back(self):
+        tokens = _tokenize('\n'.join([
+            'Args:',
+            '    x: The first.',
+            '    y (): The second.',
+            '    z: The third.',
+        ]))
+        self.assertIsNone(_parse_argument_items(tokens))
+
+    def test_single_item_falls_back(self):
+        tokens = _tokenize('Args:\n    x: The only one.')
+        self.assertIsNone(_parse_argument_items(tokens))
+
+    def test_random_sections_same_as_whole_parse(self):
+        names = ['x', 'y', 'z', '*args', '**kwargs']
+        types = ['', ' (int)', ' (List[int])', ' (str, optional)']
+        descriptions = [
+            'Something.',
+            'Something,\n        continued.',
+            'Something.\n\n        Another paragraph.',
+            'Something:\n\n            indented more.',
+        ]
+        for _ in range(MAX_REPS):
+            lines = ['Args:']
+            for _ in range(randint(2, 8)):
+                lines.append('    {}{}: {}'.format(
+                    choice(names), choice(types), choice(descriptions),
+                ))
+            section = '\n'.join(lines)
+            tokens = _tokenize(section)
+            actual = _parse_argument_items(tokens)
+            if actual is None:
+                continue
+            self.assertTrue(
+                actual.equals(cyk_parse(ArgumentsGrammar, tokens)),
+                section,
+            )
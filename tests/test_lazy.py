@@ -0,0 +1,206 @@
+"""Tests for parsing the sections of docstrings on demand."""
+
+import inspect
+from unittest import (
+    mock,
+    TestCase,
+)
+
+from darglint.docstring import (
+    google as google_docstring,
+    numpy as numpy_docstring,
+    sphinx as sphinx_docstring,
+)
+from darglint.docstring.sections import Sections
+from darglint.lex import tokenize
+from darglint.parse import (
+    google,
+    numpy,
+    sphinx,
+)
+from darglint.parse.identifiers import Identifier
+from darglint.strictness import Strictness
+from darglint.token import TokenType
+
+
+GOOGLE_DOCSTRING = '\n'.join([
+    'Frobulate the widget.',
+    '',
+    'A longer description.  # noqa: I101',
+    '',
+    'Args:',
+    '    x (int): The first.',
+    '    y: The second.  # noqa: DAR103',
+    '',
+    'Raises:',
+    '    ValueError: If it is wrong.',
+    '',
+    'Returns:',
+    '    int: The result.',
+    '',
+])
+
+SPHINX_DOCSTRING = '\n'.join([
+    'Frobulate the widget.',
+    '',
+    'A longer description.',
+    '',
+    ':param x: The first.',
+    ':type x: int',
+    ':raises ValueError: If it is wrong.',
+    ':returns: The result.',
+    ':rtype: int',
+    '',
+])
+
+NUMPY_DOCSTRING = '\n'.join([
+    'Frobulate the widget.',
+    '',
+    'A longer description.',
+    '',
+    'Parameters',
+    '----------',
+    'x : int',
+    '    The first.',
+    '',
+    'Raises',
+    '------',
+    'ValueError',
+    '    If it is wrong.',
+    '',
+    'Returns',
+    '-------',
+    'int',
+    '    The result.',
+    '',
+])
+
+STYLES = [
+    (google, google_docstring.Docstring, GOOGLE_DOCSTRING),
+    (sphinx, sphinx_docstring.Docstring, SPHINX_DOCSTRING),
+    (numpy, numpy_docstring.Docstring, NUMPY_DOCSTRING),
+]
+
+
+def _symbols(grammar):
+    symbols = set()
+    for production in grammar.productions:
+        symbols.add(production.lhs)
+        for derivation in production.rhs:
+            if not isinstance(derivation[0], list):
+                continue
+            for annotation in derivation[0]:
+                if issubclass(annotation, Identifier):
+                    symbols.add(annotation.key)
+    return symbols
+
+
+class LazyDocstringTestCase(TestCase):
+
+    def count_parses(self, module):
+        return mock.patch.object(
+            module,
+            'parse_section',
+            wraps=module.parse_section,
+        )
+
+    def test_only_needed_sections_parsed(self):
+        with self.count_parses(google_docstring) as parse_section:
+            docstring = google_docstring.Docstring(GOOGLE_DOCSTRING)
+            self.assertEqual(parse_section.call_count, 0)
+            self.assertEqual(
+                docstring.get_items(Sections.ARGUMENTS_SECTION),
+                ['x', 'y'],
+            )
+            self.assertEqual(parse_section.call_count, 1)
+            self.assertEqual(
+                docstring.get_types(Sections.RETURNS_SECTION),
+                'int',
+            )
+            self.assertEqual(parse_section.call_count, 2)
+
+            # Sections are only parsed once.
+            docstring.get_items(Sections.ARGUMENTS_SECTION)
+            docstring.get_section(Sections.RETURNS_SECTION)
+            self.assertEqual(parse_section.call_count, 2)
+
+    def test_noqas_skip_other_sections(self):
+        with self.count_parses(google_docstring) as parse_section:
+            docstring = google_docstring.Docstring(GOOGLE_DOCSTRING)
+            self.assertEqual(
+                docstring.get_noqas(),
+                {'I101': [], 'DAR103': ['y']},
+            )
+
+            # The long description and the arguments section have a
+            # noqa.  The raises section is parsed for targeted noqas.
+            self.assertEqual(parse_section.call_count, 3)
+
+    def test_strictness_stops_at_first_disallowed_section(self):
+        with self.count_parses(google_docstring) as parse_section:
+            docstring = google_docstring.Docstring(GOOGLE_DOCSTRING)
+            self.assertFalse(
+                docstring.satisfies_strictness(Strictness.SHORT_DESCRIPTION)
+            )
+            self.assertEqual(parse_section.call_count, 1)
+
+    def test_same_as_parsing_up_front(self):
+        for module, Docstring, raw in STYLES:
+            lazy = Docstring(raw)
+            eager = Docstring(module.parse(tokenize(raw)))
+            for section in lazy.supported_sections:
+                self.assertEqual(
+                    lazy.get_section(section),
+                    eager.get_section(section),
+                )
+            for section in [
+                Sections.ARGUMENTS_SECTION,
+                Sections.RAISES_SECTION,
+            ]:
+                self.assertEqual(
+                    lazy.get_items(section),
+                    eager.get_items(section),
+                )
+            for section in [
+                Sections.ARGUMENTS_SECTION,
+                Sections.RETURNS_SECTION,
+            ]:
+                self.assertEqual(
+                    lazy.get_types(section),
+                    eager.get_types(section),
+                )
+            self.assertEqual(lazy.get_noqas(), eager.get_noqas())
+            for symbol in ['arguments-section', 'returns-section']:
+                self.assertEqual(
+                    lazy.get_line_numbers(symbol),
+                    eager.get_line_numbers(symbol),
+                )
+            self.assertEqual(
+                lazy.get_line_numbers_for_value('ident', 'x'),
+                eager.get_line_numbers_for_value('ident', 'x'),
+            )
+            self.assertEqual(
+                lazy.root.reconstruct_string(),
+                eager.root.reconstruct_string(),
+            )
+
+    def test_symbols_only_in_listed_sections(self):
+        """Make sure no grammar produces a symbol outside its sections."""
+        for module, Docstring, _ in STYLES:
+            short_symbols = _symbols(module.ShortDescriptionGrammar)
+            for symbol in Docstring._symbol_keywords:
+                self.assertNotIn(symbol, short_symbols)
+            for token_type in TokenType:
+                token = mock.Mock(token_type=token_type)
+                for grammar in module._match(token):
+                    if not inspect.isclass(grammar):
+                        continue
+                    for symbol in _symbols(grammar):
+                        keywords = Docstring._symbol_keywords.get(symbol)
+                        if keywords is None:
+                            continue
+                        self.assertIn(
+                            token_type,
+                            keywords,
+                            '{} in {}'.format(symbol, grammar.__name__),
+                        )
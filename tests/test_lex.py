@@ -1,8 +1,16 @@
+from random import (
+    choice,
+    randint,
+)
 from unittest import TestCase
 from darglint.token import TokenType
 from darglint.lex import (
     condense,
     lex,
+    tokenize,
+)
+from darglint.utils import (
+    ConfigurationContext,
 )
 
 
@@ -145,3 +153,59 @@ class CondenseTests(TestCase):
             [x.token_type for x in condensed],
             [TokenType.WORD, TokenType.RETURNS, TokenType.WORD]
         )
+
+
+class TokenizeTests(TestCase):
+    """Make sure tokenize is the same as condensing the lexed tokens."""
+
+    # Pieces of docstrings which exercise each of the rules in
+    # lex and condense.
+    pieces = [
+        'Args', 'Returns', 'noqa', 'param', 'See', 'Also', 'word',
+        'x', '*args', 'a-b', '-', '---', ' ', '  ', '    ', '     ',
+        '\n', '\n\n', ':', '#', '(', ')', '\t', '\r', '\u2003',
+    ]
+
+    def assertSameTokens(self, program):
+        expected = condense(lex(program))
+        actual = tokenize(program)
+        self.assertEqual(
+            [(x.value, x.token_type, x.line_number) for x in actual],
+            [(x.value, x.token_type, x.line_number) for x in expected],
+            repr(program),
+        )
+
+    def test_empty_string(self):
+        self.assertEqual(list(tokenize('')), [])
+
+    def test_docstring(self):
+        self.assertSameTokens('\n'.join([
+            'Add two numbers together.',
+            '',
+            'Args:',
+            '    a: The first number.',
+            '    b (int): The second number.',
+            '',
+            'Returns:',
+            '    The sum of the two numbers.',
+            '',
+            '# noqa: DAR101 c',
+            '',
+        ]))
+
+    def test_leading_noqa_still_concatenates(self):
+        self.assertSameTokens('noqa word word')
+        self.assertSameTokens('word # noqa word word\nword word')
+
+    def test_random_programs(self):
+        for _ in range(200):
+            self.assertSameTokens(''.join([
+                choice(self.pieces) for _ in range(randint(0, 30))
+            ]))
+
+    def test_other_indentation(self):
+        with ConfigurationContext(indentation=2):
+            for _ in range(50):
+                self.assertSameTokens(''.join([
+                    choice(self.pieces) for _ in range(randint(0, 30))
+                ]))
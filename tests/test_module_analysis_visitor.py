@@ -0,0 +1,157 @@
+import ast
+from unittest import (
+    mock,
+    TestCase,
+)
+
+from .utils import reindent
+
+from darglint.analysis.analysis_visitor import AnalysisVisitor
+from darglint.analysis.module_analysis_visitor import ModuleAnalysisVisitor
+from darglint.function_description import (
+    get_function_descriptions,
+)
+
+
+ATTRIBUTES = [
+    'arguments',
+    'types',
+    'exceptions',
+    'is_abstract',
+]
+
+
+class ModuleAnalysisVisitorTests(TestCase):
+
+    def assertSameAsAnalysisVisitor(self, program):
+        tree = ast.parse(reindent(program))
+        visitor = ModuleAnalysisVisitor()
+        visitor.visit(tree)
+        functions = [
+            node for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        self.assertEqual(set(visitor.analyses), set(functions))
+        for function in functions:
+            expected = AnalysisVisitor()
+            expected.visit(function)
+            actual = visitor.analyses[function]
+            for attribute in ATTRIBUTES:
+                self.assertEqual(
+                    getattr(actual, attribute),
+                    getattr(expected, attribute),
+                    '{} of {}'.format(attribute, function.name),
+                )
+            for attribute in ['returns', 'yields', 'variables', 'asserts']:
+                self.assertEqual(
+                    getattr(actual, attribute),
+                    getattr(expected, attribute),
+                    '{} of {}'.format(attribute, function.name),
+                )
+        return visitor
+
+    def test_nested_functions_analyzed_separately(self):
+        visitor = self.assertSameAsAnalysisVisitor('''
+            def outer(x):
+                y = 1
+
+                def inner(z=lambda: 3):
+                    w = 2
+                    yield w
+
+                assert x
+                return inner
+        ''')
+        analyses = {
+            function.name: analysis
+            for function, analysis in visitor.analyses.items()
+        }
+        self.assertEqual(
+            [x.id for x in analyses['outer'].variables],
+            ['y'],
+        )
+        self.assertEqual(analyses['inner'].arguments, ['z'])
+        self.assertFalse(analyses['outer'].yields)
+
+    def test_classes_in_functions(self):
+        self.assertSameAsAnalysisVisitor('''
+            def factory():
+                class Local(object):
+                    value = 1
+
+                    def method(self, x):
+                        return x
+
+                return Local
+        ''')
+
+    def test_raises_in_try_statements(self):
+        self.assertSameAsAnalysisVisitor('''
+            class Parser(object):
+
+                def parse(self):
+                    try:
+                        raise SyntaxError()
+                    except SyntaxError:
+                        raise ValueError()
+                    except (KeyError, IndexError) as e:
+                        raise
+                    finally:
+                        raise TypeError()
+
+            try:
+                import json
+
+                def load():
+                    raise OSError()
+            except ImportError:
+                raise
+        ''')
+
+    def test_abstract_methods(self):
+        self.assertSameAsAnalysisVisitor('''
+            class Base(ABC):
+
+                @abstractmethod
+                def first(self):
+                    pass
+
+                @abstractmethod
+                async def second(self):
+                    return 1
+        ''')
+
+    def test_failed_analysis_only_affects_function(self):
+        program = reindent('''
+            def outer():
+                assert True
+
+                def inner(x):
+                    return x
+
+                return inner
+        ''')
+        with mock.patch.object(
+            ModuleAnalysisVisitor,
+            'visit_Assert',
+            side_effect=ValueError('Unable to analyze.'),
+        ):
+            functions = {
+                function.name: function
+                for function in get_function_descriptions(
+                    ast.parse(program)
+                )
+            }
+            self.assertFalse(hasattr(functions['outer'], 'raises'))
+            self.assertEqual(functions['inner'].argument_names, ['x'])
+            self.assertTrue(functions['inner'].has_return)
+
+            visitor = ModuleAnalysisVisitor()
+            visitor.visit(ast.parse(program))
+        analyses = {
+            function.name: analysis
+            for function, analysis in visitor.analyses.items()
+        }
+        self.assertIsInstance(analyses['outer'].error, ValueError)
+        self.assertIsNone(analyses['inner'].error)
+        self.assertEqual(analyses['inner'].arguments, ['x'])
@@ -9,6 +9,7 @@ from unittest import (
 
 from darglint.node import (
     CykNode,
+    EMPTY_ANNOTATIONS,
 )
 
 
@@ -47,3 +48,41 @@ class CykNodeTest(TestCase):
             self.build_binary_search_tree(node, randint(-100, 100))
         values = [x.value for x in node.in_order_traverse()]
         self.assertIsSorted(values)
+
+    def test_in_order_traversal_of_deep_tree(self):
+        # Deeper than the recursion limit.
+        node = CykNode(symbol='', value=0)
+        for i in range(1, 5000):
+            node = CykNode(symbol='', value=i, lchild=node)
+        values = [x.value for x in node.in_order_traverse()]
+        self.assertEqual(values, list(range(5000)))
+
+    def test_nodes_have_no_dict(self):
+        node = CykNode(symbol='')
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
+    def test_empty_annotations_shared(self):
+        self.assertIs(CykNode(symbol='').annotations, EMPTY_ANNOTATIONS)
+        self.assertIs(
+            CykNode(symbol='', annotations=[]).annotations,
+            EMPTY_ANNOTATIONS,
+        )
+
+    def test_weight_from_children(self):
+        lchild = CykNode(symbol='', weight=2)
+        rchild = CykNode(symbol='', weight=3)
+        self.assertEqual(
+            CykNode(symbol='', lchild=lchild, rchild=rchild).weight,
+            3,
+        )
+        self.assertEqual(CykNode(symbol='', lchild=lchild).weight, 2)
+        self.assertEqual(
+            CykNode(symbol='', lchild=lchild, weight=1).weight,
+            1,
+        )
+        self.assertEqual(
+            CykNode(symbol='', lchild=CykNode(symbol='', weight=-1)).weight,
+            0,
+        )
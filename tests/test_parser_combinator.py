@@ -1,11 +1,24 @@
 from unittest import (
+    mock,
     TestCase,
 )
+from darglint.lex import (
+    tokenize,
+)
+from darglint.parse import (
+    google,
+)
 from darglint.parse.grammar import (
     BaseGrammar,
 )
+from darglint.config import (
+    CykBackend,
+)
 from darglint.parse.combinator import (
+    parse_if_recognized,
     parser_combinator,
+    success_statistics,
+    to_parsers,
 )
 from darglint.parse.cyk import (
     parse,
@@ -18,6 +31,9 @@ from darglint.token import (
     BaseTokenType,
     Token,
 )
+from darglint.utils import (
+    ConfigurationContext,
+)
 
 
 class PoetryTokenType(BaseTokenType):
@@ -60,6 +76,16 @@ class StanzaGrammar(BaseGrammar):
     start = 'stanza'
 
 
+# Only accepts a single word, so it rejects any stanza.
+class WordGrammar(BaseGrammar):
+
+    productions = [
+        P('word', (PoetryTokenType.WORD, 0)),
+    ]
+
+    start = 'word'
+
+
 def combine(*nodes, encountered=False):
     if len(nodes) == 1:
         if not encountered:
@@ -164,3 +190,214 @@ class ParserCombinatorTests(TestCase):
             self.assertTrue(
                 total.equals(combined),
             )
+
+    def test_grammars_in_lookup_converted_to_parsers(self):
+        for poem in poems:
+            tokens = lex(poem)
+            expected = parser_combinator(
+                top_parse,
+                lookup,
+                combine,
+                tokens,
+            )
+            actual = parser_combinator(
+                top_parse,
+                to_parsers(lambda *args: [WordGrammar, StanzaGrammar]),
+                combine,
+                tokens,
+            )
+            self.assertTrue(expected.equals(actual))
+
+    def test_rejected_grammars_are_not_parsed(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        with mock.patch('darglint.parse.combinator.cyk_parse') as cyk_parse:
+            cyk_parse.return_value = None
+            for parser in to_parsers(
+                lambda *args: [WordGrammar, lambda x: None, StanzaGrammar]
+            )(tokens):
+                parser(tokens)
+        self.assertEqual(cyk_parse.call_count, 1)
+        self.assertEqual(cyk_parse.call_args[0][0], StanzaGrammar)
+
+    def test_adjacent_grammars_parsed_once(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        parsers = list(to_parsers(
+            lambda *args: [WordGrammar, StanzaGrammar]
+        )(tokens))
+        self.assertEqual(len(parsers), 1)
+        with mock.patch(
+            'darglint.parse.combinator.cyk_parse',
+            wraps=parse,
+        ) as cyk_parse:
+            node = parsers[0](tokens)
+        self.assertEqual(cyk_parse.call_count, 1)
+        self.assertEqual(
+            cyk_parse.call_args[0][0].grammars,
+            (WordGrammar, StanzaGrammar),
+        )
+        self.assertTrue(node.equals(parse(StanzaGrammar, tokens)))
+
+    def test_numpy_backend_used_when_configured(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        with ConfigurationContext(cyk_backend=CykBackend.NUMPY):
+            with mock.patch(
+                'darglint.parse.combinator.cyk_numpy'
+            ) as cyk_numpy, mock.patch(
+                'darglint.parse.combinator.NUMPY_MIN_TOKENS',
+                len(tokens),
+            ):
+                cyk_numpy.available.return_value = True
+                parse_if_recognized(StanzaGrammar, tokens)
+        cyk_numpy.parse.assert_called_once_with(StanzaGrammar, tokens)
+
+    def test_numpy_backend_not_used_for_short_sections(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        with ConfigurationContext(cyk_backend=CykBackend.NUMPY):
+            with mock.patch(
+                'darglint.parse.combinator.cyk_numpy'
+            ) as cyk_numpy, mock.patch(
+                'darglint.parse.combinator.NUMPY_MIN_TOKENS',
+                len(tokens) + 1,
+            ):
+                cyk_numpy.available.return_value = True
+                self.assertTrue(parse_if_recognized(StanzaGrammar, tokens))
+        cyk_numpy.parse.assert_not_called()
+
+    def test_falls_back_to_python_backend_without_numpy(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        with ConfigurationContext(cyk_backend=CykBackend.NUMPY):
+            with mock.patch(
+                'darglint.parse.combinator.cyk_numpy'
+            ) as cyk_numpy:
+                cyk_numpy.available.return_value = False
+                self.assertTrue(parse_if_recognized(StanzaGrammar, tokens))
+        cyk_numpy.parse.assert_not_called()
+
+
+class AdaptiveParsingTests(TestCase):
+
+    def setUp(self):
+        success_statistics.clear()
+        self.calls = list()
+
+    def tearDown(self):
+        success_statistics.clear()
+
+    def counting(self, name, grammar):
+        def parser(tokens):
+            self.calls.append(name)
+            return parse(grammar, tokens)
+        return parser
+
+    def adaptive_lookup(self, *args):
+        return [
+            self.counting('word', WordGrammar),
+            self.counting('stanza', StanzaGrammar),
+        ]
+
+    def test_failed_parsers_skipped_for_same_shape(self):
+        first = lex('Roly poly\nSomething holey\n\n')
+        second = lex('Fuzzy wuzzy\nBare bear\n\n')
+        with ConfigurationContext(adaptive_parsing=True):
+            parser_combinator(top_parse, self.adaptive_lookup, combine, first)
+            self.assertEqual(self.calls, ['word', 'stanza'])
+            self.calls = list()
+            node = parser_combinator(
+                top_parse, self.adaptive_lookup, combine, second,
+            )
+        self.assertEqual(self.calls, ['stanza'])
+        self.assertEqual(success_statistics.predicted, 1)
+        self.assertEqual(success_statistics.skipped, 1)
+        self.assertTrue(node.equals(parser_combinator(
+            top_parse, lookup, combine, second,
+        )))
+
+    def test_different_shape_not_skipped(self):
+        with ConfigurationContext(adaptive_parsing=True):
+            parser_combinator(
+                top_parse,
+                self.adaptive_lookup,
+                combine,
+                lex('Roly poly\nSomething holey\n\n'),
+            )
+            self.calls = list()
+            parser_combinator(
+                top_parse,
+                self.adaptive_lookup,
+                combine,
+                lex('Roly poly\n\n'),
+            )
+        self.assertEqual(self.calls, ['word', 'stanza'])
+
+    def test_falls_back_when_prediction_fails(self):
+        # Both sections have the same shape, but the first parser
+        # only accepts sections starting with "Roly".
+        def roly(tokens):
+            self.calls.append('roly')
+            if tokens[0].value == 'Roly':
+                return parse(StanzaGrammar, tokens)
+            return None
+
+        def adaptive_lookup(*args):
+            return [roly, self.counting('stanza', StanzaGrammar)]
+
+        first = lex('Roly poly\nSomething holey\n\n')
+        second = lex('Fuzzy wuzzy\nBare bear\n\n')
+        expected = parser_combinator(top_parse, lookup, combine, second)
+        with ConfigurationContext(adaptive_parsing=True):
+            parser_combinator(top_parse, adaptive_lookup, combine, first)
+            self.calls = list()
+            node = parser_combinator(
+                top_parse, adaptive_lookup, combine, second,
+            )
+            self.assertEqual(self.calls, ['roly', 'roly', 'stanza'])
+            self.assertEqual(success_statistics.predicted, 0)
+            self.assertTrue(node.equals(expected))
+
+            # The parser which succeeded is remembered.
+            self.calls = list()
+            parser_combinator(top_parse, adaptive_lookup, combine, second)
+            self.assertEqual(self.calls, ['stanza'])
+            self.assertEqual(success_statistics.predicted, 1)
+
+    def test_failures_not_remembered(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        succeed = [False]
+
+        def sometimes(tokens):
+            self.calls.append('sometimes')
+            if succeed[0]:
+                return parse(StanzaGrammar, tokens)
+            return None
+
+        with ConfigurationContext(adaptive_parsing=True):
+            self.assertIsNone(parser_combinator(
+                top_parse, lambda *args: [sometimes], combine, tokens,
+            ))
+            succeed[0] = True
+            self.assertIsNotNone(parser_combinator(
+                top_parse, lambda *args: [sometimes], combine, tokens,
+            ))
+        self.assertEqual(self.calls, ['sometimes', 'sometimes'])
+
+    def test_not_used_unless_configured(self):
+        tokens = lex('Roly poly\nSomething holey\n\n')
+        parser_combinator(top_parse, self.adaptive_lookup, combine, tokens)
+        parser_combinator(top_parse, self.adaptive_lookup, combine, tokens)
+        self.assertEqual(self.calls, ['word', 'stanza'] * 2)
+        self.assertEqual(success_statistics.predicted, 0)
+
+    def test_same_result_on_docstrings(self):
+        docstrings = [
+            'Short.\n\nArgs:\n    x: The x.\n\nReturns:\n    The y.\n',
+            'Other.\n\nArgs:\n    z: The z.\n\nReturns:\n    The w.\n',
+            'Short.\n\nReturns:\n    int: The y.\n',
+            'Short.\n\nReturns:\n    str: The z.\n',
+        ]
+        tokens = [tokenize(x) for x in docstrings]
+        expected = [google.parse(x) for x in tokens]
+        with ConfigurationContext(adaptive_parsing=True):
+            actual = [google.parse(x) for x in tokens]
+        for a, b in zip(actual, expected):
+            self.assertTrue(a.equals(b))
+        self.assertGreater(success_statistics.predicted, 0)
@@ -1,7 +1,11 @@
 from itertools import cycle
+from random import randint
 from unittest import TestCase
 
-from darglint.peaker import Peaker
+from darglint.peaker import (
+    Peaker,
+    SequencePeaker,
+)
 
 
 class PeakerTestCase(TestCase):
@@ -63,3 +67,63 @@ class PeakerTestCase(TestCase):
         peaker = Peaker((x for x in 'abcd'), lookahead=1)
         with self.assertRaises(Exception):
             peaker.peak(lookahead=3)
+
+
+class SequencePeakerTestCase(TestCase):
+
+    def test_sequence_gets_sequence_peaker(self):
+        self.assertIsInstance(Peaker('abc'), SequencePeaker)
+        self.assertIsInstance(Peaker(['a', 'b']), SequencePeaker)
+        self.assertNotIsInstance(Peaker(iter('abc')), SequencePeaker)
+
+    def test_take_while_returns_list(self):
+        peaker = Peaker('name    1234')
+        self.assertEqual(peaker.take_while(str.isalpha), list('name'))
+        self.assertEqual(peaker.prev, 'e')
+        self.assertEqual(peaker.take_while(str.isalpha), [])
+        self.assertEqual(peaker.peak(), ' ')
+
+    def test_cannot_peak_beyond_specified_lookahead(self):
+        peaker = Peaker('abcd', lookahead=2)
+        self.assertEqual(peaker.peak(lookahead=2), 'b')
+        with self.assertRaises(Exception):
+            peaker.peak(lookahead=3)
+        with self.assertRaises(Exception):
+            peaker.rpeak(lookahead=3)
+
+    def test_same_as_buffered_peaker(self):
+        """Make sure random operations give the same results."""
+        for _ in range(100):
+            sequence = [randint(0, 3) for _ in range(randint(0, 20))]
+            buffered = Peaker(iter(sequence), lookahead=3)
+            indexed = Peaker(sequence, lookahead=3)
+            for _ in range(30):
+                operation = randint(0, 4)
+                if operation == 0:
+                    lookahead = randint(1, 3)
+                    self.assertEqual(
+                        buffered.peak(lookahead),
+                        indexed.peak(lookahead),
+                    )
+                elif operation == 1:
+                    self.assertEqual(buffered.has_next(), indexed.has_next())
+                elif operation == 2:
+                    self.assertEqual(
+                        buffered.take_while(lambda x: x < 2),
+                        indexed.take_while(lambda x: x < 2),
+                    )
+                elif operation == 3 and buffered.has_next():
+                    self.assertEqual(buffered.next(), indexed.next())
+                elif operation == 4:
+                    lookahead = randint(1, 3)
+                    try:
+                        expected = buffered.rpeak(lookahead)
+                    except IndexError:
+                        with self.assertRaises(IndexError):
+                            indexed.rpeak(lookahead)
+                    else:
+                        self.assertEqual(expected, indexed.rpeak(lookahead))
+                self.assertEqual(buffered.prev, indexed.prev)
+            if not indexed.has_next():
+                with self.assertRaises(StopIteration):
+                    indexed.next()
@@ -0,0 +1,53 @@
+"""Make sure each style's sectionizer does constant work per token."""
+
+from unittest import TestCase
+
+from darglint.lex import (
+    tokenize,
+)
+from darglint.parse import (
+    google,
+    numpy,
+    sphinx,
+)
+
+
+class _CountingCodes(list):
+    """A list of type codes which counts how often it's read."""
+
+    reads = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return super(_CountingCodes, self).__getitem__(index)
+
+
+def _reads_per_token(module, docstring):
+    codes = _CountingCodes(tokenize(docstring).type_codes())
+    module._section_spans(codes)
+    return codes.reads / len(codes)
+
+
+class SectionSpansTest(TestCase):
+
+    # Docstrings with long runs of whitespace, which used to be
+    # rescanned from every token in the run.
+    adversarial = [
+        lambda n: 'Short.\n' + '    \n' * n + 'Long.',
+        lambda n: 'Short.\n\n' + '        ' * n + 'Long.',
+        lambda n: 'Short.\n' + '\n' * n + ':param x: y',
+        lambda n: 'Short.\n' + '\n    ' * n + 'Args:\n    x: y',
+        lambda n: (
+            'Short\n-----\n' + '\n' * n + 'Parameters\n----------\nx'
+        ),
+    ]
+
+    def test_constant_work_per_token(self):
+        for module in [google, sphinx, numpy]:
+            for make_docstring in self.adversarial:
+                for size in [10, 100, 1000]:
+                    self.assertLess(
+                        _reads_per_token(module, make_docstring(size)),
+                        6,
+                        module.__name__,
+                    )
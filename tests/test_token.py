@@ -0,0 +1,149 @@
+from unittest import TestCase
+
+from darglint.lex import (
+    condense,
+    lex,
+    tokenize,
+)
+from darglint.parse import (
+    google,
+    numpy,
+    sphinx,
+)
+from darglint.token import (
+    Token,
+    TokenBuffer,
+    TokenType,
+    token_types,
+    type_codes,
+)
+
+
+class TokenBufferTestCase(TestCase):
+
+    def test_tokens_created_on_demand(self):
+        buffer = TokenBuffer()
+        buffer.append('Args', TokenType.ARGUMENTS, 0)
+        buffer.append(':', TokenType.COLON, 0)
+        self.assertEqual(len(buffer), 2)
+        token = buffer[1]
+        self.assertEqual(token.value, ':')
+        self.assertEqual(token.token_type, TokenType.COLON)
+        self.assertIs(buffer[1], token)
+        self.assertIs(buffer[-1], token)
+
+    def test_type_codes(self):
+        buffer = tokenize('Args:\n    x: y')
+        self.assertEqual(
+            list(type_codes(buffer)),
+            [x.token_type.value for x in buffer],
+        )
+        self.assertEqual(
+            token_types(buffer),
+            [x.token_type for x in buffer],
+        )
+
+    def test_slices_share_tokens(self):
+        buffer = tokenize('a: b\n\nc')
+        sliced = buffer[2:]
+        self.assertIsInstance(sliced, TokenBuffer)
+        self.assertEqual(len(sliced), len(buffer) - 2)
+        self.assertIs(sliced[0], buffer[2])
+        self.assertEqual(list(sliced[1:]), list(buffer[3:]))
+        self.assertEqual(len(buffer[10:20]), 0)
+
+    def test_cannot_append_to_slice(self):
+        buffer = tokenize('a: b')
+        with self.assertRaises(ValueError):
+            buffer[:1].append('c', TokenType.WORD, 0)
+
+    def test_index_out_of_range(self):
+        buffer = tokenize('a')
+        with self.assertRaises(IndexError):
+            buffer[1]
+
+    def test_from_tokens_keeps_tokens(self):
+        tokens = [
+            Token('a', TokenType.WORD, 0),
+            Token('\n', TokenType.NEWLINE, 0),
+        ]
+        buffer = TokenBuffer.from_tokens(tokens)
+        self.assertEqual(list(buffer), tokens)
+        self.assertIs(TokenBuffer.from_tokens(buffer), buffer)
+
+    def test_sections_same_as_for_lists(self):
+        docstrings = {
+            google: '\n'.join([
+                'Short.',
+                '',
+                'Args:',
+                '    x: The x.',
+                '',
+                'Returns:',
+                '    The y.',
+            ]),
+            sphinx: '\n'.join([
+                'Short.',
+                '',
+                ':param x: The x.',
+                ':returns: The y.',
+            ]),
+            numpy: '\n'.join([
+                'Short.',
+                '',
+                'Parameters',
+                '----------',
+                'x : int',
+                '    The x.',
+                '',
+                'Returns',
+                '-------',
+                'int',
+            ]),
+        }
+        for module, docstring in docstrings.items():
+            expected = module.top_parse(condense(lex(docstring)))
+            actual = module.top_parse(tokenize(docstring))
+            self.assertEqual(len(actual), len(expected))
+            for a, b in zip(actual, expected):
+                self.assertEqual(
+                    [(x.value, x.token_type) for x in a],
+                    [(x.value, x.token_type) for x in b],
+                )
+
+
+class LazyValueTestCase(TestCase):
+
+    def test_values_read_from_source(self):
+        buffer = tokenize('Args:\n    x (int):  The\tvalue.')
+        self.assertEqual(
+            [x.value for x in buffer],
+            [x.value for x in condense(lex(
+                'Args:\n    x (int):  The\tvalue.'
+            ))],
+        )
+
+    def test_values_only_read_when_used(self):
+        buffer = tokenize('Short.\n\nLong description.')
+        google.parse(buffer)
+        self.assertTrue(all(
+            x._value is None for x in buffer._storage.views if x
+        ))
+
+    def test_value_can_be_assigned(self):
+        token = tokenize('word')[0]
+        token.value = 'other'
+        self.assertEqual(token.value, 'other')
+
+    def test_signature_ignores_position(self):
+        first = tokenize('Returns:\n    x.')
+        second = tokenize('Short.\n\nReturns:\n    x.')[3:]
+        self.assertEqual(first.signature(), second.signature())
+        self.assertNotEqual(
+            first.signature(),
+            tokenize('Returns:\n    y.').signature(),
+        )
+
+    def test_no_signature_for_explicit_values(self):
+        buffer = TokenBuffer.from_tokens([Token('a', TokenType.WORD, 0)])
+        self.assertIsNone(buffer.signature())